@@ -0,0 +1,76 @@
+"""Measure the memory used by tasks, nodes, and the DAG of a large project.
+
+Every task has one dependency shared by all tasks, one own dependency, and one
+product. Run it with
+
+```console
+python scripts/benchmark_memory.py --n-tasks 100000
+```
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+
+from _pytask.dag_graph import DAG
+from pytask import PathNode
+from pytask import PythonNode
+from pytask import Task
+
+
+def _task_function(shared: Path, data: Path, seed: int) -> None: ...
+
+
+def _build_project(n_tasks: int, root: Path) -> tuple[list[Task], DAG]:
+    shared = root / "shared.csv"
+    tasks = []
+    dag = DAG()
+    for i in range(n_tasks):
+        task = Task(
+            base_name=f"task_example[{i}]",
+            path=root / "task_example.py",
+            function=_task_function,
+            depends_on={
+                "shared": PathNode.from_path(shared),
+                "data": PathNode.from_path(root / f"data_{i}.csv"),
+                "seed": PythonNode(name=f"seed_{i}", value=i),
+            },
+            produces={"return": PathNode.from_path(root / f"out_{i}.csv")},
+        )
+        tasks.append(task)
+
+        dag.add_node(task.signature, task)
+        for node in (*task.depends_on.values(), *task.produces.values()):
+            dag.add_node(node.signature, node)
+        for node in task.depends_on.values():
+            dag.add_edge(node.signature, task.signature)
+        for node in task.produces.values():
+            dag.add_edge(task.signature, node.signature)
+    return tasks, dag
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-tasks", type=int, default=100_000)
+    args = parser.parse_args()
+
+    gc.collect()
+    tracemalloc.start()
+    tasks, dag = _build_project(args.n_tasks, Path.cwd().resolve())
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_nodes = len(dag.nodes)
+    print(f"Tasks: {len(tasks):,}, nodes in the DAG: {n_nodes:,}")  # noqa: T201
+    print(f"Current memory: {current / 2**20:,.1f} MiB")  # noqa: T201
+    print(f"Peak memory: {peak / 2**20:,.1f} MiB")  # noqa: T201
+    print(f"Bytes per node in the DAG: {current / n_nodes:,.0f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
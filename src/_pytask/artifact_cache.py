@@ -0,0 +1,553 @@
+"""Restore products of tasks from a content-addressed artifact cache.
+
+When ``cache_dir`` is configured, products of successful tasks are stored in the cache
+directory keyed by the states of the task and its dependencies. Before a task is
+executed, pytask looks up the key and restores the products from the cache instead of
+executing the task. The products are identified by portable ids, so that a cache
+directory on a shared file system can be used by a team or by continuous integration.
+
+The cache directory contains two folders.
+
+- ``objects`` stores the contents of products under their sha256 hashes.
+- ``entries`` stores one file per key which maps the portable ids of the products to
+  their hashes.
+
+The modification times of files in the cache are updated when they are used. If the
+cache exceeds ``cache_max_size``, the least recently used files are removed at the end
+of the build.
+
+Objects are read-only. Depending on ``cache_restore``, products are restored as reflinks
+which share the data with the object until one of them is modified, as hardlinks to the
+object, or as copies. A hardlinked product is removed before its task is executed again
+so that the task cannot modify the object in the cache.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import stat
+import sys
+import uuid
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+import msgspec
+
+from _pytask.lockfile import build_portable_node_id
+from _pytask.lockfile import build_portable_task_id
+from _pytask.node_protocols import PPathNode
+from _pytask.node_protocols import PProvisionalNode
+from _pytask.nodes import LazyValue
+from _pytask.nodes import PickleNode
+from _pytask.nodes import PythonNode
+from _pytask.nodes import get_state_of_arguments
+from _pytask.nodes import get_state_of_path
+from _pytask.outcomes import TaskOutcome
+from _pytask.path import hash_path
+from _pytask.path import is_non_local_path
+from _pytask.pluginmanager import hookimpl
+from _pytask.remote_cache import RemoteCache
+from _pytask.tree_util import tree_leaves
+from _pytask.typing import is_task_generator
+from _pytask.typing import no_default
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytask.node_protocols import PNode
+    from _pytask.node_protocols import PTask
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+
+
+__all__ = ["ArtifactCache", "compute_task_key", "parse_size"]
+
+
+CURRENT_CACHE_VERSION = "1"
+
+
+_RESTORE_STRATEGIES = ("auto", "reflink", "copy")
+
+
+_FICLONE = 0x40049409
+"""The Linux ioctl to create a reflink of a file."""
+
+
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+_SIZE_UNITS = {None: 1, "B": 1, "KB": 10**3, "MB": 10**6, "GB": 10**9, "TB": 10**12}
+
+
+class _CacheEntry(msgspec.Struct):
+    products: dict[str, str]
+
+
+def parse_size(value: int | str | None) -> int | None:
+    """Parse a size in bytes from an integer or a string like ``"10GB"``.
+
+    Examples
+    --------
+    >>> parse_size("1.5 GB")
+    1500000000
+    >>> parse_size(1024)
+    1024
+
+    """
+    if value is None or isinstance(value, int):
+        return value
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?B)?\s*", value.upper())
+    if match is None:
+        msg = f"Invalid size {value!r}. Use a number of bytes or a value like '10GB'."
+        raise ValueError(msg)
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit])
+
+
+@dataclass
+class ArtifactCache:
+    """A content-addressed cache for products of tasks.
+
+    Attributes
+    ----------
+    path
+        The cache directory.
+    root
+        The root of the project which is used to build portable ids.
+    max_size
+        The maximum size of the cache in bytes. ``None`` means the cache is unbounded.
+    restore_strategy
+        How products are restored. ``"auto"`` tries a reflink, then a hardlink, and
+        falls back to a copy. ``"reflink"`` never uses hardlinks and ``"copy"`` always
+        copies.
+    remote
+        An optional remote cache which is used if the local cache misses a key and
+        which receives the products of executed tasks.
+
+    """
+
+    path: Path
+    root: Path
+    max_size: int | None = None
+    restore_strategy: str = "auto"
+    remote: RemoteCache | None = None
+
+    def __post_init__(self) -> None:
+        self.path.joinpath("objects").mkdir(parents=True, exist_ok=True)
+        self.path.joinpath("entries").mkdir(parents=True, exist_ok=True)
+
+    def compute_key(self, session: Session, task: PTask) -> str | None:
+        """Compute the key of a task.
+
+        Returns ``None`` if the products of the task cannot be cached.
+
+        """
+        if not _is_cacheable(task):
+            return None
+        return compute_task_key(session, task, self.root)
+
+    def restore(self, task: PTask, key: str) -> bool:
+        """Restore the products of a task from the cache.
+
+        If the local cache does not contain the key or all of its objects, they are
+        downloaded from the remote cache. Returns ``False`` if neither cache contains
+        all products.
+
+        """
+        entry = self._read_entry(key)
+        if (entry is None or not self._has_objects(entry)) and self.remote is not None:
+            entry = self._read_entry(key) if self.remote.fetch(self, key) else None
+        if entry is None or not self._has_objects(entry):
+            return False
+
+        products = self._product_ids(task)
+        if set(products) != set(entry.products):
+            return False
+        objects = {
+            node_id: self.object_path(digest)
+            for node_id, digest in entry.products.items()
+        }
+
+        for node_id, node in products.items():
+            # Mark the object as recently used before restoring it, so that a hardlinked
+            # product shares the new modification time with the object.
+            _touch(objects[node_id])
+            _restore_file(objects[node_id], node.path, self.restore_strategy)
+            # Prime the cache of hashes such that the state of the restored product is
+            # known without reading the file.
+            digest = entry.products[node_id]
+            hash_path.prime(digest, node.path, node.path.stat().st_mtime)
+        _touch(self.entry_path(key))
+        return True
+
+    def store(self, task: PTask, key: str) -> None:
+        """Store the products of a task in the cache."""
+        entry_path = self.entry_path(key)
+        if entry_path.exists():
+            return
+
+        products = {}
+        for node_id, node in self._product_ids(task).items():
+            digest = get_state_of_path(node.path)
+            if digest is None:
+                return
+            object_path = self.object_path(digest)
+            if object_path.exists():
+                _touch(object_path)
+            else:
+                object_path.parent.mkdir(exist_ok=True)
+                _atomic_copy(
+                    node.path,
+                    object_path,
+                    reflink=self.restore_strategy != "copy",
+                    read_only=True,
+                )
+            products[node_id] = digest
+
+        self.add_entry(key, msgspec.json.encode(_CacheEntry(products=products)))
+        if self.remote is not None:
+            self.remote.push(self, key)
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the cache fits into its size."""
+        if self.max_size is None:
+            return
+        files = []
+        for directory in ("objects", "entries"):
+            for path in self.path.joinpath(directory).rglob("*"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if path.is_file():
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(file_size for _, file_size, _ in files)
+        for _, file_size, path in sorted(files, key=lambda x: x[0]):
+            if size <= self.max_size:
+                break
+            _unlink(path)
+            size -= file_size
+
+    def _product_ids(self, task: PTask) -> dict[str, PPathNode]:
+        return {
+            build_portable_node_id(node, self.root): node
+            for node in tree_leaves(task.produces)  # type: ignore[arg-type]
+        }
+
+    def close(self) -> None:
+        """Wait for uploads to the remote cache and evict least recently used files."""
+        if self.remote is not None:
+            self.remote.close()
+        self.evict()
+
+    def _read_entry(self, key: str) -> _CacheEntry | None:
+        entry_path = self.entry_path(key)
+        try:
+            return msgspec.json.decode(entry_path.read_bytes(), type=_CacheEntry)
+        except FileNotFoundError:
+            return None
+        except msgspec.DecodeError:
+            entry_path.unlink(missing_ok=True)
+            return None
+
+    def _has_objects(self, entry: _CacheEntry) -> bool:
+        return all(self.object_path(d).exists() for d in entry.products.values())
+
+    def add_entry(self, key: str, data: bytes) -> None:
+        """Add an encoded entry to the cache."""
+        _atomic_write(self.entry_path(key), data)
+
+    def add_object(self, digest: str, source: Path) -> None:
+        """Move a file with the content of an object into the cache.
+
+        The file must be created at a path from ``temporary_object_path`` such that it
+        can be moved atomically.
+
+        """
+        source.chmod(_READ_ONLY)
+        source.replace(self.object_path(digest))
+
+    def temporary_object_path(self, digest: str) -> Path:
+        """Get a path for a file which is added as an object to the cache later."""
+        path = self.object_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return _get_tmp_path(path)
+
+    def entry_path(self, key: str) -> Path:
+        """Get the path of the entry of a key."""
+        return self.path.joinpath("entries", f"{key}.json")
+
+    def object_path(self, digest: str) -> Path:
+        """Get the path of the object with a digest."""
+        return self.path.joinpath("objects", digest[:2], digest)
+
+
+def compute_task_key(session: Session, task: PTask, root: Path) -> str | None:
+    """Compute a key which identifies the inputs and outputs of a task.
+
+    The key covers the state of the task, the states of its dependencies, the ids of its
+    products, and the names of its markers. Returns ``None`` if a state is unknown.
+
+    The state of a [`PythonNode`][pytask.PythonNode] with ``hash=False`` is constant.
+    For these dependencies, the value is hashed instead. Memoized values which are not
+    loaded yet use the digest which was stored with them. If the value cannot be hashed,
+    no key is returned and the task is neither cached nor memoized.
+
+    """
+    hash_ = hashlib.sha256(f"{CURRENT_CACHE_VERSION}\0".encode())
+    state = task.state()
+    if state is None:
+        return None
+    task_id = build_portable_task_id(task, root)
+    hash_.update(f"t{task_id}\0{state}\0".encode())
+
+    dependencies = []
+    for signature in session.dag.predecessors(task.signature):
+        node = session.dag.nodes[signature]
+        if isinstance(node, PProvisionalNode):
+            return None
+        state = _get_state_of_dependency(node)
+        if state is None:
+            return None
+        dependencies.append((build_portable_node_id(node, root), state))
+    for node_id, state in sorted(dependencies):
+        hash_.update(f"d{node_id}\0{state}\0".encode())
+
+    product_ids = (
+        build_portable_node_id(node, root)
+        for node in tree_leaves(task.produces)  # type: ignore[arg-type]
+    )
+    for node_id in sorted(product_ids):
+        hash_.update(f"p{node_id}\0".encode())
+    for name in sorted({mark.name for mark in task.markers}):
+        hash_.update(f"m{name}\0".encode())
+    return hash_.hexdigest()
+
+
+def _get_state_of_dependency(node: PNode) -> str | None:
+    """Get the state of a dependency which changes with its value."""
+    if not isinstance(node, PythonNode) or node.hash:
+        return node.state()
+    value = node.value.value if isinstance(node.value, PythonNode) else node.value
+    if value is no_default:
+        return None
+    if isinstance(value, LazyValue):
+        return value.digest
+    return get_state_of_arguments(value)
+
+
+def _is_cacheable(task: PTask) -> bool:
+    """Check whether all products of a task are local files.
+
+    Pickle nodes with out-of-band buffers are stored in two files and not cached.
+
+    """
+    if is_task_generator(task):
+        return False
+    products = tree_leaves(task.produces)  # type: ignore[arg-type]
+    return bool(products) and all(
+        isinstance(node, PPathNode)
+        and not is_non_local_path(node.path)
+        and not node.path.is_dir()
+        and not (isinstance(node, PickleNode) and node.out_of_band)
+        for node in products
+    )
+
+
+def _restore_file(source: Path, destination: Path, strategy: str) -> str:
+    """Restore a file from the cache and return the method which was used."""
+    if strategy != "copy" and _atomic_reflink(source, destination):
+        return "reflink"
+    if strategy == "auto":
+        with suppress(OSError):
+            _atomic_link(source, destination)
+            return "hardlink"
+    _atomic_copy(source, destination)
+    return "copy"
+
+
+def _atomic_reflink(source: Path, destination: Path) -> bool:
+    """Create a reflink of a file which atomically replaces the destination."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _get_tmp_path(destination)
+    try:
+        if not _reflink(source, tmp):
+            return False
+        tmp.replace(destination)
+    finally:
+        _unlink(tmp)
+    return True
+
+
+def _atomic_link(source: Path, destination: Path) -> None:
+    """Create a hardlink to a file which atomically replaces the destination."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _get_tmp_path(destination)
+    try:
+        os.link(source, tmp)
+        tmp.replace(destination)
+    finally:
+        _unlink(tmp)
+
+
+def _atomic_copy(
+    source: Path, destination: Path, *, reflink: bool = False, read_only: bool = False
+) -> None:
+    """Copy a file such that readers never see a partially written file."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _get_tmp_path(destination)
+    try:
+        if not (reflink and _reflink(source, tmp)):
+            shutil.copyfile(source, tmp)
+        if read_only:
+            tmp.chmod(_READ_ONLY)
+        tmp.replace(destination)
+    finally:
+        _unlink(tmp)
+
+
+def _reflink(source: Path, destination: Path) -> bool:
+    """Try to create a reflink of a file which shares the data until it is modified."""
+    if sys.platform != "linux":
+        return False
+
+    import fcntl  # noqa: PLC0415
+
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _get_tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _unlink(path: Path) -> None:
+    """Remove a file even if it is read-only."""
+    try:
+        path.unlink(missing_ok=True)
+    except PermissionError:
+        path.chmod(stat.S_IWUSR | stat.S_IRUSR)
+        path.unlink(missing_ok=True)
+
+
+def _unlink_hardlinked_products(task: PTask) -> None:
+    """Remove products which are hardlinks to objects in the cache.
+
+    Objects are read-only, and a task which modifies the product in place would modify
+    the object in the cache as well. Removing the product first makes the task create a
+    new file.
+
+    """
+    for node in tree_leaves(task.produces):  # type: ignore[arg-type]
+        if not isinstance(node, PPathNode) or is_non_local_path(node.path):
+            continue
+        try:
+            stat_result = node.path.lstat()
+        except OSError:
+            continue
+        if (
+            stat.S_ISREG(stat_result.st_mode)
+            and stat_result.st_nlink > 1
+            and not stat_result.st_mode & stat.S_IWUSR
+        ):
+            _unlink(node.path)
+
+
+def _atomic_write(path: Path, data: bytes, *, read_only: bool = False) -> None:
+    tmp = _get_tmp_path(path)
+    try:
+        tmp.write_bytes(data)
+        if read_only:
+            tmp.chmod(_READ_ONLY)
+        tmp.replace(path)
+    finally:
+        _unlink(tmp)
+
+
+def _touch(path: Path) -> None:
+    """Mark a file as recently used."""
+    with suppress(OSError):
+        os.utime(path)
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the configuration of the artifact cache."""
+    config["cache_url"] = config.get("cache_url") or None
+    value = config.get("cache_dir")
+    if not value and config["cache_url"]:
+        value = ".pytask/artifacts"
+    config["cache_dir"] = config["root"].joinpath(value) if value else None
+    config["cache_max_size"] = parse_size(config.get("cache_max_size"))
+
+    value = config.get("cache_restore", "auto")
+    if value not in _RESTORE_STRATEGIES:
+        msg = (
+            f"'cache_restore' must be one of {list(_RESTORE_STRATEGIES)}, but it is "
+            f"{value!r}."
+        )
+        raise ValueError(msg)
+    config["cache_restore"] = value
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Initialize the artifact cache."""
+    if config.get("command") not in (None, "build") or config["cache_dir"] is None:
+        return
+    config["artifact_cache"] = ArtifactCache(
+        path=config["cache_dir"],
+        root=config["root"],
+        max_size=config["cache_max_size"],
+        restore_strategy=config["cache_restore"],
+        remote=RemoteCache(config["cache_url"]) if config["cache_url"] else None,
+    )
+
+
+@hookimpl(tryfirst=True)
+def pytask_execute_task(session: Session, task: PTask) -> bool | None:
+    """Restore the products of a task from the cache instead of executing it."""
+    if session.config["dry_run"] or session.config["explain"]:
+        return None
+    cache: ArtifactCache | None = session.config.get("artifact_cache")
+    if cache is not None:
+        key = cache.compute_key(session, task)
+        if key is not None:
+            task.attributes["artifact_cache_key"] = key
+            if cache.restore(task, key):
+                return True
+    _unlink_hardlinked_products(task)
+    return None
+
+
+@hookimpl
+def pytask_execute_task_process_report(
+    session: Session, report: ExecutionReport
+) -> None:
+    """Store the products of successful tasks in the cache."""
+    cache: ArtifactCache | None = session.config.get("artifact_cache")
+    if cache is None or report.outcome != TaskOutcome.SUCCESS:
+        return
+    key = report.task.attributes.pop("artifact_cache_key", None)
+    if key is not None:
+        cache.store(report.task, key)
+
+
+@hookimpl
+def pytask_unconfigure(session: Session) -> None:
+    """Finish uploads and remove the least recently used files from the cache."""
+    cache: ArtifactCache | None = session.config.get("artifact_cache")
+    if cache is not None:
+        cache.close()
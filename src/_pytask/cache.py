@@ -31,6 +31,9 @@ class HasCache(Protocol):
 
     cache: Cache
 
+    def prime(self, value: Any, *args: Any, **kwargs: Any) -> None:
+        """Store the value for the arguments without calling the function."""
+
 
 if TYPE_CHECKING:
     Memoized = Intersection[Callable[P, R], HasCache]
@@ -70,8 +73,15 @@ class Cache:
 
             return value
 
+        def prime(value: R, *args: P.args, **kwargs: P.kwargs) -> None:
+            key = _make_memoize_key(
+                args, kwargs, typed=False, argspec=argspec, prefix=prefix
+            )
+            self._cache[key] = value
+
         wrapped_with_cache = cast("Memoized[P, R]", wrapped)
         wrapped_with_cache.cache = self
+        wrapped_with_cache.prime = prime
 
         return wrapped_with_cache
 
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import inspect
 import itertools
-import os
 import sys
 import time
-from contextlib import suppress
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -38,19 +37,20 @@ from _pytask.nodes import PathNode
 from _pytask.nodes import PythonNode
 from _pytask.nodes import Task
 from _pytask.nodes import TaskWithoutPath
+from _pytask.nodes import get_state_of_arguments
 from _pytask.outcomes import CollectionOutcome
 from _pytask.outcomes import count_outcomes
-from _pytask.path import find_case_sensitive_path
+from _pytask.path import DirectoryListingCache
 from _pytask.path import import_path
 from _pytask.path import is_non_local_path
 from _pytask.path import normalize_local_upath
 from _pytask.path import shorten_path
 from _pytask.pluginmanager import hookimpl
 from _pytask.reports import CollectionReport
-from _pytask.shared import find_duplicates
 from _pytask.shared import to_list
 from _pytask.shared import unwrap_task_function
 from _pytask.task_utils import COLLECTED_TASKS
+from _pytask.task_utils import EXPANDED_FUNCTIONS
 from _pytask.task_utils import parse_collected_tasks_with_task_marker
 from _pytask.task_utils import task as task_decorator
 from _pytask.typing import TaskFunction
@@ -60,6 +60,7 @@ if TYPE_CHECKING:
     from collections.abc import Generator
     from collections.abc import Iterable
 
+    from _pytask.mark import Mark
     from _pytask.models import NodeInfo
     from _pytask.session import Session
 
@@ -68,10 +69,14 @@ if TYPE_CHECKING:
 def pytask_collect(session: Session) -> bool:
     """Collect tasks."""
     session.collection_start = time.time()
+    _SHORT_TASK_NAMES.clear()
 
-    _collect_from_paths(session)
-    _collect_from_tasks(session)
-    _collect_not_collected_tasks(session)
+    # Scan each directory once to check the paths of all nodes instead of querying the
+    # file system for every node.
+    with _DIRECTORY_LISTINGS.activate():
+        _collect_from_paths(session)
+        _collect_from_tasks(session)
+        _collect_not_collected_tasks(session)
 
     session.tasks.extend(
         i.node
@@ -127,6 +132,7 @@ def _collect_from_tasks(session: Session) -> None:
     """Collect tasks from user provided tasks via the functional interface."""
     # First pass: collect and group tasks by path
     tasks_by_path: dict[Path | None, list[Any]] = {}
+    ids_to_remove: dict[Path | None, set[int]] = defaultdict(set)
     non_task_objects = []
 
     for raw_task in to_list(session.config.get("tasks", ())):
@@ -138,11 +144,10 @@ def _collect_from_tasks(session: Session) -> None:
             name = raw_task.pytask_meta.name
 
         if has_mark(raw_task, "task"):
-            # When tasks with @task are passed to the programmatic interface
-            # multiple times, they are deleted from ``COLLECTED_TASKS`` in the first
-            # iteration and are missing in the later. See #625.
-            with suppress(ValueError):
-                COLLECTED_TASKS[path].remove(raw_task)
+            # Tasks with @task are also stored in ``COLLECTED_TASKS`` and must be
+            # removed from it. They are removed per path in one pass below since
+            # removing them one by one is quadratic for large parametrizations.
+            ids_to_remove[path].add(id(raw_task))
 
             # Group tasks by path for parametrization
             if path not in tasks_by_path:
@@ -153,6 +158,8 @@ def _collect_from_tasks(session: Session) -> None:
             # arbitrary values and it will pass without errors and not collected.
             non_task_objects.append((raw_task, None, ""))
 
+    _remove_from_collected_tasks(ids_to_remove)
+
     # Second pass: apply parametrization to grouped tasks
     parametrized_tasks = []
     for path, tasks in tasks_by_path.items():
@@ -175,6 +182,20 @@ def _collect_from_tasks(session: Session) -> None:
             session.collection_reports.append(report)
 
 
+def _remove_from_collected_tasks(ids_to_remove: dict[Path | None, set[int]]) -> None:
+    """Remove tasks from ``COLLECTED_TASKS`` with one pass per path.
+
+    When tasks with @task are passed to the programmatic interface multiple times, they
+    are deleted from ``COLLECTED_TASKS`` once and are missing later. See #625.
+
+    """
+    for path, ids in ids_to_remove.items():
+        if path in COLLECTED_TASKS:
+            COLLECTED_TASKS[path] = [
+                task for task in COLLECTED_TASKS[path] if id(task) not in ids
+            ]
+
+
 _FAILED_COLLECTING_TASK = """\
 Failed to collect task '{name}'{path_desc}.
 
@@ -253,6 +274,7 @@ def pytask_collect_file(
     if any(path.match(pattern) for pattern in session.config["task_files"]):
         mod = import_path(path, session.config["root"])
 
+        expanded = {id(func) for func in EXPANDED_FUNCTIONS.get(path, ())}
         collected_reports = []
         for name, obj in inspect.getmembers(mod):
             if _is_filtered_object(obj):
@@ -262,6 +284,10 @@ def pytask_collect_file(
             if has_mark(obj, "task"):
                 continue
 
+            # Functions repeated with ``expand`` are only collected as their copies.
+            if expanded and id(unwrap_task_function(obj)) in expanded:
+                continue
+
             report = session.hook.pytask_collect_task_protocol(
                 session=session, reports=reports, path=path, name=name, obj=obj
             )
@@ -371,6 +397,10 @@ def pytask_collect_task(
                 "is_generator": False,
             }
 
+        if session.config.get("task_state") == "function":
+            attributes["task_state"] = "function"
+            attributes["arguments_state"] = _get_state_of_task_arguments(obj, markers)
+
         unwrapped = unwrap_task_function(obj)
         if isinstance(unwrapped, Function):
             attributes["coiled_kwargs"] = extract_coiled_function_kwargs(unwrapped)
@@ -399,10 +429,37 @@ def pytask_collect_task(
     return None
 
 
+_DIRECTORY_LISTINGS = DirectoryListingCache(
+    case_sensitive=IS_FILE_SYSTEM_CASE_SENSITIVE
+)
+"""Listings of directories which are cached while tasks are collected."""
+
+
 _TEMPLATE_ERROR_DIRECTORY: str = """\
 The path '{path}' points to a directory, although only files are allowed."""
 
 
+def _get_state_of_task_arguments(obj: Any, markers: list[Mark]) -> str | None:
+    """Get the state of the evaluated arguments of a task function.
+
+    The arguments are the values passed to decorators like ``@task`` and the defaults of
+    the function. They are often defined in loops and are not part of the source code.
+
+    """
+    unwrapped = unwrap_task_function(obj)
+    arguments: dict[str, Any] = {
+        "defaults": getattr(unwrapped, "__defaults__", None),
+        "kwdefaults": getattr(unwrapped, "__kwdefaults__", None),
+        "markers": [(mark.name, mark.args, mark.kwargs) for mark in markers],
+    }
+    if isinstance(obj, TaskFunction):
+        meta = obj.pytask_meta
+        arguments.update(
+            id=meta.id_, kwargs=meta.kwargs, produces=meta.produces, name=meta.name
+        )
+    return get_state_of_arguments(arguments)
+
+
 @hookimpl(trylast=True)
 def pytask_collect_node(  # noqa: C901, PLR0912
     session: Session, path: Path, node_info: NodeInfo
@@ -435,7 +492,7 @@ def pytask_collect_node(  # noqa: C901, PLR0912
 
             # ``normpath`` removes ``../`` from the path which is necessary for the
             # casing check which will fail since ``.resolves()`` also normalizes a path.
-            node.root_dir = Path(os.path.normpath(node.root_dir))
+            node.root_dir = _DIRECTORY_LISTINGS.normpath(node.root_dir)
             _raise_error_if_casing_of_path_is_wrong(
                 node.root_dir, session.config["check_casing_of_paths"]
             )
@@ -473,7 +530,7 @@ def pytask_collect_node(  # noqa: C901, PLR0912
 
         # ``normpath`` removes ``../`` from the path which is necessary for the casing
         # check which will fail since ``.resolves()`` also normalizes a path.
-        node.path = Path(os.path.normpath(node.path))
+        node.path = _DIRECTORY_LISTINGS.normpath(node.path)
         _raise_error_if_casing_of_path_is_wrong(
             node.path, session.config["check_casing_of_paths"]
         )
@@ -491,7 +548,7 @@ def pytask_collect_node(  # noqa: C901, PLR0912
     if (
         isinstance(node, PPathNode)
         and not isinstance(node.path, UPath)
-        and node.path.is_dir()
+        and _DIRECTORY_LISTINGS.is_dir(node.path)
     ):
         raise ValueError(_TEMPLATE_ERROR_DIRECTORY.format(path=node.path))
 
@@ -515,13 +572,13 @@ def pytask_collect_node(  # noqa: C901, PLR0912
 
         # ``normpath`` removes ``../`` from the path which is necessary for the casing
         # check which will fail since ``.resolves()`` also normalizes a path.
-        node = Path(os.path.normpath(node))
+        node = _DIRECTORY_LISTINGS.normpath(node)
         _raise_error_if_casing_of_path_is_wrong(
             node, session.config["check_casing_of_paths"]
         )
         name = shorten_path(node, session.config["paths"] or (session.config["root"],))
 
-        if isinstance(node, Path) and node.is_dir():
+        if isinstance(node, Path) and _DIRECTORY_LISTINGS.is_dir(node):
             raise ValueError(_TEMPLATE_ERROR_DIRECTORY.format(path=node))
 
         return PathNode(name=name, path=node)
@@ -573,7 +630,9 @@ def _raise_error_if_casing_of_path_is_wrong(
         and sys.platform == "win32"
         and check_casing_of_paths
     ):
-        case_sensitive_path = find_case_sensitive_path(path, "win32")
+        case_sensitive_path = _DIRECTORY_LISTINGS.find_case_sensitive_path(
+            path, "win32"
+        )
         if str(path) != str(case_sensitive_path):
             raise ValueError(_TEMPLATE_ERROR.format(path, case_sensitive_path))
 
@@ -598,13 +657,103 @@ def _not_ignored_paths(
                 yield path
 
 
+_MAX_PARTS_IN_SHORT_NAME = 19
+
+
+class _TrieNode:
+    """A node in the trie of task names.
+
+    ``count`` is the number of tasks passing through the node and ``owner`` is the last
+    task inserted through it which is the only task if ``count == 1``.
+
+    """
+
+    __slots__ = ("children", "count", "owner")
+
+    def __init__(self) -> None:
+        self.children: dict[str | None, _TrieNode] = {}
+        self.count = 0
+        self.owner: Task | None = None
+
+
+class _ShortTaskNameTrie:
+    """Find the shortest uniquely identifiable names of tasks.
+
+    Tasks are stored in a trie keyed by their base name followed by the parts of their
+    path in reverse order. A task is uniquely identified by the shortest suffix of its
+    path whose trie node is passed by no other task.
+
+    The trie can be extended incrementally. Adding a task only changes the short names
+    of tasks that shared a uniquely owned node with the new task.
+
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._task_to_nodes: dict[int, list[_TrieNode]] = {}
+
+    def clear(self) -> None:
+        """Remove all tasks from the trie."""
+        self._root = _TrieNode()
+        self._task_to_nodes = {}
+
+    def add(self, task: Task) -> list[Task]:
+        """Add a task and return all tasks whose short name might have changed."""
+        if id(task) in self._task_to_nodes:
+            return []
+
+        keys: list[str | None] = list(
+            reversed(task.path.parts[-_MAX_PARTS_IN_SHORT_NAME:])
+        )
+        # Paths with fewer parts are extended with a sentinel such that a path which is
+        # the suffix of another path can still be identified by using the full path.
+        if len(keys) < _MAX_PARTS_IN_SHORT_NAME:
+            keys.append(None)
+
+        affected = {id(task): task}
+        node = self._root.children.setdefault(task.base_name, _TrieNode())
+        nodes = []
+        for key in keys:
+            node = node.children.setdefault(key, _TrieNode())
+            if node.count == 1 and node.owner is not None:
+                affected[id(node.owner)] = node.owner
+            node.count += 1
+            node.owner = task
+            nodes.append(node)
+
+        self._task_to_nodes[id(task)] = nodes
+        return list(affected.values())
+
+    def get_short_name(self, task: Task) -> str:
+        """Get the shortest uniquely identifiable name of a task."""
+        for n_parts, node in enumerate(self._task_to_nodes[id(task)], start=1):
+            if node.count == 1:
+                return "/".join(task.path.parts[-n_parts:]) + "::" + task.base_name
+
+        # If the task is still not unique, use the full id as the short id.
+        return task.path.as_posix() + "::" + task.base_name
+
+
+_SHORT_TASK_NAMES = _ShortTaskNameTrie()
+"""The trie of task names which is extended when task generators create new tasks."""
+
+
 @hookimpl(trylast=True)
 def pytask_collect_modify_tasks(tasks: list[PTask]) -> None:
-    """Given all tasks, assign a short uniquely identifiable name to each task."""
-    id_to_short_id = _find_shortest_uniquely_identifiable_name_for_tasks(tasks)
+    """Given all tasks, assign a short uniquely identifiable name to each task.
+
+    The hook is called again after task generators are executed. Only tasks which are
+    new or whose names are affected by new tasks are renamed.
+
+    """
+    affected: dict[int, Task] = {}
     for task in tasks:
-        if task.name in id_to_short_id and isinstance(task, Task):
-            task.name = id_to_short_id[task.name]
+        if isinstance(task, Task):
+            for affected_task in _SHORT_TASK_NAMES.add(task):
+                affected[id(affected_task)] = affected_task
+
+    for task in affected.values():
+        task.name = _SHORT_TASK_NAMES.get_short_name(task)
 
 
 def _find_shortest_uniquely_identifiable_name_for_tasks(
@@ -617,27 +766,17 @@ def _find_shortest_uniquely_identifiable_name_for_tasks(
     folders until the id is unique.
 
     """
-    id_to_short_id = {}
-
-    # Make attempt to add up to twenty parts of the path to ensure uniqueness.
-    id_to_task = {task.name: task for task in tasks if isinstance(task, Task)}
-    for n_parts in range(1, 20):
-        dupl_id_to_short_id = {
-            id_: "/".join(task.path.parts[-n_parts:]) + "::" + task.base_name
-            for id_, task in id_to_task.items()
-        }
-        duplicates = find_duplicates(dupl_id_to_short_id.values())
-
-        for id_, short_id in dupl_id_to_short_id.items():
-            if short_id not in duplicates:
-                id_to_short_id[id_] = short_id
-                id_to_task.pop(id_)
-
-    # If there are still non-unique task ids, just use the full id as the short id.
-    for id_, task in id_to_task.items():
-        id_to_short_id[id_] = task.name
-
-    return id_to_short_id
+    trie = _ShortTaskNameTrie()
+    tasks_with_path = [task for task in tasks if isinstance(task, Task)]
+    for task in tasks_with_path:
+        trie.add(task)
+    return {task.name: trie.get_short_name(task) for task in tasks_with_path}
+
+
+@hookimpl
+def pytask_unconfigure() -> None:
+    """Release the tasks held by the trie of task names."""
+    _SHORT_TASK_NAMES.clear()
 
 
 @hookimpl
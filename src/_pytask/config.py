@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from _pytask.console import console
+from _pytask.dag_graph import DAG_IMPLEMENTATIONS
 from _pytask.pluginmanager import hookimpl
 from _pytask.shared import parse_markers
 from _pytask.shared import parse_paths
@@ -112,6 +113,23 @@ def pytask_parse_config(config: dict[str, Any]) -> None:
         raise ValueError(msg)
     config["task_files"] = value
 
+    value = config.get("dag_implementation", "dict")
+    if value not in DAG_IMPLEMENTATIONS:
+        msg = (
+            f"'dag_implementation' must be one of {sorted(DAG_IMPLEMENTATIONS)}, but "
+            f"it is {value!r}."
+        )
+        raise ValueError(msg)
+    config["dag_implementation"] = value
+
+    value = config.get("task_state", "module")
+    if value not in ("function", "module"):
+        msg = (
+            f"'task_state' must be one of ['function', 'module'], but it is {value!r}."
+        )
+        raise ValueError(msg)
+    config["task_state"] = value
+
     if config["stop_after_first_failure"]:
         config["max_failures"] = 1
 
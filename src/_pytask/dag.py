@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import itertools
 import sys
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 from rich.text import Text
@@ -17,10 +18,13 @@ from _pytask.console import format_node_name
 from _pytask.console import format_task_name
 from _pytask.console import render_to_string
 from _pytask.dag_graph import DAG
-from _pytask.dag_graph import NoCycleError
-from _pytask.dag_graph import find_cycle
+from _pytask.dag_graph import DAG_IMPLEMENTATIONS
+from _pytask.dag_graph import find_cycles
+from _pytask.dag_snapshot import fingerprint_tasks
+from _pytask.dag_snapshot import read_snapshot
+from _pytask.dag_snapshot import write_snapshot
 from _pytask.exceptions import ResolvingDependenciesError
-from _pytask.mark import select_by_after_keyword
+from _pytask.mark import select_by_after_keywords
 from _pytask.mark import select_tasks_by_marks_and_expressions
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PProvisionalNode
@@ -42,7 +46,7 @@ __all__ = ["create_dag", "create_dag_from_session"]
 def create_dag(session: Session) -> DAG:
     """Create a directed acyclic graph (DAG) for the workflow."""
     try:
-        dag = create_dag_from_session(session)
+        dag = create_dag_from_session(session, use_snapshot=True)
     except Exception:  # noqa: BLE001
         report = DagReport.from_exception(sys.exc_info())
         _log_dag(report=report)
@@ -52,17 +56,39 @@ def create_dag(session: Session) -> DAG:
     return dag
 
 
-def create_dag_from_session(session: Session) -> DAG:
-    """Create a DAG from a session."""
-    dag = _create_dag_from_tasks(tasks=session.tasks)
-    _check_if_dag_has_cycles(dag)
-    _check_if_tasks_have_the_same_products(dag, session.config["paths"])
-    dag = _modify_dag(session=session, dag=dag)
+def create_dag_from_session(session: Session, *, use_snapshot: bool = False) -> DAG:
+    """Create a DAG from a session.
+
+    If ``use_snapshot`` is true, the DAG is restored from the snapshot in ``.pytask``
+    when the collected tasks did not change. Otherwise, the snapshot is updated by the
+    ``build`` command. Other commands only read the snapshot.
+
+    """
+    dag_class = DAG_IMPLEMENTATIONS[session.config.get("dag_implementation", "dict")]
+    root = session.config.get("root")
+    snapshot_path = root / ".pytask" / "dag.json" if use_snapshot and root else None
+
+    dag = None
+    if snapshot_path is not None:
+        fingerprint, entries = fingerprint_tasks(session.tasks)
+        snapshot = read_snapshot(snapshot_path)
+        if snapshot is not None and snapshot.fingerprint == fingerprint:
+            dag = snapshot.to_dag(entries, dag_class)
+
+    if dag is None:
+        dag = _create_dag_from_tasks(tasks=session.tasks, dag_class=dag_class)
+        _check_if_dag_has_cycles(dag)
+        _check_if_tasks_have_the_same_products(dag, session.config["paths"])
+        dag = _modify_dag(session=session, dag=dag)
+        if snapshot_path is not None and session.config.get("command") == "build":
+            with suppress(OSError):
+                write_snapshot(snapshot_path, dag, fingerprint, root)
+
     select_tasks_by_marks_and_expressions(session=session, dag=dag)
     return dag
 
 
-def _create_dag_from_tasks(tasks: list[PTask]) -> DAG:
+def _create_dag_from_tasks(tasks: list[PTask], dag_class: type[DAG] = DAG) -> DAG:
     """Create the DAG from tasks, dependencies and products."""
 
     def _add_node_data(dag: DAG, node: PNode | PProvisionalNode) -> None:
@@ -84,7 +110,7 @@ def _create_dag_from_tasks(tasks: list[PTask]) -> DAG:
         """Add a product to the DAG."""
         dag.add_edge(task.signature, node.signature)
 
-    dag = DAG()
+    dag = dag_class()
 
     for task in tasks:
         dag.add_node(task.signature, task)
@@ -104,6 +130,15 @@ def _modify_dag(session: Session, dag: DAG) -> DAG:
         for task in session.tasks
         if "collection_id" in task.attributes
     }
+    # Resolve all expressions at once since many tasks may share the same expression.
+    after_to_signatures = select_by_after_keywords(
+        session,
+        (
+            task.attributes["after"]
+            for task in session.tasks
+            if isinstance(task.attributes.get("after"), str)
+        ),
+    )
     for task in session.tasks:
         after = task.attributes.get("after")
         if isinstance(after, list):
@@ -113,36 +148,33 @@ def _modify_dag(session: Session, dag: DAG) -> DAG:
                     dag.add_edge(successor, task.signature)
         elif isinstance(after, str):
             task_signature = task.signature
-            signatures = select_by_after_keyword(session, after)
-            signatures.discard(task_signature)
+            signatures = after_to_signatures[after] - {task_signature}
             for signature in signatures:
                 for successor in dag.successors(signature):
-                    dag.add_edge(successor, task.signature)
+                    dag.add_edge(successor, task_signature)
     return dag
 
 
 def _check_if_dag_has_cycles(dag: DAG) -> None:
     """Check if DAG has cycles."""
-    try:
-        cycles = find_cycle(dag)
-    except NoCycleError:
-        pass
-    else:
+    cycles = find_cycles(dag)
+    if cycles:
+        formatted_cycles = "\n\n".join(_format_cycle(dag, cycle) for cycle in cycles)
         msg = (
             f"The DAG contains cycles which means a dependency is directly or "
             "indirectly a product of the same task. See the following the path of "
             "nodes in the graph which forms the cycle.\n\n"
-            f"{_format_cycles(dag, cycles)}"
+            f"{formatted_cycles}"
         )
         raise ResolvingDependenciesError(msg)
 
 
-def _format_cycles(dag: DAG, cycles: list[tuple[str, str]]) -> str:
-    """Format cycles as a paths connected by arrows."""
+def _format_cycle(dag: DAG, cycle: list[tuple[str, str]]) -> str:
+    """Format a cycle as a path connected by arrows."""
     chain = [
-        x for i, x in enumerate(itertools.chain.from_iterable(cycles)) if i % 2 == 0
+        x for i, x in enumerate(itertools.chain.from_iterable(cycle)) if i % 2 == 0
     ]
-    chain += [cycles[-1][1]]
+    chain += [cycle[-1][1]]
 
     lines: list[str] = []
     for x in chain:
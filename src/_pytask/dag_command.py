@@ -10,6 +10,7 @@ from typing import Any
 from typing import cast
 
 import click
+from click.core import ParameterSource
 from rich.text import Text
 
 from _pytask.click import ColoredCommand
@@ -19,6 +20,10 @@ from _pytask.compat import import_optional_dependency
 from _pytask.config_utils import normalize_programmatic_config
 from _pytask.console import console
 from _pytask.dag import create_dag
+from _pytask.dag_export import EXPORTERS
+from _pytask.dag_export import Aggregation
+from _pytask.dag_export import export_graph
+from _pytask.dag_export import iter_graph
 from _pytask.exceptions import CollectionError
 from _pytask.exceptions import ConfigurationError
 from _pytask.exceptions import ResolvingDependenciesError
@@ -51,13 +56,24 @@ def pytask_extend_command_line_interface(cli: click.Group) -> None:
 
 _HELP_TEXT_LAYOUT: str = (
     "The layout determines the structure of the graph. Here you find an overview of "
-    "all available layouts: https://graphviz.org/docs/layouts."
+    "all available layouts: https://graphviz.org/docs/layouts. If a layout is given, "
+    "files ending with .dot or .gv are laid out by graphviz as well."
 )
 
 
 _HELP_TEXT_OUTPUT: str = (
     "The output path of the visualization. The format is inferred from the file "
-    "extension."
+    "extension. Files ending with .dot, .gv, .graphml, or .jsonl are written by pytask "
+    "without networkx and pygraphviz unless a layout is given for .dot and .gv files."
+)
+
+
+_GRAPHVIZ_SUFFIXES = (".dot", ".gv")
+
+
+_HELP_TEXT_AGGREGATE: str = (
+    "Aggregate tasks by the module or the directory in which they are defined to "
+    "shrink the graph."
 )
 
 
@@ -83,8 +99,19 @@ _HELP_TEXT_RANK_DIRECTION: str = (
     help=_HELP_TEXT_RANK_DIRECTION,
     default=_RankDirection.TB,
 )
+@click.option(
+    "--aggregate",
+    type=EnumChoice(Aggregation),
+    help=_HELP_TEXT_AGGREGATE,
+    default=Aggregation.NO,
+)
 def dag(**raw_config: Any) -> int:
     """Create a visualization of the directed acyclic graph."""
+    # DOT files are only laid out by graphviz if a layout is requested explicitly.
+    is_layout_given = (
+        click.get_current_context().get_parameter_source("layout")
+        != ParameterSource.DEFAULT
+    )
     try:
         pm = storage.get()
         config = pm.hook.pytask_configure(pm=pm, raw_config=raw_config)
@@ -97,17 +124,33 @@ def dag(**raw_config: Any) -> int:
     else:
         try:
             session.hook.pytask_log_session_header(session=session)
-            import_optional_dependency("networkx")
-            import_optional_dependency("pygraphviz")
-            check_for_optional_program(
-                session.config["layout"],
-                extra="The layout program is part of the graphviz package which you "
-                "can install with conda.",
+            output_path = session.config["output_path"]
+            is_exported_natively = output_path.suffix in EXPORTERS and not (
+                is_layout_given and output_path.suffix in _GRAPHVIZ_SUFFIXES
             )
+            if not is_exported_natively:
+                import_optional_dependency("networkx")
+                import_optional_dependency("pygraphviz")
+                check_for_optional_program(
+                    session.config["layout"],
+                    extra="The layout program is part of the graphviz package which "
+                    "you can install with conda.",
+                )
             session.hook.pytask_collect(session=session)
             session.dag = create_dag(session=session)
-            dag = _to_visualization_graph(session)
-            _write_graph(dag, session.config["output_path"], session.config["layout"])
+            if is_exported_natively:
+                export_graph(
+                    session.dag,
+                    output_path,
+                    paths=session.config["paths"],
+                    rank_direction=session.config["rank_direction"].name,
+                    aggregation=Aggregation(session.config["aggregate"]),
+                )
+                console.print()
+                console.print(f"Written to {output_path}.")
+            else:
+                dag = _to_visualization_graph(session)
+                _write_graph(dag, output_path, session.config["layout"])
 
         except CollectionError:  # pragma: no cover
             session.exit_code = ExitCode.COLLECTION_FAILED
@@ -189,6 +232,16 @@ def _refine_dag(session: Session) -> DAG:
 def _to_visualization_graph(session: Session) -> nx.DiGraph:
     """Convert the internal DAG to a styled networkx graph for visualization."""
     nx = cast("Any", import_optional_dependency("networkx"))
+    aggregation = Aggregation(session.config.get("aggregate", Aggregation.NO))
+    if aggregation != Aggregation.NO:
+        nodes, edges = iter_graph(session.dag, session.config["paths"], aggregation)
+        labels = {i: label for i, label, _ in nodes}
+        dag = nx.DiGraph()
+        dag.add_nodes_from(labels.values(), shape="folder")
+        dag.add_edges_from((labels[u], labels[v]) for u, v in edges)
+        dag.graph["graph"] = {"rankdir": session.config["rank_direction"].name}
+        return dag
+
     dag = _refine_dag(session).to_networkx()
     dag.graph["graph"] = {"rankdir": session.config["rank_direction"].name}
     shapes = {name: "hexagon" if "::task_" in name else "box" for name in dag.nodes}
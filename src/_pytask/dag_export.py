@@ -0,0 +1,203 @@
+"""Export the DAG to DOT, GraphML, and JSON lines without optional dependencies.
+
+The exporters write one line per node and edge while iterating over the DAG. Neither a
+copy of the graph nor the full document is held in memory which keeps exporting graphs
+with hundreds of thousands of nodes fast.
+
+"""
+
+from __future__ import annotations
+
+import enum
+import json
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+
+from _pytask.node_protocols import PTask
+from _pytask.node_protocols import PTaskWithPath
+from _pytask.path import shorten_path
+from _pytask.shared import reduce_names_of_multiple_nodes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from pathlib import Path
+    from typing import TextIO
+
+    from _pytask.dag_graph import DAG
+
+
+__all__ = ["EXPORTERS", "Aggregation", "export_graph", "iter_graph"]
+
+
+class Aggregation(enum.Enum):
+    """Levels to which tasks are aggregated before exporting the graph."""
+
+    NO = "no"
+    MODULE = "module"
+    DIRECTORY = "directory"
+
+
+_GraphNode = tuple[int, str, str]
+"""A node with its id, label, and kind."""
+
+
+_SHAPES = {"task": "hexagon", "node": "box", "module": "tab", "directory": "folder"}
+
+
+def iter_graph(
+    dag: DAG, paths: Sequence[Path], aggregation: Aggregation = Aggregation.NO
+) -> tuple[Iterator[_GraphNode], Iterator[tuple[int, int]]]:
+    """Return iterators over the nodes and edges of the graph to export.
+
+    Without aggregation, all tasks and nodes are exported. Otherwise, tasks are grouped
+    by the module or the directory in which they are defined, and two groups are
+    connected if a task of the second group depends on a product of a task in the first
+    group. Other nodes are not exported.
+
+    """
+    if aggregation == Aggregation.NO:
+        return _iter_nodes(dag, paths), _iter_edges(dag)
+    return _aggregate(dag, paths, aggregation)
+
+
+def _iter_nodes(dag: DAG, paths: Sequence[Path]) -> Iterator[_GraphNode]:
+    for i, signature in enumerate(dag.nodes):
+        (label,) = reduce_names_of_multiple_nodes([signature], dag, paths)
+        kind = "task" if isinstance(dag.nodes[signature], PTask) else "node"
+        yield i, label, kind
+
+
+def _iter_edges(dag: DAG) -> Iterator[tuple[int, int]]:
+    position = {signature: i for i, signature in enumerate(dag.nodes)}
+    for signature, i in position.items():
+        for successor in dag.successors(signature):
+            yield i, position[successor]
+
+
+def _aggregate(
+    dag: DAG, paths: Sequence[Path], aggregation: Aggregation
+) -> tuple[Iterator[_GraphNode], Iterator[tuple[int, int]]]:
+    group_ids: dict[str, int] = {}
+    signature_to_group: dict[str, int] = {}
+    for signature, entry in dag.nodes.items():
+        if not isinstance(entry, PTask):
+            continue
+        if isinstance(entry, PTaskWithPath):
+            path = (
+                entry.path if aggregation == Aggregation.MODULE else entry.path.parent
+            )
+            group = shorten_path(path, paths)
+        else:
+            group = entry.name
+        signature_to_group[signature] = group_ids.setdefault(group, len(group_ids))
+
+    edges = set()
+    for signature, entry in dag.nodes.items():
+        if isinstance(entry, PTask):
+            continue
+        sources = {
+            signature_to_group[p]
+            for p in dag.predecessors(signature)
+            if p in signature_to_group
+        }
+        if not sources:
+            continue
+        for successor in dag.successors(signature):
+            target = signature_to_group.get(successor)
+            if target is not None:
+                edges.update((s, target) for s in sources if s != target)
+
+    nodes = ((i, group, aggregation.value) for group, i in group_ids.items())
+    return nodes, iter(sorted(edges))
+
+
+def _escape_dot(label: str) -> str:
+    return label.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def write_dot(
+    file: TextIO,
+    nodes: Iterable[_GraphNode],
+    edges: Iterable[tuple[int, int]],
+    rank_direction: str,
+) -> None:
+    """Write the graph in the DOT language of graphviz."""
+    file.write(f"digraph {{\nrankdir={rank_direction};\n")
+    file.writelines(
+        f'n{i} [label="{_escape_dot(label)}", shape={_SHAPES[kind]}];\n'
+        for i, label, kind in nodes
+    )
+    file.writelines(f"n{source} -> n{target};\n" for source, target in edges)
+    file.write("}\n")
+
+
+def write_graphml(
+    file: TextIO,
+    nodes: Iterable[_GraphNode],
+    edges: Iterable[tuple[int, int]],
+    rank_direction: str,  # noqa: ARG001
+) -> None:
+    """Write the graph as GraphML."""
+    file.write(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        '<key id="label" for="node" attr.name="label" attr.type="string"/>\n'
+        '<key id="kind" for="node" attr.name="kind" attr.type="string"/>\n'
+        '<graph edgedefault="directed">\n'
+    )
+    file.writelines(
+        f'<node id="n{i}"><data key="label">{escape(label)}</data>'
+        f'<data key="kind">{kind}</data></node>\n'
+        for i, label, kind in nodes
+    )
+    file.writelines(
+        f'<edge source="n{source}" target="n{target}"/>\n' for source, target in edges
+    )
+    file.write("</graph>\n</graphml>\n")
+
+
+def write_jsonl(
+    file: TextIO,
+    nodes: Iterable[_GraphNode],
+    edges: Iterable[tuple[int, int]],
+    rank_direction: str,  # noqa: ARG001
+) -> None:
+    """Write one JSON object per node followed by one JSON object per edge."""
+    file.writelines(
+        json.dumps({"id": i, "label": label, "kind": kind}) + "\n"
+        for i, label, kind in nodes
+    )
+    file.writelines(
+        json.dumps({"source": source, "target": target}) + "\n"
+        for source, target in edges
+    )
+
+
+EXPORTERS: dict[
+    str, Callable[[TextIO, Iterable[_GraphNode], Iterable[tuple[int, int]], str], None]
+] = {
+    ".dot": write_dot,
+    ".gv": write_dot,
+    ".graphml": write_graphml,
+    ".jsonl": write_jsonl,
+}
+"""The exporters for the file extensions which pytask writes without graphviz."""
+
+
+def export_graph(
+    dag: DAG,
+    path: Path,
+    *,
+    paths: Sequence[Path] = (),
+    rank_direction: str = "TB",
+    aggregation: Aggregation = Aggregation.NO,
+) -> None:
+    """Export the graph to a file with a format inferred from the file extension."""
+    exporter = EXPORTERS[path.suffix]
+    nodes, edges = iter_graph(dag, paths, aggregation)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    with path.open("w", encoding="utf-8") as file:
+        exporter(file, nodes, edges, rank_direction)
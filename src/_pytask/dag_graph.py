@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import itertools
+import sys
+from array import array
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass
 from dataclasses import field
 from typing import TYPE_CHECKING
@@ -18,7 +22,6 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Iterable
     from collections.abc import Iterator
-    from collections.abc import Mapping
 
 
 DAGEntry = PTask | PNode | PProvisionalNode
@@ -35,12 +38,16 @@ class DAG:
     _node_data: dict[str, DAGEntry] = field(default_factory=dict)
     _successors: dict[str, set[str]] = field(default_factory=dict)
     _predecessors: dict[str, set[str]] = field(default_factory=dict)
+    _is_acyclic: bool = field(default=False, repr=False, compare=False)
 
     @property
     def nodes(self) -> dict[str, DAGEntry]:
         return self._node_data
 
     def add_node(self, node_name: str, data: DAGEntry) -> None:
+        # Signatures are recomputed whenever they are accessed. Interning them ensures
+        # that all adjacency sets share a single string per node.
+        node_name = _intern(node_name)
         if node_name not in self._node_data:
             self._successors[node_name] = set()
             self._predecessors[node_name] = set()
@@ -50,8 +57,10 @@ class DAG:
         if source not in self._node_data or target not in self._node_data:
             msg = "Both nodes must exist before adding an edge."
             raise KeyError(msg)
+        source, target = _intern(source), _intern(target)
         self._successors[source].add(target)
         self._predecessors[target].add(source)
+        self._is_acyclic = False
 
     def successors(self, node: str) -> Iterator[str]:
         return iter(self._successors[node])
@@ -83,29 +92,42 @@ class DAG:
         """Return all ancestors of a node."""
         return self._traverse(node, self.predecessors)
 
+    def ancestors_of_nodes(self, nodes: Iterable[str]) -> set[str]:
+        """Return all ancestors of multiple nodes with one traversal.
+
+        It is equal to the union of the ancestors of every node, but every ancestor is
+        visited only once.
+
+        """
+        return self._traverse_many(nodes, self.predecessors)
+
+    def descendants_of_nodes(self, nodes: Iterable[str]) -> set[str]:
+        """Return all descendants of multiple nodes with one traversal."""
+        return self._traverse_many(nodes, self.successors)
+
     def relabel_nodes(self, mapping: Mapping[str, str]) -> DAG:
-        graph = DAG()
+        graph = type(self)()
 
-        new_labels = [mapping.get(node, node) for node in self._node_data]
+        new_labels = [mapping.get(node, node) for node in self.nodes]
         if len(new_labels) != len(set(new_labels)):
             msg = "Relabeling nodes requires unique target labels."
             raise ValueError(msg)
 
-        for node, data in self._node_data.items():
+        for node, data in self.nodes.items():
             graph.add_node(mapping.get(node, node), data)
-        for source, successors in self._successors.items():
+        for source in self.nodes:
             new_source = mapping.get(source, source)
-            for target in successors:
+            for target in self.successors(source):
                 graph.add_edge(new_source, mapping.get(target, target))
         return graph
 
     def to_networkx(self) -> Any:
         nx = cast("Any", import_optional_dependency("networkx"))
         graph = nx.DiGraph()
-        for node in self._node_data:
+        for node in self.nodes:
             graph.add_node(node)
-        for source, successors in self._successors.items():
-            for target in successors:
+        for source in self.nodes:
+            for target in self.successors(source):
                 graph.add_edge(source, target)
         return graph
 
@@ -113,9 +135,16 @@ class DAG:
         self,
         node: str,
         adjacency: Callable[[str], Iterable[str]],
+    ) -> set[str]:
+        return self._traverse_many((node,), adjacency)
+
+    def _traverse_many(
+        self,
+        nodes: Iterable[str],
+        adjacency: Callable[[str], Iterable[str]],
     ) -> set[str]:
         visited: set[str] = set()
-        stack = list(adjacency(node))
+        stack = [neighbor for node in nodes for neighbor in adjacency(node)]
 
         while stack:
             current = stack.pop()
@@ -127,36 +156,349 @@ class DAG:
         return visited
 
 
+class ArrayDAG(DAG):
+    """A DAG for very large projects which stores edges in arrays of integer ids.
+
+    Every signature is mapped to a dense integer id. Edges are kept in compressed
+    sparse row (CSR) arrays, one for successors and one for predecessors, where the
+    neighbors of node ``i`` are ``indices[offsets[i]:offsets[i + 1]]``. Edges added
+    after the arrays were built are stored separately and merged into the arrays before
+    the next traversal. Removed nodes are only flagged and skipped.
+
+    The class has the same interface as [`DAG`][_pytask.dag_graph.DAG] and can be
+    selected with the configuration value ``dag_implementation = "array"``.
+
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._signatures: list[str] = []
+        self._data: list[DAGEntry | None] = []
+        self._removed = bytearray()
+        self._csr_successors = _CSR()
+        self._csr_predecessors = _CSR()
+        self._pending_successors: dict[int, list[int]] = {}
+        self._pending_predecessors: dict[int, list[int]] = {}
+        self._is_acyclic = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_nodes={len(self._ids)})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DAG):
+            return NotImplemented
+        return dict(self.nodes) == dict(other.nodes) and all(
+            set(self.successors(node)) == set(other.successors(node))
+            for node in self.nodes
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def nodes(self) -> Mapping[str, DAGEntry]:  # type: ignore[override]
+        return _NodeView(self)
+
+    def add_node(self, node_name: str, data: DAGEntry) -> None:
+        node_name = _intern(node_name)
+        id_ = self._ids.get(node_name)
+        if id_ is None:
+            self._ids[node_name] = len(self._signatures)
+            self._signatures.append(node_name)
+            self._data.append(data)
+            self._removed.append(0)
+        else:
+            self._data[id_] = data
+
+    def add_edge(self, source: str, target: str) -> None:
+        if source not in self._ids or target not in self._ids:
+            msg = "Both nodes must exist before adding an edge."
+            raise KeyError(msg)
+        source_id, target_id = self._ids[source], self._ids[target]
+        self._pending_successors.setdefault(source_id, []).append(target_id)
+        self._pending_predecessors.setdefault(target_id, []).append(source_id)
+        self._is_acyclic = False
+
+    def successors(self, node: str) -> Iterator[str]:
+        return self._neighbors(node, self._csr_successors, self._pending_successors)
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        return self._neighbors(node, self._csr_predecessors, self._pending_predecessors)
+
+    def in_degree(self) -> Iterator[tuple[str, int]]:
+        self._compact()
+        csr, removed = self._csr_predecessors, self._removed
+        offsets, indices = csr.offsets, csr.indices
+        has_removed_nodes = len(self._ids) < len(self._signatures)
+        for node, id_ in self._ids.items():
+            start, end = offsets[id_], offsets[id_ + 1]
+            if has_removed_nodes and start != end:
+                yield node, sum(1 for i in indices[start:end] if not removed[i])
+            else:
+                yield node, end - start
+
+    def remove_nodes_from(self, nodes: Iterable[str]) -> None:
+        for node in nodes:
+            id_ = self._ids.pop(node, None)
+            if id_ is None:
+                continue
+            self._removed[id_] = 1
+            self._data[id_] = None
+
+    def descendants(self, node: str) -> set[str]:
+        """Return all descendants of a node."""
+        self._compact()
+        return self._traverse_ids((self._ids[node],), self._csr_successors)
+
+    def ancestors(self, node: str) -> set[str]:
+        """Return all ancestors of a node."""
+        self._compact()
+        return self._traverse_ids((self._ids[node],), self._csr_predecessors)
+
+    def ancestors_of_nodes(self, nodes: Iterable[str]) -> set[str]:
+        """Return all ancestors of multiple nodes with one traversal."""
+        self._compact()
+        ids = [self._ids[node] for node in nodes]
+        return self._traverse_ids(ids, self._csr_predecessors)
+
+    def descendants_of_nodes(self, nodes: Iterable[str]) -> set[str]:
+        """Return all descendants of multiple nodes with one traversal."""
+        self._compact()
+        ids = [self._ids[node] for node in nodes]
+        return self._traverse_ids(ids, self._csr_successors)
+
+    def _neighbors(
+        self, node: str, csr: _CSR, pending: dict[int, list[int]]
+    ) -> Iterator[str]:
+        id_ = self._ids[node]
+        neighbors: Iterable[int] = csr.row(id_)
+        if id_ in pending:
+            neighbors = dict.fromkeys(itertools.chain(neighbors, pending[id_]))
+        removed, signatures = self._removed, self._signatures
+        return (signatures[i] for i in neighbors if not removed[i])
+
+    def _traverse_ids(self, starts: Iterable[int], csr: _CSR) -> set[str]:
+        offsets, indices = csr.offsets, csr.indices
+        removed = self._removed
+        visited = bytearray(len(self._signatures))
+        stack = []
+        for start in starts:
+            stack.extend(indices[offsets[start] : offsets[start + 1]])
+        result = []
+
+        while stack:
+            current = stack.pop()
+            if visited[current] or removed[current]:
+                continue
+            visited[current] = 1
+            result.append(current)
+            stack.extend(indices[offsets[current] : offsets[current + 1]])
+
+        signatures = self._signatures
+        return {signatures[i] for i in result}
+
+    def _compact(self) -> None:
+        """Merge pending edges into the CSR arrays."""
+        n_nodes = len(self._signatures)
+        if (
+            not self._pending_successors
+            and len(self._csr_successors.offsets) == n_nodes + 1
+        ):
+            return
+        self._csr_successors = self._csr_successors.merge(
+            self._pending_successors, n_nodes
+        )
+        self._csr_predecessors = self._csr_predecessors.merge(
+            self._pending_predecessors, n_nodes
+        )
+        self._pending_successors = {}
+        self._pending_predecessors = {}
+
+
+class _CSR:
+    """Adjacency lists in compressed sparse row format."""
+
+    __slots__ = ("indices", "offsets")
+
+    def __init__(self) -> None:
+        self.offsets = array("q", [0])
+        self.indices = array("q")
+
+    def row(self, id_: int) -> array[int]:
+        if id_ + 1 >= len(self.offsets):
+            # The node was added after the arrays were built.
+            return array("q")
+        return self.indices[self.offsets[id_] : self.offsets[id_ + 1]]
+
+    def merge(self, pending: dict[int, list[int]], n_nodes: int) -> _CSR:
+        """Return new arrays with the pending edges for ``n_nodes`` nodes."""
+        new = _CSR()
+        offsets, indices = new.offsets, new.indices
+        old_offsets, old_indices = self.offsets, self.indices
+        n_rows = len(old_offsets) - 1
+        for id_ in range(n_nodes):
+            if id_ < n_rows:
+                start, end = old_offsets[id_], old_offsets[id_ + 1]
+                if start != end:
+                    indices.extend(old_indices[start:end])
+            else:
+                start = end = 0
+            row = pending.get(id_)
+            if row is not None and start == end and len(row) == 1:
+                indices.append(row[0])
+            elif row is not None:
+                existing = set(old_indices[start:end])
+                indices.extend([i for i in dict.fromkeys(row) if i not in existing])
+            offsets.append(len(indices))
+        return new
+
+
+class _NodeView(Mapping[str, "DAGEntry"]):
+    """A read-only mapping from signatures to the nodes of an ``ArrayDAG``."""
+
+    __slots__ = ("_dag",)
+
+    def __init__(self, dag: ArrayDAG) -> None:
+        self._dag = dag
+
+    def __getitem__(self, node: str) -> DAGEntry:
+        data = self._dag._data[self._dag._ids[node]]
+        assert data is not None
+        return data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dag._ids)
+
+    def __len__(self) -> int:
+        return len(self._dag._ids)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._dag._ids
+
+
+DAG_IMPLEMENTATIONS: dict[str, type[DAG]] = {"dict": DAG, "array": ArrayDAG}
+"""Maps the values of the configuration value ``dag_implementation`` to classes."""
+
+
+def _intern(node_name: str) -> str:
+    """Intern a node name unless it is a custom object used as a signature."""
+    return sys.intern(node_name) if type(node_name) is str else node_name
+
+
+def find_cycles(dag: DAG) -> list[list[tuple[str, str]]]:
+    """Find one cycle in every strongly connected component of the graph.
+
+    The strongly connected components are found with an iterative version of Tarjan's
+    algorithm which runs in linear time and does not recurse. Every component with more
+    than one node or a self-loop contains at least one cycle. The cycle starts at the
+    node of the component which was added first to the graph.
+
+    A graph without cycles is remembered until the next edge is added, so that checking
+    the same graph again is free.
+
+    """
+    if dag._is_acyclic:
+        return []
+
+    components = _find_strongly_connected_components(dag)
+    if not components:
+        dag._is_acyclic = True
+        return []
+
+    position = {node: i for i, node in enumerate(dag.nodes)}
+    cycles = []
+    for component in components:
+        start = min(component, key=position.__getitem__)
+        cycle = _find_cycle_in_component(dag, start, set(component))
+        cycles.append((position[start], cycle))
+    return [cycle for _, cycle in sorted(cycles)]
+
+
 def find_cycle(dag: DAG) -> list[tuple[str, str]]:
     """Find one cycle in the graph."""
-    visited: set[str] = set()
-    active: set[str] = set()
-    path: list[str] = []
+    cycles = find_cycles(dag)
+    if not cycles:
+        raise NoCycleError
+    return cycles[0]
 
-    def _visit(node: str) -> list[tuple[str, str]] | None:
-        visited.add(node)
-        active.add(node)
-        path.append(node)
 
-        for successor in dag.successors(node):
-            if successor not in visited:
-                cycle = _visit(successor)
-                if cycle is not None:
-                    return cycle
-            elif successor in active:
-                start = path.index(successor)
-                cycle_nodes = [*path[start:], successor]
-                return list(itertools.pairwise(cycle_nodes))
+def _find_strongly_connected_components(dag: DAG) -> list[list[str]]:
+    """Find all strongly connected components which contain a cycle."""
+    tarjan = _Tarjan(dag)
+    for root in dag.nodes:
+        if root not in tarjan.index:
+            tarjan.visit(root)
+    return tarjan.components
 
-        active.remove(node)
-        path.pop()
-        return None
 
-    for node in dag.nodes:
-        if node in visited:
-            continue
-        cycle = _visit(node)
-        if cycle is not None:
-            return cycle
+@dataclass
+class _Tarjan:
+    """The state of an iterative version of Tarjan's algorithm."""
+
+    dag: DAG
+    index: dict[str, int] = field(default_factory=dict)
+    lowlink: dict[str, int] = field(default_factory=dict)
+    stack: list[str] = field(default_factory=list)
+    on_stack: set[str] = field(default_factory=set)
+    components: list[list[str]] = field(default_factory=list)
+
+    def visit(self, root: str) -> None:
+        """Visit all nodes reachable from the root with an explicit stack."""
+        self._discover(root)
+        work = [(root, self.dag.successors(root))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in self.index:
+                    self._discover(successor)
+                    work.append((successor, self.dag.successors(successor)))
+                    break
+                if successor in self.on_stack:
+                    self.lowlink[node] = min(self.lowlink[node], self.index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    self.lowlink[parent] = min(self.lowlink[parent], self.lowlink[node])
+                if self.lowlink[node] == self.index[node]:
+                    self._pop_component(node)
+
+    def _discover(self, node: str) -> None:
+        self.index[node] = self.lowlink[node] = len(self.index)
+        self.stack.append(node)
+        self.on_stack.add(node)
+
+    def _pop_component(self, root: str) -> None:
+        component = []
+        while True:
+            member = self.stack.pop()
+            self.on_stack.remove(member)
+            component.append(member)
+            if member == root:
+                break
+        if len(component) > 1 or root in self.dag.successors(root):
+            self.components.append(component)
+
+
+def _find_cycle_in_component(
+    dag: DAG, start: str, component: set[str]
+) -> list[tuple[str, str]]:
+    """Find the shortest cycle through ``start`` inside its component."""
+    parents: dict[str, str] = {}
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        for successor in dag.successors(node):
+            if successor == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                cycle_nodes = [*reversed(path), start]
+                return list(itertools.pairwise(cycle_nodes))
+            if successor in component and successor not in parents:
+                parents[successor] = node
+                queue.append(successor)
 
-    raise NoCycleError
+    msg = "The component does not contain a cycle."  # pragma: no cover
+    raise NoCycleError(msg)  # pragma: no cover
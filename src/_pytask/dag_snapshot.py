@@ -0,0 +1,188 @@
+"""Persist the DAG to skip resolving dependencies of unchanged projects.
+
+Building the DAG requires connecting all tasks and nodes, checking for cycles and
+products created by multiple tasks, and resolving the ``after`` conditions of tasks. The
+result only depends on the collected tasks and the signatures of their nodes. A
+snapshot with the signatures, edges, and portable ids is stored in ``.pytask`` together
+with a fingerprint of the collected tasks. If the fingerprint of the next run matches,
+the DAG is restored from the snapshot.
+
+The fingerprint still computes the signatures of all tasks and nodes, and restoring the
+DAG adds all nodes and edges again. Only the checks and the resolution of ``after``
+conditions are skipped, which makes creating the DAG of large projects several times
+faster but not free.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from _pytask.lockfile import build_portable_node_id
+from _pytask.lockfile import build_portable_task_id
+from _pytask.mark import KeywordMatcher
+from _pytask.node_protocols import PNode
+from _pytask.node_protocols import PTask
+from _pytask.nodes import PythonNode
+from _pytask.tree_util import tree_leaves
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytask.dag_graph import DAG
+    from _pytask.dag_graph import DAGEntry
+
+
+__all__ = ["DagSnapshot", "fingerprint_tasks", "read_snapshot", "write_snapshot"]
+
+
+CURRENT_SNAPSHOT_VERSION = 1
+
+
+class DagSnapshot(msgspec.Struct, forbid_unknown_fields=False):
+    """A persisted DAG.
+
+    Attributes
+    ----------
+    version
+        The version of the snapshot format.
+    fingerprint
+        The fingerprint of the collected tasks which were used to build the DAG.
+    nodes
+        The signatures of all nodes in the order they were added to the DAG.
+    ids
+        The portable ids of the nodes which are stable across machines.
+    edges
+        The edges as flat pairs of positions in ``nodes``.
+
+    """
+
+    version: int
+    fingerprint: str
+    nodes: list[str]
+    ids: list[str]
+    edges: list[int]
+
+    def to_dag(self, entries: dict[str, DAGEntry], dag_class: type[DAG]) -> DAG | None:
+        """Restore the DAG with the collected tasks and nodes as node data.
+
+        Returns ``None`` if the snapshot does not contain the same nodes.
+
+        """
+        if len(self.nodes) != len(entries) or len(self.edges) % 2:
+            return None
+        dag = dag_class()
+        try:
+            for signature in self.nodes:
+                dag.add_node(signature, entries[signature])
+            nodes = self.nodes
+            edges = iter(self.edges)
+            for source, target in zip(edges, edges, strict=True):
+                dag.add_edge(nodes[source], nodes[target])
+        except (KeyError, IndexError):
+            return None
+        # Only DAGs without cycles are stored.
+        dag._is_acyclic = True
+        return dag
+
+
+def fingerprint_tasks(tasks: list[PTask]) -> tuple[str, dict[str, DAGEntry]]:
+    """Compute the fingerprint of the collected tasks.
+
+    The fingerprint covers everything which determines the DAG: the signatures of
+    tasks and their dependencies and products, the ``after`` conditions of tasks, and
+    the keywords of tasks if ``after`` expressions are used.
+
+    Returns
+    -------
+    tuple[str, dict[str, DAGEntry]]
+        The fingerprint and a mapping from signatures to tasks and nodes in the order in
+        which they are added to the DAG.
+
+    """
+    hash_ = hashlib.sha256()
+    entries: dict[str, DAGEntry] = {}
+
+    def _update(kind: str, signature: str, entry: DAGEntry) -> None:
+        entries[signature] = entry
+        hash_.update(f"{kind}{signature}\0".encode())
+
+    task_by_collection_id = {
+        task.attributes["collection_id"]: task
+        for task in tasks
+        if task.attributes.get("collection_id") is not None
+    }
+    uses_expressions = any(
+        isinstance(task.attributes.get("after"), str) for task in tasks
+    )
+
+    for task in tasks:
+        _update("t", task.signature, task)
+        for node in tree_leaves(task.depends_on):  # type: ignore[arg-type]
+            _update("d", node.signature, node)
+            if isinstance(node, PythonNode) and isinstance(node.value, PythonNode):
+                _update("v", node.value.signature, node.value)
+        for node in tree_leaves(task.produces):  # type: ignore[arg-type]
+            _update("p", node.signature, node)
+
+        after = task.attributes.get("after")
+        if isinstance(after, list):
+            after = [task_by_collection_id[id_].signature for id_ in after]
+        hash_.update(f"a{after!r}\0".encode())
+        if uses_expressions:
+            keywords = sorted(KeywordMatcher.from_task(task)._names)
+            hash_.update(f"k{keywords!r}\0".encode())
+
+    return hash_.hexdigest(), entries
+
+
+def read_snapshot(path: Path) -> DagSnapshot | None:
+    """Read a snapshot and discard it if it is corrupt or outdated."""
+    if not path.exists():
+        return None
+    try:
+        snapshot = msgspec.json.decode(path.read_bytes(), type=DagSnapshot)
+    except msgspec.DecodeError:
+        path.unlink()
+        return None
+    if snapshot.version != CURRENT_SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def write_snapshot(path: Path, dag: DAG, fingerprint: str, root: Path) -> None:
+    """Write the snapshot of a DAG.
+
+    Nothing is written if custom nodes do not use strings as signatures.
+
+    """
+    position = {signature: i for i, signature in enumerate(dag.nodes)}
+    if not all(type(signature) is str for signature in position):
+        return
+    ids = []
+    for entry in dag.nodes.values():
+        if isinstance(entry, PTask):
+            ids.append(build_portable_task_id(entry, root))
+        elif isinstance(entry, PNode):
+            ids.append(build_portable_node_id(entry, root))
+        else:
+            ids.append(entry.name)
+    edges = [
+        i
+        for signature, source in position.items()
+        for successor in dag.successors(signature)
+        for i in (source, position[successor])
+    ]
+    snapshot = DagSnapshot(
+        version=CURRENT_SNAPSHOT_VERSION,
+        fingerprint=fingerprint,
+        nodes=list(position),
+        ids=ids,
+        edges=edges,
+    )
+    tmp = path.with_suffix(f"{path.suffix}.tmp")
+    tmp.write_bytes(msgspec.json.encode(snapshot))
+    tmp.replace(path)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import itertools
 from typing import TYPE_CHECKING
 
+from _pytask.mark_utils import has_mark
 from _pytask.node_protocols import PTask
 
 if TYPE_CHECKING:
@@ -12,14 +13,17 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from _pytask.dag_graph import DAG
+    from _pytask.mark import Mark
 
 
 __all__ = [
     "descending_tasks",
+    "mark_descending_tasks",
     "node_and_neighbors",
     "preceding_tasks",
     "task_and_descending_tasks",
     "task_and_preceding_tasks",
+    "tasks_and_preceding_tasks",
 ]
 
 
@@ -36,6 +40,38 @@ def task_and_descending_tasks(task_name: str, dag: DAG) -> Generator[str, None,
     yield from descending_tasks(task_name, dag)
 
 
+def mark_descending_tasks(task_name: str, dag: DAG, mark: Mark) -> int:
+    """Attach a mark to all descending tasks which do not carry it yet.
+
+    The same mark is shared by all descending tasks. A task which already carries a
+    mark with the same name received it from an earlier propagation together with its
+    descendants or propagates it itself when it is executed. Its subtree is not
+    visited again.
+
+    Returns
+    -------
+    int
+        The number of tasks which received the mark.
+
+    """
+    n_marked = 0
+    visited = {task_name}
+    stack = [task_name]
+    while stack:
+        for successor in dag.successors(stack.pop()):
+            if successor in visited:
+                continue
+            visited.add(successor)
+            node = dag.nodes[successor]
+            if isinstance(node, PTask):
+                if has_mark(node, mark.name):
+                    continue
+                node.markers.append(mark)
+                n_marked += 1
+            stack.append(successor)
+    return n_marked
+
+
 def preceding_tasks(task_name: str, dag: DAG) -> Generator[str, None, None]:
     """Yield only preceding tasks."""
     for ancestor in dag.ancestors(task_name):
@@ -49,6 +85,16 @@ def task_and_preceding_tasks(task_name: str, dag: DAG) -> Generator[str, None, N
     yield from preceding_tasks(task_name, dag)
 
 
+def tasks_and_preceding_tasks(task_names: Iterable[str], dag: DAG) -> set[str]:
+    """Return tasks and all their preceding tasks with a single traversal."""
+    task_names = set(task_names)
+    return task_names | {
+        ancestor
+        for ancestor in dag.ancestors_of_nodes(task_names)
+        if isinstance(dag.nodes[ancestor], PTask)
+    }
+
+
 def node_and_neighbors(dag: DAG, node: str) -> Iterable[str]:
     """Yield node and neighbors which are first degree predecessors and successors.
 
@@ -6,6 +6,7 @@ The data catalog is an abstraction layer between users and nodes.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import inspect
 import pickle
@@ -62,6 +63,8 @@ def _is_path_node_type(
     node_type: _NodeFactory | _PathNodeFactory,
 ) -> bool:
     """Return True if the class looks like a path-based node."""
+    if isinstance(node_type, functools.partial):
+        return _is_path_node_type(node_type.func)
     for cls in node_type.__mro__:
         if "path" in getattr(cls, "__annotations__", {}):
             return True
@@ -77,7 +80,10 @@ class DataCatalog:
     default_node
         A default node for loading and saving values. By default,
         [`pytask.PickleNode`][] is used to serialize any Python object with the
-        `pickle` module.
+        `pickle` module. Use
+        [functools.partial](https://docs.python.org/3/library/functools.html#functools.partial)
+        to pass options to the default node, for example,
+        ``partial(PickleNode, compression="lzma")``.
     name
         The name of the data catalog which can only contain letters, numbers, hyphens
         and underscores. Use it when you are working with multiple data catalogs to
@@ -18,7 +18,7 @@ from _pytask.console import create_url_style_for_task
 from _pytask.console import format_node_name
 from _pytask.console import format_strings_as_flat_tree
 from _pytask.console import unify_styles
-from _pytask.dag_utils import descending_tasks
+from _pytask.dag_utils import mark_descending_tasks
 from _pytask.dag_utils import node_and_neighbors
 from _pytask.exceptions import ExecutionError
 from _pytask.exceptions import NodeLoadError
@@ -29,7 +29,10 @@ from _pytask.explain import ReasonType
 from _pytask.explain import TaskExplanation
 from _pytask.explain import create_change_reason
 from _pytask.mark import Mark
+from _pytask.mark_utils import get_marks
 from _pytask.mark_utils import has_mark
+from _pytask.memory import format_size
+from _pytask.memory import get_peak_memory
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PPathNode
 from _pytask.node_protocols import PProvisionalNode
@@ -44,6 +47,7 @@ from _pytask.pluginmanager import hookimpl
 from _pytask.provisional_utils import collect_provisional_products
 from _pytask.reports import ExecutionReport
 from _pytask.scheduler import SimpleScheduler
+from _pytask.staleness import find_unchanged_tasks
 from _pytask.state import get_node_change_info
 from _pytask.state import has_node_changed
 from _pytask.state import update_states
@@ -55,6 +59,7 @@ from _pytask.typing import is_task_generator
 
 if TYPE_CHECKING:
     from _pytask.session import Session
+    from _pytask.value_cache import ValueCache
 
 
 @hookimpl
@@ -88,6 +93,7 @@ def pytask_execute_log_start(session: Session) -> None:
 def pytask_execute_build(session: Session) -> bool | None:
     """Execute tasks."""
     if session.scheduler is not None:
+        _skip_unchanged_tasks(session)
         while session.scheduler.is_active():
             task_name = session.scheduler.get_ready()[0]
             task = session.dag.nodes[task_name]
@@ -106,6 +112,34 @@ def pytask_execute_build(session: Session) -> bool | None:
     return None
 
 
+def _skip_unchanged_tasks(session: Session) -> None:
+    """Skip unchanged tasks without following the protocol for each task.
+
+    The tasks are found by one pass over the whole DAG before the execution. Their
+    states are the same as in the lockfile and do not need to be updated. The reports
+    are processed and logged like the reports of tasks skipped during the execution.
+
+    """
+    assert session.scheduler is not None
+    unchanged = find_unchanged_tasks(session)
+    if not unchanged:
+        return
+    for signature, task in session.dag.nodes.items():
+        if signature in unchanged:
+            assert isinstance(task, PTask)
+            report = ExecutionReport(
+                task=task,
+                outcome=TaskOutcome.SKIP_UNCHANGED,
+                exc_info=(SkippedUnchanged, SkippedUnchanged(), None),
+            )
+            session.hook.pytask_execute_task_process_report(
+                session=session, report=report
+            )
+            session.hook.pytask_execute_task_log_end(session=session, report=report)
+            session.execution_reports.append(report)
+    session.scheduler.done(*unchanged)
+
+
 @hookimpl
 def pytask_execute_task_protocol(session: Session, task: PTask) -> ExecutionReport:
     """Follow the protocol to execute each task."""
@@ -143,7 +177,7 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:  # noqa: C
     if has_mark(task, "would_be_executed"):
         # Add cascade reason if in explain mode
         if session.config["explain"] and "explanation" in task.attributes:
-            marks = [m for m in task.markers if m.name == "would_be_executed"]
+            marks = get_marks(task, "would_be_executed")
             if marks:
                 preceding_task_name = marks[0].kwargs.get("task_name", "unknown")
                 task.attributes["explanation"].reasons.append(
@@ -261,8 +295,16 @@ def pytask_execute_task_setup(session: Session, task: PTask) -> None:  # noqa: C
             node.root_dir.mkdir(parents=True, exist_ok=True)
 
 
-def _safe_load(node: PNode | PProvisionalNode, task: PTask, *, is_product: bool) -> Any:
+def _safe_load(
+    node: PNode | PProvisionalNode,
+    task: PTask,
+    *,
+    is_product: bool,
+    value_cache: ValueCache | None = None,
+) -> Any:
     try:
+        if value_cache is not None and not is_product and isinstance(node, PNode):
+            return value_cache.load(node)
         return node.load(is_product=is_product)
     except Exception as e:
         msg = f"Exception while loading node {node.name!r} of task {task.name!r}"
@@ -276,10 +318,14 @@ def pytask_execute_task(session: Session, task: PTask) -> bool:
         raise WouldBeExecuted
 
     parameters = inspect.signature(task.function).parameters
+    value_cache = session.config.get("value_cache")
 
     kwargs = {}
     for name, value in task.depends_on.items():
-        kwargs[name] = tree_map(lambda x: _safe_load(x, task, is_product=False), value)
+        kwargs[name] = tree_map(
+            lambda x: _safe_load(x, task, is_product=False, value_cache=value_cache),
+            value,
+        )
 
     for name, value in task.produces.items():
         if name in parameters:
@@ -347,38 +393,28 @@ def pytask_execute_task_process_report(
     elif report.exc_info and isinstance(report.exc_info[1], WouldBeExecuted):
         report.outcome = TaskOutcome.WOULD_BE_EXECUTED
 
-        for descending_task_name in descending_tasks(task.signature, session.dag):
-            descending_task = session.dag.nodes[descending_task_name]
-            if not isinstance(descending_task, PTask):
-                msg = (
-                    f"Expected descending task for signature {descending_task_name!r}."
-                )
-                raise TypeError(msg)
-            descending_task.markers.append(
-                Mark(
-                    "would_be_executed",
-                    (),
-                    {
-                        "reason": f"Previous task {task.name!r} would be executed.",
-                        "task_name": task.name,
-                    },
-                )
-            )
+        mark_descending_tasks(
+            task.signature,
+            session.dag,
+            Mark(
+                "would_be_executed",
+                (),
+                {
+                    "reason": f"Previous task {task.name!r} would be executed.",
+                    "task_name": task.name,
+                },
+            ),
+        )
     else:
-        for descending_task_name in descending_tasks(task.signature, session.dag):
-            descending_task = session.dag.nodes[descending_task_name]
-            if not isinstance(descending_task, PTask):
-                msg = (
-                    f"Expected descending task for signature {descending_task_name!r}."
-                )
-                raise TypeError(msg)
-            descending_task.markers.append(
-                Mark(
-                    "skip_ancestor_failed",
-                    (),
-                    {"reason": f"Previous task {task.name!r} failed."},
-                )
-            )
+        mark_descending_tasks(
+            task.signature,
+            session.dag,
+            Mark(
+                "skip_ancestor_failed",
+                (),
+                {"reason": f"Previous task {task.name!r} failed."},
+            ),
+        )
 
         session.n_tasks_failed += 1
         if session.n_tasks_failed >= session.config["max_failures"]:
@@ -443,6 +479,10 @@ def pytask_execute_log_end(session: Session, reports: list[ExecutionReport]) ->
     panel = create_summary_panel(counts, TaskOutcome, description_total)
     console.print(panel)
 
+    peak_memory = get_peak_memory()
+    if peak_memory is not None and session.config["verbose"] >= 1:
+        console.print(f"Peak memory: {format_size(peak_memory)}", style="dim")
+
     session.hook.pytask_log_session_footer(
         session=session,
         duration=session.execution_end - session.execution_start,
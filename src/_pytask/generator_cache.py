@@ -0,0 +1,231 @@
+"""Cache the tasks created by task generators.
+
+Task generators are executed in every build because the tasks they create only exist in
+memory. With ``@task(is_generator=True, cache=True)``, pytask stores a specification of
+the created tasks in ``.pytask/generators`` after the generator is executed. The
+specifications are keyed by the states of the generator and its dependencies. If the
+key is unchanged in a later build, the tasks are recreated from the specifications
+without executing the generator.
+
+A specification of a task consists of its function and its metadata. Functions defined
+inside the generator cannot be pickled. They are stored as the location of their code
+in the generator and the values of their defaults, closures, and annotations. All other
+functions and the metadata are pickled. If anything cannot be pickled, the generator is
+executed in every build as usual.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import pickle
+import types
+from dataclasses import dataclass
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from typing import Any
+
+from _pytask.artifact_cache import _atomic_write
+from _pytask.artifact_cache import compute_task_key
+from _pytask.lockfile import build_portable_task_id
+from _pytask.pluginmanager import hookimpl
+from _pytask.typing import attach_task_metadata
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from _pytask.node_protocols import PTask
+    from _pytask.session import Session
+    from _pytask.task_utils import TaskFunction
+
+
+__all__ = ["GeneratorCache"]
+
+
+CURRENT_GENERATOR_CACHE_VERSION = "1"
+
+
+@dataclass
+class _NestedFunction:
+    """The specification of a function which is defined inside a generator."""
+
+    qualname: str
+    defaults: tuple[Any, ...] | None
+    kwdefaults: dict[str, Any] | None
+    closure: tuple[Any, ...] | None
+    annotations: dict[str, Any]
+    attributes: dict[str, Any]
+
+
+@dataclass
+class GeneratorCache:
+    """A cache for the tasks created by task generators.
+
+    Attributes
+    ----------
+    path
+        The directory of the cache.
+    root
+        The root of the project which is used to build portable ids.
+
+    """
+
+    path: Path
+    root: Path
+
+    def compute_key(self, session: Session, task: PTask) -> str | None:
+        """Compute the key of a generator from its state and its dependencies."""
+        if not task.attributes.get("cache"):
+            return None
+        return compute_task_key(session, task, self.root)
+
+    def load(self, task: PTask, key: str) -> list[TaskFunction] | None:
+        """Recreate the functions of the tasks which were created by a generator.
+
+        Returns ``None`` if the cache does not contain the key.
+
+        """
+        try:
+            version, cached_key, specs = pickle.loads(  # noqa: S301
+                self._entry_path(task).read_bytes()
+            )
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            self._entry_path(task).unlink(missing_ok=True)
+            return None
+        if (version, cached_key) != (CURRENT_GENERATOR_CACHE_VERSION, key):
+            return None
+
+        functions = []
+        for spec, metadata in specs:
+            function = _load_function(task.function, spec)
+            if function is None:
+                return None
+            attach_task_metadata(function, metadata)
+            functions.append(function)
+        return functions
+
+    def store(self, task: PTask, key: str, functions: list[TaskFunction]) -> None:
+        """Store the specifications of the tasks which were created by a generator."""
+        specs = []
+        for function in functions:
+            spec = _dump_function(task.function, function)
+            if spec is None:
+                return
+            metadata = function.pytask_meta
+            # The annotations of nested functions are stored evaluated and the snapshot
+            # of the generator's locals, which often holds other tasks, is not needed.
+            if isinstance(spec, _NestedFunction):
+                metadata = replace(metadata, annotation_locals=None)
+            specs.append((spec, metadata))
+        try:
+            data = pickle.dumps(
+                (CURRENT_GENERATOR_CACHE_VERSION, key, specs),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:  # noqa: BLE001
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._entry_path(task), data)
+
+    def _entry_path(self, task: PTask) -> Path:
+        task_id = build_portable_task_id(task, self.root)
+        name = hashlib.sha256(task_id.encode()).hexdigest()
+        return self.path.joinpath(f"{name}.pickle")
+
+
+def _dump_function(
+    generator: Callable[..., Any], function: Callable[..., Any]
+) -> _NestedFunction | Callable[..., Any] | None:
+    """Create the specification of a function created by a generator."""
+    if (
+        not isinstance(function, types.FunctionType)
+        or _find_code(generator, function.__qualname__) is not function.__code__
+    ):
+        return function
+
+    try:
+        closure = tuple(cell.cell_contents for cell in function.__closure__ or ())
+        annotations = dict(inspect.get_annotations(function))
+    except Exception:  # noqa: BLE001
+        return None
+    return _NestedFunction(
+        qualname=function.__qualname__,
+        defaults=function.__defaults__,
+        kwdefaults=function.__kwdefaults__,
+        closure=closure if function.__closure__ else None,
+        annotations=annotations,
+        attributes={
+            key: value
+            for key, value in function.__dict__.items()
+            if key not in ("pytask_meta", "__signature__")
+        },
+    )
+
+
+def _load_function(
+    generator: Callable[..., Any], spec: _NestedFunction | Callable[..., Any]
+) -> Callable[..., Any] | None:
+    """Recreate a function created by a generator from its specification."""
+    if not isinstance(spec, _NestedFunction):
+        return spec
+
+    code = _find_code(generator, spec.qualname)
+    if code is None:
+        return None
+    closure = (
+        tuple(types.CellType(value) for value in spec.closure)
+        if spec.closure is not None
+        else None
+    )
+    unwrapped = inspect.unwrap(generator)
+    function = types.FunctionType(
+        code, unwrapped.__globals__, code.co_name, spec.defaults, closure
+    )
+    function.__kwdefaults__ = spec.kwdefaults
+    function.__qualname__ = spec.qualname
+    function.__module__ = unwrapped.__module__
+    function.__annotations__ = spec.annotations
+    function.__dict__.update(spec.attributes)
+    return function
+
+
+def _find_code(generator: Callable[..., Any], qualname: str) -> types.CodeType | None:
+    """Find the code of a function defined inside a generator by its qualified name."""
+    unwrapped = inspect.unwrap(generator)
+    if isinstance(unwrapped, functools.partial):
+        unwrapped = unwrapped.func
+    code = getattr(unwrapped, "__code__", None)
+    if code is None or not qualname.startswith(f"{unwrapped.__qualname__}.<locals>."):
+        return None
+
+    names = qualname[len(unwrapped.__qualname__) + 1 :].split(".")
+    if len(names) % 2:
+        return None
+    for marker, name in zip(names[::2], names[1::2], strict=True):
+        if marker != "<locals>":
+            return None
+        code = next(
+            (
+                const
+                for const in code.co_consts
+                if isinstance(const, types.CodeType) and const.co_name == name
+            ),
+            None,
+        )
+        if code is None:
+            return None
+    return code
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Initialize the cache for task generators."""
+    if config.get("command") in (None, "build"):
+        config["generator_cache"] = GeneratorCache(
+            path=config["root"] / ".pytask" / "generators", root=config["root"]
+        )
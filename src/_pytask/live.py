@@ -180,6 +180,14 @@ class _ReportEntry(NamedTuple):
     task: PTask
 
 
+_HIDDEN_OUTCOMES = (
+    TaskOutcome.SKIP,
+    TaskOutcome.SKIP_UNCHANGED,
+    TaskOutcome.SKIP_PREVIOUS_FAILED,
+    TaskOutcome.PERSISTENCE,
+)
+
+
 @dataclass(eq=False, kw_only=True)
 class LiveExecution:
     """A class for managing the table displaying task progress during the execution."""
@@ -193,6 +201,7 @@ class LiveExecution:
     render_immediately: bool = True
     n_tasks: int | str = "x"
     _reports: list[_ReportEntry] = field(default_factory=list)
+    _visible_reports: list[_ReportEntry] = field(default_factory=list)
     _running_tasks: dict[str, _TaskEntry] = field(default_factory=dict)
 
     @hookimpl(wrapper=True)
@@ -234,20 +243,7 @@ class LiveExecution:
         """
         n_reports_to_display = self.n_entries_in_table - len(self._running_tasks)
 
-        if self.verbose < 2:  # noqa: PLR2004
-            reports = [
-                report
-                for report in self._reports
-                if report.outcome
-                not in (
-                    TaskOutcome.SKIP,
-                    TaskOutcome.SKIP_UNCHANGED,
-                    TaskOutcome.SKIP_PREVIOUS_FAILED,
-                    TaskOutcome.PERSISTENCE,
-                )
-            ]
-        else:
-            reports = self._reports
+        reports = self._reports if self.verbose >= 2 else self._visible_reports  # noqa: PLR2004
 
         if not reduce_table:
             relevant_reports = reports
@@ -257,7 +253,7 @@ class LiveExecution:
             relevant_reports = []
 
         if sort_table:
-            relevant_reports.sort(key=lambda report: report.name)
+            relevant_reports = sorted(relevant_reports, key=lambda report: report.name)
 
         table: Table | None
         if add_caption:
@@ -321,14 +317,14 @@ class LiveExecution:
 
     def update_report(self, new_report: ExecutionReport) -> None:
         """Update the status of a running task by adding its report."""
-        self._running_tasks.pop(new_report.task.signature)
-        self._reports.append(
-            _ReportEntry(
-                name=new_report.task.name,
-                outcome=new_report.outcome,
-                task=new_report.task,
-            )
+        self._running_tasks.pop(new_report.task.signature, None)
+        entry = _ReportEntry(
+            name=new_report.task.name, outcome=new_report.outcome, task=new_report.task
         )
+        self._reports.append(entry)
+        # Reports of skipped tasks are only displayed with a higher verbosity.
+        if entry.outcome not in _HIDDEN_OUTCOMES:
+            self._visible_reports.append(entry)
         if self.render_immediately:
             self._update_table()
 
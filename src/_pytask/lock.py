@@ -84,7 +84,8 @@ def _expression_filter(
     }
 
 
-def _select_tasks_exact(session: Session) -> list[PTask]:
+def select_tasks_exact(session: Session) -> list[PTask]:
+    """Select the tasks matching ``-k`` and ``-m`` without their preceding tasks."""
     selected = {task.signature for task in session.tasks}
 
     expression = session.config.get("expression")
@@ -103,7 +104,7 @@ def _select_tasks_exact(session: Session) -> list[PTask]:
 
 
 def _select_tasks_with_ancestors(session: Session) -> list[PTask]:
-    selected = {task.signature for task in _select_tasks_exact(session)}
+    selected = {task.signature for task in select_tasks_exact(session)}
     selected |= set(
         chain.from_iterable(
             task_and_preceding_tasks(signature, session.dag) for signature in selected
@@ -175,7 +176,7 @@ def _plan_reset_changes(session: Session) -> list[_PlannedChange]:
     root = session.config["root"]
     planned_changes = []
 
-    for task in _select_tasks_exact(session):
+    for task in select_tasks_exact(session):
         task_id = build_portable_task_id(task, root)
         if session.config["lockfile_state"].get_task_entry(task_id) is not None:
             planned_changes.append(_PlannedChange(task_id=task_id))
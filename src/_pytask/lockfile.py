@@ -61,11 +61,11 @@ class _JournalEntry(msgspec.Struct):
 
 
 def _should_initialize_lockfile_state(command: str | None) -> bool:
-    return command in (None, "build", "lock")
+    return command in (None, "build", "lock", "status")
 
 
 def _should_validate_lockfile_ids(command: str | None) -> bool:
-    return command in (None, "build", "collect", "lock")
+    return command in (None, "build", "collect", "lock", "status")
 
 
 def _encode_node_path(path: tuple[str | int, ...]) -> str:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -13,7 +14,7 @@ from rich.table import Table
 from _pytask.click import ColoredCommand
 from _pytask.click import get_command
 from _pytask.console import console
-from _pytask.dag_utils import task_and_preceding_tasks
+from _pytask.dag_utils import tasks_and_preceding_tasks
 from _pytask.exceptions import ConfigurationError
 from _pytask.mark.expression import Expression
 from _pytask.mark.expression import ParseError
@@ -28,6 +29,7 @@ from _pytask.session import Session
 from _pytask.shared import parse_markers
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from collections.abc import Set as AbstractSet
     from typing import NoReturn
 
@@ -43,6 +45,7 @@ __all__ = [
     "MarkGenerator",
     "ParseError",
     "select_by_after_keyword",
+    "select_by_after_keywords",
     "select_by_keyword",
     "select_by_mark",
     "select_tasks_by_marks_and_expressions",
@@ -102,7 +105,14 @@ def pytask_extend_command_line_interface(cli: click.Group) -> None:
             default=None,
         ),
     ]
-    for command in ("build", "clean", "collect", "lock accept", "lock reset"):
+    for command in (
+        "build",
+        "clean",
+        "collect",
+        "lock accept",
+        "lock reset",
+        "status",
+    ):
         target = get_command(cli, command)
         target.params.extend(additional_build_parameters)
 
@@ -140,6 +150,10 @@ class KeywordMatcher:
     """
 
     _names: AbstractSet[str]
+    _lowered_names: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._lowered_names = tuple(name.lower() for name in self._names)
 
     @classmethod
     def from_task(cls, task: PTask) -> KeywordMatcher:
@@ -155,9 +169,7 @@ class KeywordMatcher:
 
     def __call__(self, subname: str) -> bool:
         subname = subname.lower()
-        names = (name.lower() for name in self._names)
-
-        return any(subname in name for name in names)
+        return any(subname in name for name in self._lowered_names)
 
 
 def select_by_keyword(session: Session, dag: DAG) -> set[str] | None:
@@ -172,29 +184,54 @@ def select_by_keyword(session: Session, dag: DAG) -> set[str] | None:
         msg = f"Wrong expression passed to '-k': {keywordexpr}: {e}"
         raise ValueError(msg) from None
 
-    remaining: set[str] = set()
-    for task in session.tasks:
-        if keywordexpr and expression.evaluate(KeywordMatcher.from_task(task)):
-            remaining.update(task_and_preceding_tasks(task.signature, dag))
-
-    return remaining
+    selected = [
+        task.signature
+        for task in session.tasks
+        if expression.evaluate(KeywordMatcher.from_task(task))
+    ]
+    return tasks_and_preceding_tasks(selected, dag)
 
 
 def select_by_after_keyword(session: Session, after: str) -> set[str]:
     """Select tasks defined by the after keyword."""
+    return select_by_after_keywords(session, [after])[after]
+
+
+def select_by_after_keywords(
+    session: Session, afters: Iterable[str]
+) -> dict[str, set[str]]:
+    """Select tasks for multiple after keywords at once.
+
+    Every distinct expression is compiled and evaluated once and the matchers for tasks
+    are created once for all expressions.
+
+    """
+    expressions = {
+        after: _compile_after_expression(after) for after in dict.fromkeys(afters)
+    }
+    if not expressions:
+        return {}
+
+    matchers = [
+        (task.signature, KeywordMatcher.from_task(task)) for task in session.tasks
+    ]
+    return {
+        after: {
+            signature
+            for signature, matcher in matchers
+            if after and expression.evaluate(matcher)
+        }
+        for after, expression in expressions.items()
+    }
+
+
+def _compile_after_expression(after: str) -> Expression:
     try:
-        expression = Expression.compile_(after)
+        return Expression.compile_(after)
     except ParseError as e:
         msg = f"Wrong expression passed to 'after': {after}: {e}"
         raise ValueError(msg) from None
 
-    ancestors: set[str] = set()
-    for task in session.tasks:
-        if after and expression.evaluate(KeywordMatcher.from_task(task)):
-            ancestors.add(task.signature)
-
-    return ancestors
-
 
 @dataclass(slots=True)
 class MarkMatcher:
@@ -227,21 +264,21 @@ def select_by_mark(session: Session, dag: DAG) -> set[str] | None:
         msg = f"Wrong expression passed to '-m': {matchexpr}: {e}"
         raise ValueError(msg) from None
 
-    remaining: set[str] = set()
-    for task in session.tasks:
-        if expression.evaluate(MarkMatcher.from_task(task)):
-            remaining.update(task_and_preceding_tasks(task.signature, dag))
-
-    return remaining
+    selected = [
+        task.signature
+        for task in session.tasks
+        if expression.evaluate(MarkMatcher.from_task(task))
+    ]
+    return tasks_and_preceding_tasks(selected, dag)
 
 
 def _deselect_others_with_mark(
     session: Session, remaining: set[str], mark: Mark
 ) -> None:
     """Deselect tasks."""
-    for task in session.tasks:
-        if task.signature not in remaining:
-            task.markers.append(mark)
+    signature_to_task = {task.signature: task for task in session.tasks}
+    for signature in signature_to_task.keys() - remaining:
+        signature_to_task[signature].markers.append(mark)
 
 
 def select_tasks_by_marks_and_expressions(session: Session, dag: DAG) -> None:
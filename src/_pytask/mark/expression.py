@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import ast
 import enum
+import functools
 import re
 from collections.abc import Callable
 from collections.abc import Iterator
@@ -220,13 +221,7 @@ class Expression:
             The input expression - one line.
 
         """
-        astexpr = expression(Scanner(input_))
-        code: types.CodeType = compile(
-            astexpr,
-            filename="<pytask match expression>",
-            mode="eval",
-        )
-        return cls(code)
+        return cls(_compile(input_))
 
     def evaluate(self, matcher: Callable[[str], bool]) -> bool:
         """Evaluate the match expression.
@@ -247,3 +242,15 @@ class Expression:
             self.code, {"__builtins__": {}}, MatcherAdapter(matcher)
         )
         return ret
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(input_: str) -> types.CodeType:
+    """Compile a match expression.
+
+    The same expressions are compiled many times, for example, when many tasks use the
+    same ``@task(after=...)``. The code is cached since it does not depend on the task.
+
+    """
+    astexpr = expression(Scanner(input_))
+    return compile(astexpr, filename="<pytask match expression>", mode="eval")
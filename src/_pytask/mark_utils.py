@@ -8,6 +8,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import SupportsIndex
+
+from typing_extensions import Self
 
 from _pytask.models import CollectionMetadata
 from _pytask.node_protocols import PTask
@@ -16,9 +19,94 @@ from _pytask.typing import attach_task_metadata
 from _pytask.typing import is_task_decorator_target
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from _pytask.mark import Mark
 
 
+class MarkerList(list["Mark"]):
+    """A list of markers with an index from marker names to markers.
+
+    Tasks are checked for markers like ``skip`` or ``would_be_executed`` many times
+    during a build. The index turns these checks into a dictionary lookup. It is kept in
+    sync when markers are appended, which is the common case, and rebuilt by all other
+    operations which modify the list.
+
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, marks: Iterable[Mark] = ()) -> None:
+        list.__init__(self, marks)
+        self._rebuild_index()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (list(self),)
+
+    def _rebuild_index(self) -> None:
+        self._index: dict[str, list[Mark]] = {}
+        for mark in self:
+            self._index.setdefault(mark.name, []).append(mark)
+
+    def get_marks(self, marker_name: str) -> list[Mark]:
+        """Return the markers with the name in the order they were added."""
+        return list(self._index.get(marker_name, ()))
+
+    def has_mark(self, marker_name: str) -> bool:
+        """Return whether a marker with the name exists."""
+        return marker_name in self._index
+
+    def append(self, mark: Mark) -> None:
+        list.append(self, mark)
+        self._index.setdefault(mark.name, []).append(mark)
+
+    def extend(self, marks: Iterable[Mark]) -> None:
+        for mark in marks:
+            self.append(mark)
+
+    def __iadd__(self, marks: Iterable[Mark]) -> Self:  # type: ignore[override]
+        self.extend(marks)
+        return self
+
+    def __imul__(self, n: SupportsIndex) -> Self:
+        list.__imul__(self, n)
+        self._rebuild_index()
+        return self
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        list.__setitem__(self, key, value)
+        self._rebuild_index()
+
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        list.__delitem__(self, key)
+        self._rebuild_index()
+
+    def insert(self, index: SupportsIndex, mark: Mark) -> None:
+        list.insert(self, index, mark)
+        self._rebuild_index()
+
+    def remove(self, mark: Mark) -> None:
+        list.remove(self, mark)
+        self._rebuild_index()
+
+    def pop(self, index: SupportsIndex = -1) -> Mark:
+        mark = list.pop(self, index)
+        self._rebuild_index()
+        return mark
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._index.clear()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._rebuild_index()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        list.sort(self, *args, **kwargs)
+        self._rebuild_index()
+
+
 def get_all_marks(obj_or_task: Any | PTask) -> list[Mark]:
     """Get all marks from a callable or task."""
     if isinstance(obj_or_task, PTask):
@@ -30,7 +118,7 @@ def get_all_marks(obj_or_task: Any | PTask) -> list[Mark]:
 def set_marks(obj_or_task: Any | PTask, marks: list[Mark]) -> Any | PTask:
     """Set marks on a callable or task."""
     if isinstance(obj_or_task, PTask):
-        obj_or_task.markers = marks
+        obj_or_task.markers = MarkerList(marks)
     elif isinstance(obj_or_task, TaskFunction):
         obj_or_task.pytask_meta.markers = marks
     else:
@@ -44,12 +132,16 @@ def set_marks(obj_or_task: Any | PTask, marks: list[Mark]) -> Any | PTask:
 def get_marks(obj_or_task: Any | PTask, marker_name: str) -> list[Mark]:
     """Get marks from callable or task."""
     marks = get_all_marks(obj_or_task)
+    if isinstance(marks, MarkerList):
+        return marks.get_marks(marker_name)
     return [mark for mark in marks if mark.name == marker_name]
 
 
 def has_mark(obj_or_task: Any | PTask, marker_name: str) -> bool:
     """Test if callable or task has a certain mark."""
     marks = get_all_marks(obj_or_task)
+    if isinstance(marks, MarkerList):
+        return marks.has_mark(marker_name)
     return any(mark.name == marker_name for mark in marks)
 
 
@@ -0,0 +1,228 @@
+"""Memoize the return values of tasks across builds.
+
+Products which are [`PythonNode`][pytask.PythonNode]s only exist in memory, so tasks
+which produce them are executed in every build. With ``@task(cache=True)``, the values
+of these products are pickled into a content-addressed store in ``.pytask/memoize``
+after the task is executed. The store is keyed by the states of the task and its
+dependencies.
+
+In a later build with the same key, the task is not executed. Its products receive
+[`LazyValue`][_pytask.nodes.LazyValue]s which know the states and the digests of the
+products and load the values only when a downstream task uses them. Since the digests
+are known, downstream tasks with ``cache=True`` are memoized without loading the values.
+
+The store keeps one entry per task. When an entry is replaced, objects which are not
+referenced by other entries are removed.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+import msgspec
+
+from _pytask.artifact_cache import _atomic_write
+from _pytask.artifact_cache import _unlink
+from _pytask.artifact_cache import compute_task_key
+from _pytask.console import console
+from _pytask.lockfile import build_portable_node_id
+from _pytask.lockfile import build_portable_task_id
+from _pytask.nodes import LazyValue
+from _pytask.nodes import PythonNode
+from _pytask.nodes import get_state_of_arguments
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.tree_util import tree_leaves
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytask.node_protocols import PTask
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+
+
+__all__ = ["MemoizationStore"]
+
+
+class _Product(msgspec.Struct):
+    digest: str
+    state: str | None
+    value_digest: str | None = None
+
+
+class _MemoEntry(msgspec.Struct):
+    key: str
+    products: dict[str, _Product]
+
+
+@dataclass
+class MemoizationStore:
+    """A store for the return values of memoized tasks.
+
+    Attributes
+    ----------
+    path
+        The directory of the store.
+    root
+        The root of the project which is used to build portable ids.
+
+    """
+
+    path: Path
+    root: Path
+
+    def restore(self, task: PTask, key: str) -> bool:
+        """Assign lazily loaded values to the products of a task.
+
+        Returns ``False`` if the store does not contain the key.
+
+        """
+        entry = self._read_entry(task)
+        if entry is None or entry.key != key:
+            return False
+
+        products = _get_products(task, self.root)
+        if products is None or set(products) != set(entry.products):
+            return False
+        if not all(
+            self._object_path(p.digest).exists() for p in entry.products.values()
+        ):
+            return False
+
+        for node_id, node in products.items():
+            product = entry.products[node_id]
+            loader = partial(_load_object, self._object_path(product.digest))
+            node.save(
+                LazyValue(
+                    loader=loader, state=product.state, digest=product.value_digest
+                )
+            )
+        return True
+
+    def store(self, task: PTask, key: str) -> None:
+        """Store the values of the products of a task."""
+        products = _get_products(task, self.root)
+        if products is None:
+            return
+
+        entries = {}
+        for node_id, node in products.items():
+            value = node.load()
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                msg = (
+                    f"The return value of the task {task.name!r} is not memoized "
+                    f"because it cannot be pickled: {e}"
+                )
+                console.print(msg, style="warning")
+                return
+            digest = hashlib.sha256(data).hexdigest()
+            object_path = self._object_path(digest)
+            if not object_path.exists():
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write(object_path, data)
+            entries[node_id] = _Product(
+                digest=digest,
+                state=node.state(),
+                value_digest=get_state_of_arguments(value),
+            )
+
+        old_entry = self._read_entry(task)
+        entry_path = self._entry_path(task)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(entry_path, msgspec.json.encode(_MemoEntry(key, entries)))
+        if old_entry is not None:
+            self._remove_unreferenced_objects(old_entry)
+
+    def _remove_unreferenced_objects(self, entry: _MemoEntry) -> None:
+        digests = {product.digest for product in entry.products.values()}
+        for path in self.path.joinpath("entries").iterdir():
+            try:
+                other = msgspec.json.decode(path.read_bytes(), type=_MemoEntry)
+            except (OSError, msgspec.DecodeError):
+                continue
+            digests -= {product.digest for product in other.products.values()}
+        for digest in digests:
+            _unlink(self._object_path(digest))
+
+    def _read_entry(self, task: PTask) -> _MemoEntry | None:
+        entry_path = self._entry_path(task)
+        try:
+            return msgspec.json.decode(entry_path.read_bytes(), type=_MemoEntry)
+        except FileNotFoundError:
+            return None
+        except msgspec.DecodeError:
+            entry_path.unlink(missing_ok=True)
+            return None
+
+    def _entry_path(self, task: PTask) -> Path:
+        task_id = build_portable_task_id(task, self.root)
+        name = hashlib.sha256(task_id.encode()).hexdigest()
+        return self.path.joinpath("entries", f"{name}.json")
+
+    def _object_path(self, digest: str) -> Path:
+        return self.path.joinpath("objects", digest[:2], digest)
+
+
+def _get_products(task: PTask, root: Path) -> dict[str, PythonNode] | None:
+    """Get the products of a task if all of them are Python nodes."""
+    products = tree_leaves(task.produces)  # type: ignore[arg-type]
+    if not products or not all(isinstance(node, PythonNode) for node in products):
+        return None
+    return {build_portable_node_id(node, root): node for node in products}
+
+
+def _load_object(path: Path) -> Any:
+    with path.open("rb") as f:
+        return pickle.load(f)  # noqa: S301
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Initialize the store for memoized tasks."""
+    if config.get("command") in (None, "build"):
+        config["memoization_store"] = MemoizationStore(
+            path=config["root"] / ".pytask" / "memoize", root=config["root"]
+        )
+
+
+@hookimpl(tryfirst=True)
+def pytask_execute_task(session: Session, task: PTask) -> bool | None:
+    """Assign memoized values to the products instead of executing the task."""
+    store: MemoizationStore | None = session.config.get("memoization_store")
+    if (
+        store is None
+        or not task.attributes.get("cache")
+        or session.config["dry_run"]
+        or session.config["explain"]
+        or _get_products(task, store.root) is None
+    ):
+        return None
+    key = compute_task_key(session, task, store.root)
+    if key is None:
+        return None
+    if store.restore(task, key):
+        return True
+    task.attributes["memoization_key"] = key
+    return None
+
+
+@hookimpl
+def pytask_execute_task_process_report(
+    session: Session, report: ExecutionReport
+) -> None:
+    """Store the values of products of successful memoized tasks."""
+    store: MemoizationStore | None = session.config.get("memoization_store")
+    if store is None or report.outcome != TaskOutcome.SUCCESS:
+        return
+    key = report.task.attributes.pop("memoization_key", None)
+    if key is not None:
+        store.store(report.task, key)
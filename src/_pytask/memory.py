@@ -0,0 +1,334 @@
+"""Release in-memory values which are not needed anymore and report memory usage.
+
+Values of [`PythonNode`][pytask.PythonNode]s which are products of tasks are held in
+memory for the whole build. pytask counts the tasks and nodes which depend on each node
+and releases the value of a product once the last of them has been processed. The
+values of products without dependent tasks, the final outputs, are kept. Values of
+dependencies in the cache of loaded values are removed from the cache at the same time.
+
+Set ``keep_values = true`` to keep all values, for example, to inspect them after
+calling [`pytask.build`][].
+
+With ``max_in_memory_bytes``, the values of products which are held in memory are
+limited to an estimated size. When the limit is exceeded after a task, the least
+recently used values are pickled to a scratch directory in ``.pytask/spill`` and
+replaced by [`LazyValue`][_pytask.nodes.LazyValue]s which load them again when a task
+needs them.
+
+"""
+
+from __future__ import annotations
+
+import pickle
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from _pytask.artifact_cache import parse_size
+from _pytask.node_protocols import PTask
+from _pytask.nodes import LazyValue
+from _pytask.nodes import PythonNode
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.tree_util import tree_leaves
+from _pytask.typing import no_default
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from _pytask.dag_graph import DAG
+    from _pytask.reports import ExecutionReport
+    from _pytask.session import Session
+    from _pytask.value_cache import ValueCache
+
+
+__all__ = [
+    "ValueReleaser",
+    "ValueSpiller",
+    "estimate_size",
+    "format_size",
+    "get_peak_memory",
+]
+
+
+_SIZE_UNITS = (("TB", 10**12), ("GB", 10**9), ("MB", 10**6), ("KB", 10**3))
+
+
+@dataclass
+class ValueReleaser:
+    """Release the values of nodes once all tasks depending on them are processed.
+
+    Attributes
+    ----------
+    remaining
+        A mapping from the signatures of nodes to the number of dependent tasks and
+        nodes which have not been processed.
+
+    """
+
+    remaining: dict[str, int]
+
+    @classmethod
+    def from_dag(cls, dag: DAG) -> ValueReleaser:
+        """Count the dependent tasks and nodes of all nodes in the DAG."""
+        remaining = {}
+        for signature, node in dag.nodes.items():
+            if isinstance(node, PTask):
+                continue
+            n_successors = sum(1 for _ in dag.successors(signature))
+            if n_successors:
+                remaining[signature] = n_successors
+        return cls(remaining=remaining)
+
+    def task_done(
+        self, dag: DAG, task: PTask, value_cache: ValueCache | None = None
+    ) -> list[str]:
+        """Release the values of the dependencies which are not needed anymore.
+
+        Nodes which are used by other nodes, like a product which is wrapped by the
+        dependency of another task, are released after all nodes using them. Returns
+        the signatures of the released nodes.
+
+        """
+        released = []
+        stack = list(dag.predecessors(task.signature))
+        while stack:
+            signature = stack.pop()
+            remaining = self.remaining.get(signature)
+            if remaining is None:
+                continue
+            if remaining > 1:
+                self.remaining[signature] = remaining - 1
+                continue
+
+            del self.remaining[signature]
+            if value_cache is not None:
+                value_cache.discard(signature)
+            predecessors = list(dag.predecessors(signature))
+            node = dag.nodes[signature]
+            # Values of nodes which are not products are defined by the user and are not
+            # released.
+            if isinstance(node, PythonNode) and predecessors:
+                node.value = no_default
+                released.append(signature)
+            stack.extend(p for p in predecessors if not isinstance(dag.nodes[p], PTask))
+        return released
+
+
+@dataclass
+class ValueSpiller:
+    """Spill the values of Python nodes to disk when they exceed a memory budget.
+
+    Attributes
+    ----------
+    path
+        The scratch directory for spilled values.
+    max_size
+        The maximum estimated size of the values held in memory in bytes.
+    size
+        The estimated size of the values held in memory in bytes. It includes values
+        which cannot be pickled and stay in memory.
+
+    """
+
+    path: Path
+    max_size: int
+    size: int = 0
+    _entries: OrderedDict[str, tuple[PythonNode, int]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _unspillable: set[str] = field(default_factory=set, repr=False)
+
+    def task_done(self, dag: DAG, task: PTask) -> None:
+        """Track the values used and produced by a task and enforce the budget."""
+        for node in tree_leaves(task.depends_on):  # type: ignore[arg-type]
+            self._track(dag, node)
+        for node in tree_leaves(task.produces):  # type: ignore[arg-type]
+            self._track(dag, node)
+        self._spill()
+
+    def discard(self, signature: str) -> None:
+        """Stop tracking the value of a node and remove its spilled value."""
+        entry = self._entries.pop(signature, None)
+        if entry is not None:
+            self.size -= entry[1]
+        self._unspillable.discard(signature)
+        self._spill_path(signature).unlink(missing_ok=True)
+
+    def _track(self, dag: DAG, node: Any) -> None:
+        # Dependencies may wrap the Python nodes which are products of other tasks.
+        while isinstance(node, PythonNode) and isinstance(node.value, PythonNode):
+            node = node.value
+        # Values of nodes which are not products are defined by the user and are not
+        # spilled.
+        if not isinstance(node, PythonNode) or not any(
+            True for _ in dag.predecessors(node.signature)
+        ):
+            return
+
+        entry = self._entries.pop(node.signature, None)
+        if entry is not None:
+            self.size -= entry[1]
+        if node.value is no_default or isinstance(node.value, LazyValue):
+            return
+        size = estimate_size(node.value)
+        self._entries[node.signature] = (node, size)
+        self.size += size
+
+    def _spill(self) -> None:
+        for signature in list(self._entries):
+            if self.size <= self.max_size:
+                break
+            # Values which cannot be pickled stay in memory and count towards the size.
+            if signature in self._unspillable:
+                continue
+            node, size = self._entries[signature]
+            path = self._spill_path(signature)
+            state = node.state()
+            try:
+                with path.open("wb") as f:
+                    pickle.dump(node.value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:  # noqa: BLE001
+                path.unlink(missing_ok=True)
+                self._unspillable.add(signature)
+                continue
+            del self._entries[signature]
+            self.size -= size
+            node.value = LazyValue(loader=partial(_load_spilled, path), state=state)
+
+    def _spill_path(self, signature: str) -> Path:
+        return self.path.joinpath(f"{signature}.pickle")
+
+
+def _load_spilled(path: Path) -> Any:
+    with path.open("rb") as f:
+        return pickle.load(f)  # noqa: S301
+
+
+def estimate_size(value: Any, _seen: set[int] | None = None) -> int:
+    """Estimate the size of a value in memory in bytes.
+
+    Arrays and data frames report their size. The sizes of lists, tuples, sets, and
+    dictionaries include the sizes of their items.
+
+    Examples
+    --------
+    >>> estimate_size(b"x" * 1000) >= 1000
+    True
+
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        with suppress(TypeError, ValueError):
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        seen = set() if _seen is None else _seen
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+        items = [*value.keys(), *value.values()] if isinstance(value, dict) else value
+        size += sum(estimate_size(item, seen) for item in items)
+    return size
+
+
+def get_peak_memory() -> int | None:
+    """Return the peak resident memory of the process in bytes.
+
+    Returns ``None`` on platforms without the :mod:`resource` module like Windows.
+
+    """
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes and Linux reports kilobytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def format_size(size: int) -> str:
+    """Format a number of bytes with a unit.
+
+    Examples
+    --------
+    >>> format_size(1_500_000)
+    '1.5 MB'
+    >>> format_size(512)
+    '512 B'
+
+    """
+    for unit, factor in _SIZE_UNITS:
+        if size >= factor:
+            return f"{size / factor:.1f} {unit}"
+    return f"{size} B"
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the configuration."""
+    config["keep_values"] = bool(config.get("keep_values", False))
+    config["max_in_memory_bytes"] = parse_size(config.get("max_in_memory_bytes"))
+
+
+@hookimpl(tryfirst=True)
+def pytask_execute_build(session: Session) -> None:
+    """Prepare the release and the spilling of values before the execution."""
+    if session.dag is None:
+        return
+    if not session.config["keep_values"]:
+        session.config["value_releaser"] = ValueReleaser.from_dag(session.dag)
+    if session.config["max_in_memory_bytes"] is not None:
+        root = session.config["root"] / ".pytask" / "spill"
+        root.mkdir(parents=True, exist_ok=True)
+        session.config["value_spiller"] = ValueSpiller(
+            path=Path(tempfile.mkdtemp(dir=root)),
+            max_size=session.config["max_in_memory_bytes"],
+        )
+
+
+@hookimpl(wrapper=True)
+def pytask_execute_task_process_report(
+    session: Session, report: ExecutionReport
+) -> Generator[None, Any, Any]:
+    """Release values after the report of a task was processed.
+
+    The states of the dependencies are stored while the report is processed, so values
+    are only released afterwards.
+
+    """
+    result = yield
+    released = []
+    releaser: ValueReleaser | None = session.config.get("value_releaser")
+    if releaser is not None:
+        released = releaser.task_done(
+            session.dag, report.task, session.config.get("value_cache")
+        )
+    spiller: ValueSpiller | None = session.config.get("value_spiller")
+    if spiller is not None:
+        for signature in released:
+            spiller.discard(signature)
+        if report.outcome == TaskOutcome.SUCCESS:
+            spiller.task_done(session.dag, report.task)
+    return result
+
+
+@hookimpl
+def pytask_unconfigure(session: Session) -> None:
+    """Remove the spilled values unless all values are kept."""
+    spiller: ValueSpiller | None = session.config.get("value_spiller")
+    if spiller is not None and not session.config["keep_values"]:
+        shutil.rmtree(spiller.path, ignore_errors=True)
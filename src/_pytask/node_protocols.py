@@ -32,6 +32,8 @@ __all__ = [
 class PNode(Protocol):
     """Protocol for nodes."""
 
+    __slots__ = ()
+
     name: str
     attributes: dict[Any, Any]
 
@@ -72,6 +74,8 @@ class PPathNode(PNode, Protocol):
 
     """
 
+    __slots__ = ()
+
     path: NodePath
 
 
@@ -89,6 +93,8 @@ class PProvisionalNode(Protocol):
 
     """
 
+    __slots__ = ()
+
     name: str
     attributes: dict[Any, Any]
 
@@ -129,6 +135,8 @@ TaskIO: TypeAlias = dict[str, NodeTree]
 class PTask(Protocol):
     """Protocol for nodes."""
 
+    __slots__ = ()
+
     name: str
     depends_on: TaskIO
     produces: TaskIO
@@ -161,4 +169,6 @@ class PTaskWithPath(PTask, Protocol):
 
     """
 
+    __slots__ = ()
+
     path: Path
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+import ast
+import bz2
+import dataclasses
+import enum
+import gzip
 import hashlib
 import inspect
+import json
+import lzma
+import mmap
+import os
 import pickle
+import struct
+import sys
+import textwrap
+import uuid
+from contextlib import contextmanager
 from contextlib import suppress
 from dataclasses import dataclass
 from dataclasses import field
 from os import stat_result
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Literal
 
 from typing_extensions import deprecated
 from upath import UPath
 from upath._stat import UPathStatResult
 
 from _pytask._hashlib import hash_value
+from _pytask.compat import import_optional_dependency
+from _pytask.mark_utils import MarkerList
 from _pytask.node_protocols import PNode
 from _pytask.node_protocols import PPathNode
 from _pytask.node_protocols import PProvisionalNode
@@ -24,12 +41,14 @@ from _pytask.node_protocols import PTask
 from _pytask.node_protocols import PTaskWithPath
 from _pytask.node_protocols import TaskIO
 from _pytask.path import hash_path
+from _pytask.path import is_non_local_path
 from _pytask.typing import NoDefault
 from _pytask.typing import NodePath
 from _pytask.typing import no_default
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Generator
     from pathlib import Path
     from typing import BinaryIO
 
@@ -39,17 +58,80 @@ if TYPE_CHECKING:
 
 __all__ = [
     "DirectoryNode",
+    "LazyValue",
+    "NumpyNode",
     "PathNode",
     "PickleNode",
     "PythonNode",
     "Task",
     "TaskWithoutPath",
+    "get_state_of_function",
     "get_state_of_path",
 ]
 
 
-@dataclass(kw_only=True)
-class TaskWithoutPath(PTask):
+_UNSET: Any = object()
+"""A sentinel for containers of tasks and nodes which have not been allocated yet."""
+
+
+_LAZY_CONTAINERS: dict[str, Callable[[], Any]] = {
+    "attributes": dict,
+    "markers": MarkerList,
+    "report_sections": list,
+}
+
+
+class _CompactMixin:
+    """A mixin for memory-lean tasks and nodes.
+
+    Large projects contain hundreds of thousands of tasks and nodes and most of them
+    never store anything in their ``attributes``, ``markers``, or ``report_sections``.
+    Containers which were not passed are not allocated until they are accessed for the
+    first time. Names are interned, so that the same name shared by many nodes is only
+    stored once.
+
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        factory = _LAZY_CONTAINERS.get(name)
+        if factory is None:
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = factory()
+        setattr(self, name, value)
+        return value
+
+    def __post_init__(self) -> None:
+        self._compact()
+
+    def __setstate__(self, state: Any) -> None:
+        # Objects pickled before tasks and nodes used slots store a plain dictionary
+        # instead of a tuple with the dictionary and the slots.
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for partial_state in (dict_state, slot_state):
+            for name, value in (partial_state or {}).items():
+                setattr(self, name, value)
+
+    def _compact(self) -> None:
+        """Release unset containers, index markers, and intern the name."""
+        for name in _LAZY_CONTAINERS:
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            if value is _UNSET:
+                delattr(self, name)
+            elif name == "markers" and not isinstance(value, MarkerList):
+                self.markers = MarkerList(value)
+        name = getattr(self, "name", None)
+        if type(name) is str:
+            self.name = sys.intern(name)
+
+
+@dataclass(kw_only=True, slots=True)
+class TaskWithoutPath(_CompactMixin, PTask):
     """The class for tasks without a source file.
 
     Tasks may have no source file because
@@ -79,9 +161,9 @@ class TaskWithoutPath(PTask):
     function: Callable[..., Any]
     depends_on: TaskIO = field(default_factory=dict)
     produces: TaskIO = field(default_factory=dict)
-    markers: list[Mark] = field(default_factory=list)
-    report_sections: list[tuple[str, str, str]] = field(default_factory=list)
-    attributes: dict[Any, Any] = field(default_factory=dict)
+    markers: list[Mark] = _UNSET
+    report_sections: list[tuple[str, str, str]] = _UNSET
+    attributes: dict[Any, Any] = _UNSET
 
     @property
     def signature(self) -> str:
@@ -100,8 +182,8 @@ class TaskWithoutPath(PTask):
         return self.function(**kwargs)
 
 
-@dataclass(kw_only=True)
-class Task(PTaskWithPath):
+@dataclass(kw_only=True, slots=True)
+class Task(_CompactMixin, PTaskWithPath):
     """The class for tasks which are Python functions.
 
     Attributes
@@ -133,14 +215,15 @@ class Task(PTaskWithPath):
     name: str = field(default="", init=False)
     depends_on: TaskIO = field(default_factory=dict)
     produces: TaskIO = field(default_factory=dict)
-    markers: list[Mark] = field(default_factory=list)
-    report_sections: list[tuple[str, str, str]] = field(default_factory=list)
-    attributes: dict[Any, Any] = field(default_factory=dict)
+    markers: list[Mark] = _UNSET
+    report_sections: list[tuple[str, str, str]] = _UNSET
+    attributes: dict[Any, Any] = _UNSET
 
     def __post_init__(self: Task) -> None:
         """Change class after initialization."""
         if not self.name:
             self.name = self.path.as_posix() + "::" + self.base_name
+        self._compact()
 
     @property
     def signature(self) -> str:
@@ -149,7 +232,21 @@ class Task(PTaskWithPath):
         return hashlib.sha256(raw_key.encode()).hexdigest()
 
     def state(self) -> str | None:
-        """Return the state of the node."""
+        """Return the state of the node.
+
+        By default, the state is the state of the module. With ``task_state =
+        "function"``, it is the state of the source code of the task function and the
+        evaluated arguments of its decorators and defaults if both are available.
+
+        """
+        if self.attributes.get("task_state") == "function":
+            state = get_state_of_function(self.function)
+            arguments_state = self.attributes.get("arguments_state", "")
+            if state is not None and arguments_state is not None:
+                if not arguments_state:
+                    return state
+                raw_key = state + arguments_state
+                return "function:" + hashlib.sha256(raw_key.encode()).hexdigest()
         return get_state_of_path(self.path)
 
     def execute(self, **kwargs: Any) -> Any:
@@ -157,8 +254,8 @@ class Task(PTaskWithPath):
         return self.function(**kwargs)
 
 
-@dataclass(kw_only=True)
-class PathNode(PPathNode):
+@dataclass(kw_only=True, slots=True)
+class PathNode(_CompactMixin, PPathNode):
     """The class for a node which is a path.
 
     Attributes
@@ -174,7 +271,7 @@ class PathNode(PPathNode):
 
     path: NodePath
     name: str = ""
-    attributes: dict[Any, Any] = field(default_factory=dict)
+    attributes: dict[Any, Any] = _UNSET
 
     @property
     def signature(self) -> str:
@@ -210,8 +307,30 @@ class PathNode(PPathNode):
             raise TypeError(msg)
 
 
-@dataclass(kw_only=True)
-class PythonNode(PNode):
+@dataclass(frozen=True)
+class LazyValue:
+    """A value of a [`pytask.PythonNode`][] which is loaded when it is used.
+
+    Attributes
+    ----------
+    loader
+        A function without arguments which returns the value.
+    state
+        The state of the node with the value which is known without loading it.
+    digest
+        A digest of the value which changes with the value. Tasks which depend on a node
+        with ``hash=False`` use it instead of the constant state. ``None`` if the digest
+        is unknown.
+
+    """
+
+    loader: Callable[[], Any]
+    state: str | None
+    digest: str | None = None
+
+
+@dataclass(kw_only=True, slots=True)
+class PythonNode(_CompactMixin, PNode):
     """The class for a node which is a Python object.
 
     Attributes
@@ -249,7 +368,7 @@ class PythonNode(PNode):
     value: Any | NoDefault = no_default
     hash: bool | Callable[[Any], int | str] = False
     node_info: NodeInfo | None = None
-    attributes: dict[Any, Any] = field(default_factory=dict)
+    attributes: dict[Any, Any] = _UNSET
 
     @property
     def signature(self) -> str:
@@ -270,6 +389,8 @@ class PythonNode(PNode):
             return self
         if isinstance(self.value, PythonNode):
             return self.value.load()
+        if isinstance(self.value, LazyValue):
+            self.value = self.value.loader()
         return self.value
 
     def save(self, value: Any) -> None:
@@ -297,9 +418,17 @@ class PythonNode(PNode):
         https://docs.python.org/3/reference/datamodel.html#object.__hash__ ) for more
         information.
 
+        If the value is a ``LazyValue`` which has not been loaded, its stored state is
+        returned.
+
         """
         if self.value is no_default:
             return None
+        lazy_value = (
+            self.value.value if isinstance(self.value, PythonNode) else self.value
+        )
+        if isinstance(lazy_value, LazyValue):
+            return lazy_value.state
         if self.hash:
             value = self.load()
             if callable(self.hash):
@@ -308,10 +437,16 @@ class PythonNode(PNode):
         return "0"
 
 
-@dataclass
-class PickleNode(PPathNode):
+@dataclass(slots=True)
+class PickleNode(_CompactMixin, PPathNode):
     """A node for pickle files.
 
+    The pickle stream can be compressed with a codec from the standard library. Large
+    buffers like the data of arrays can be stored out-of-band with pickle protocol 5 in
+    a separate file next to the pickle file, ``<path>.buffers``. The buffers are aligned
+    and memory-mapped when the value is loaded, so they are neither copied nor
+    decompressed.
+
     Attributes
     ----------
     name
@@ -324,14 +459,63 @@ class PickleNode(PPathNode):
         A function to serialize the object. Defaults to [pickle.dump](https://docs.python.org/3/library/pickle.html#pickle.dump).
     deserializer
         A function to deserialize the object. Defaults to [pickle.load](https://docs.python.org/3/library/pickle.html#pickle.load).
+    compression
+        Compress the pickle stream with ``"gzip"``, ``"bz2"``, or ``"lzma"``. By
+        default, the stream is not compressed.
+    compression_level
+        The level of the compression. By default, the default level of the codec is
+        used.
+    out_of_band
+        Store buffers which support pickle protocol 5 out-of-band in
+        ``<path>.buffers``. Requires the default serializer and deserializer.
+    share_value
+        Allow tasks to share the loaded value through the cache of loaded values which
+        is enabled with ``value_cache_size``. Only use it if tasks do not modify the
+        value.
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from pytask import PickleNode
+    >>> node = PickleNode(path=Path("data.pkl"), compression="lzma", out_of_band=True)
 
     """
 
     path: NodePath
     name: str = ""
-    attributes: dict[Any, Any] = field(default_factory=dict)
+    attributes: dict[Any, Any] = _UNSET
     serializer: Callable[[Any, BinaryIO], None] = field(default=pickle.dump)
     deserializer: Callable[[BinaryIO], Any] = field(default=pickle.load)
+    compression: Literal["gzip", "bz2", "lzma"] | None = None
+    compression_level: int | None = None
+    out_of_band: bool = False
+    share_value: bool = False
+
+    def __post_init__(self) -> None:
+        if self.compression is not None and self.compression not in _CODECS:
+            msg = (
+                "'compression' must be one of 'gzip', 'bz2', 'lzma', or None, not "
+                f"{self.compression!r}."
+            )
+            raise ValueError(msg)
+        if self.out_of_band and (
+            self.serializer is not pickle.dump or self.deserializer is not pickle.load
+        ):
+            msg = (
+                "'out_of_band' requires the default serializer and deserializer of "
+                "'PickleNode'."
+            )
+            raise ValueError(msg)
+        self._compact()
+
+    def __setstate__(self, state: Any) -> None:
+        # Nodes pickled by previous versions, for example, in data catalogs, do not
+        # store the options for compression, out-of-band buffers, and sharing.
+        self.compression = None
+        self.compression_level = None
+        self.out_of_band = False
+        self.share_value = False
+        _CompactMixin.__setstate__(self, state)
 
     @property
     def signature(self) -> str:
@@ -339,6 +523,11 @@ class PickleNode(PPathNode):
         raw_key = str(hash_value(self.path))
         return hashlib.sha256(raw_key.encode()).hexdigest()
 
+    @property
+    def buffers_path(self) -> NodePath:
+        """The path to the file with the out-of-band buffers."""
+        return self.path.with_name(self.path.name + ".buffers")
+
     @classmethod
     def from_path(cls, path: NodePath) -> PickleNode:
         """Instantiate class from path to file."""
@@ -349,23 +538,236 @@ class PickleNode(PPathNode):
 
     def state(self) -> str | None:
         """Return the current state of the node."""
-        return get_state_of_path(self.path)
+        state = get_state_of_path(self.path)
+        if not self.out_of_band or state is None:
+            return state
+        buffers_state = get_state_of_path(self.buffers_path)
+        return None if buffers_state is None else f"{state}-{buffers_state}"
 
     def load(self, is_product: bool = False) -> Any:
         """Load the value or return the node when used as a product."""
         if is_product:
             return self
-        with self.path.open("rb") as f:
+        with _open_pickle_file(
+            self.path, "rb", self.compression, self.compression_level
+        ) as f:
+            if self.out_of_band:
+                return pickle.load(f, buffers=_read_buffers(self.buffers_path))  # noqa: S301
             return self.deserializer(f)
 
     def save(self, value: Any) -> None:
         """Serialize and save the value to disk."""
-        with self.path.open("wb") as f:
-            self.serializer(value, f)
+        with _open_pickle_file(
+            self.path, "wb", self.compression, self.compression_level
+        ) as f:
+            if self.out_of_band:
+                with _open_buffers_file(self.buffers_path) as buffers_file:
+                    _dump_out_of_band(value, f, buffers_file)
+            else:
+                self.serializer(value, f)
+
+
+_CODECS: dict[str, Callable[..., BinaryIO]] = {
+    "gzip": lambda f, **kwargs: gzip.GzipFile(fileobj=f, **kwargs),
+    "bz2": bz2.BZ2File,
+    "lzma": lzma.LZMAFile,
+}
+_BUFFER_ALIGNMENT = 64
+_FOOTER = struct.Struct("<Q")
+
+
+@contextmanager
+def _open_pickle_file(
+    path: NodePath, mode: str, compression: str | None, level: int | None
+) -> Generator[BinaryIO, None, None]:
+    """Open a pickle file and stream it through the codec of the compression."""
+    with path.open(mode) as raw:
+        if compression is None:
+            yield raw
+            return
+        kwargs: dict[str, Any] = {}
+        if level is not None and "w" in mode:
+            kwargs["preset" if compression == "lzma" else "compresslevel"] = level
+        with _CODECS[compression](raw, mode=mode, **kwargs) as codec:
+            yield codec
+
+
+@contextmanager
+def _open_buffers_file(path: NodePath) -> Generator[BinaryIO, None, None]:
+    """Open the file for out-of-band buffers for writing.
+
+    Local files are replaced atomically, so memory-mapped buffers of the previous value
+    remain valid.
+
+    """
+    if is_non_local_path(path):
+        with path.open("wb") as f:
+            yield f
+        return
+
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            yield f
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _dump_out_of_band(value: Any, file: BinaryIO, buffers_file: BinaryIO) -> None:
+    """Pickle a value and write its buffers aligned to a separate file.
+
+    The file with the buffers ends with a JSON list of the offsets and lengths of the
+    buffers followed by the length of the list as an unsigned 64-bit integer.
+
+    """
+    index: list[tuple[int, int]] = []
+    position = 0
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        nonlocal position
+        try:
+            view = buffer.raw()
+        except BufferError:
+            # Non-contiguous buffers are serialized in-band.
+            return True
+        padding = -position % _BUFFER_ALIGNMENT
+        buffers_file.write(bytes(padding))
+        index.append((position + padding, view.nbytes))
+        buffers_file.write(view)
+        position += padding + view.nbytes
+        return False
+
+    pickle.Pickler(file, protocol=5, buffer_callback=buffer_callback).dump(value)
+    footer = json.dumps(index).encode()
+    buffers_file.write(footer)
+    buffers_file.write(_FOOTER.pack(len(footer)))
+
+
+def _read_buffers(path: NodePath) -> list[memoryview]:
+    """Read the buffers of a pickle file which were stored out-of-band.
+
+    Local files are memory-mapped, so the buffers are only read when they are used.
+
+    """
+    if is_non_local_path(path):
+        data = memoryview(path.read_bytes())
+    else:
+        with path.open("rb") as f:
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    (length,) = _FOOTER.unpack(data[-_FOOTER.size :])
+    index = json.loads(bytes(data[-_FOOTER.size - length : -_FOOTER.size]))
+    return [data[offset : offset + size] for offset, size in index]
+
+
+@dataclass(slots=True)
+class NumpyNode(_CompactMixin, PPathNode):
+    """A node for arrays which are stored in ``.npy`` files and memory-mapped.
+
+    Consuming tasks receive a read-only memory-mapped view of the array instead of a
+    copy. Several tasks and processes reading the same array share its memory through
+    the page cache.
+
+    The state of the node is the size and the modification time of the file, so even
+    large arrays are never hashed. Read-only arrays of local files are shared between
+    tasks if the cache of loaded values is enabled with ``value_cache_size``.
+
+    Attributes
+    ----------
+    name
+        Name of the node which makes it identifiable in the DAG.
+    path
+        The path to the file.
+    attributes: dict[Any, Any]
+        A dictionary to store additional information of the task.
+    mmap_mode
+        The mode to memory-map the file which is passed to
+        [numpy.load](https://numpy.org/doc/stable/reference/generated/numpy.load.html).
+        Use ``None`` to load the array into memory.
 
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from pytask import NumpyNode
+    >>> node = NumpyNode(path=Path("data.npy"))
+
+    """
+
+    path: NodePath
+    name: str = ""
+    attributes: dict[Any, Any] = _UNSET
+    mmap_mode: Literal["r", "r+", "c"] | None = "r"
+
+    @property
+    def signature(self) -> str:
+        """The unique signature of the node."""
+        raw_key = str(hash_value(self.path))
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    @classmethod
+    def from_path(cls, path: NodePath) -> NumpyNode:
+        """Instantiate class from path to file."""
+        if not path.is_absolute():
+            msg = "Node must be instantiated from absolute path."
+            raise ValueError(msg)
+        return cls(name=path.as_posix(), path=path)
+
+    @property
+    def share_value(self) -> bool:
+        """Whether tasks can share the loaded array.
+
+        Arrays memory-mapped in read-only mode cannot be modified. Arrays from remote
+        paths are loaded into memory and are writeable, so they are not shared.
+
+        """
+        return self.mmap_mode == "r" and not is_non_local_path(self.path)
+
+    def state(self) -> str | None:
+        """Return the size and the modification time of the file."""
+        if is_non_local_path(self.path):
+            return get_state_of_path(self.path)
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def load(self, is_product: bool = False) -> Any:
+        """Load the array or return the node when used as a product."""
+        if is_product:
+            return self
+        np = import_optional_dependency("numpy", caller="NumpyNode")
+        if is_non_local_path(self.path):
+            with self.path.open("rb") as f:
+                return np.load(f, allow_pickle=False)  # type: ignore[union-attr]
+        return np.load(  # type: ignore[union-attr]
+            self.path, mmap_mode=self.mmap_mode, allow_pickle=False
+        )
 
-@dataclass(kw_only=True)
-class DirectoryNode(PProvisionalNode):
+    def save(self, value: Any) -> None:
+        """Save the array to disk.
+
+        Local files are replaced atomically, so memory-mapped views of the previous
+        array remain valid.
+
+        """
+        np = import_optional_dependency("numpy", caller="NumpyNode")
+        if is_non_local_path(self.path):
+            with self.path.open("wb") as f:
+                np.save(f, value, allow_pickle=False)  # type: ignore[union-attr]
+            return
+
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp.open("wb") as f:
+                np.save(f, value, allow_pickle=False)  # type: ignore[union-attr]
+            tmp.replace(self.path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+
+@dataclass(kw_only=True, slots=True)
+class DirectoryNode(_CompactMixin, PProvisionalNode):
     """The class for a provisional node that works with directories.
 
     Attributes
@@ -386,7 +788,7 @@ class DirectoryNode(PProvisionalNode):
     name: str = ""
     pattern: str = "*"
     root_dir: Path | None = None
-    attributes: dict[Any, Any] = field(default_factory=dict)
+    attributes: dict[Any, Any] = _UNSET
 
     @property
     def signature(self) -> str:
@@ -408,6 +810,98 @@ class DirectoryNode(PProvisionalNode):
         return list(self.root_dir.glob(self.pattern))
 
 
+def get_state_of_function(function: Callable[..., Any]) -> str | None:
+    """Get the state of a function from its source code.
+
+    The source code includes the decorators and their arguments. It is normalized by
+    parsing it, so that changes to comments and formatting do not change the state. The
+    state is prefixed with ``function:`` to distinguish it from states of modules in the
+    lockfile.
+
+    Returns ``None`` if the source code is not available.
+
+    """
+    try:
+        source = textwrap.dedent(inspect.getsource(function))
+    except (OSError, TypeError):
+        return None
+    with suppress(SyntaxError):
+        source = ast.dump(ast.parse(source))
+    return "function:" + hashlib.sha256(source.encode()).hexdigest()
+
+
+def get_state_of_arguments(arguments: Any) -> str | None:
+    """Get the state of the evaluated arguments of a task.
+
+    The arguments are hashed, so that values passed to decorators, for example, in
+    loops, are part of the state of a task. The encoding is canonical and does not
+    depend on the process, for example, items of sets and dictionaries are sorted.
+    Returns ``None`` if the arguments cannot be encoded canonically.
+
+    """
+    hash_ = hashlib.sha256()
+    try:
+        _update_canonically(hash_, arguments, set())
+    except (BufferError, RecursionError, TypeError, ValueError):
+        return None
+    return hash_.hexdigest()
+
+
+def _update_canonically(hash_: Any, value: Any, seen: set[int]) -> None:  # noqa: C901
+    """Update a hash with a canonical encoding of a value.
+
+    Raises a ``TypeError`` for values which cannot be encoded canonically.
+
+    """
+    type_ = type(value)
+    hash_.update(f"{type_.__module__}.{type_.__qualname__}\0".encode())
+
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        hash_.update(f"{value!r}\0".encode())
+        return
+    if isinstance(value, (os.PathLike, UPath)):
+        hash_.update(f"{hash_value(value)}\0".encode())
+        return
+    if isinstance(value, enum.Enum):
+        hash_.update(f"{value.name}\0".encode())
+        return
+    if isinstance(value, type) or inspect.isroutine(value):
+        hash_.update(f"{value.__module__}.{value.__qualname__}\0".encode())
+        return
+
+    if id(value) in seen:
+        msg = "Recursive values cannot be encoded."
+        raise TypeError(msg)
+    seen = seen | {id(value)}
+
+    if isinstance(value, (list, tuple)):
+        items = value
+    elif isinstance(value, (set, frozenset)):
+        items = sorted(value, key=lambda x: _encode_canonically(x, seen))
+    elif isinstance(value, dict):
+        items = sorted(
+            value.items(), key=lambda item: _encode_canonically(item[0], seen)
+        )
+    elif dataclasses.is_dataclass(value):
+        items = [getattr(value, f.name) for f in dataclasses.fields(value)]
+    else:
+        # Contiguous arrays expose their data as a buffer.
+        view = memoryview(value)
+        hash_.update(f"{view.format}{view.shape}\0".encode())
+        hash_.update(hashlib.sha256(view).digest())
+        return
+
+    hash_.update(f"{len(items)}\0".encode())
+    for item in items:
+        _update_canonically(hash_, item, seen)
+
+
+def _encode_canonically(value: Any, seen: set[int]) -> str:
+    hash_ = hashlib.sha256()
+    _update_canonically(hash_, value, seen)
+    return hash_.hexdigest()
+
+
 def get_state_of_path(path: NodePath) -> str | None:
     """Get state of a path.
 
@@ -195,6 +195,7 @@ def pytask_extend_command_line_interface(cli: click.Group) -> None:
         "lock reset",
         "markers",
         "profile",
+        "status",
     ):
         target = get_command(cli, command)
         target.params.extend((_CONFIG_OPTION, _HOOK_MODULE_OPTION, _PATH_ARGUMENT))
@@ -206,6 +207,7 @@ def pytask_extend_command_line_interface(cli: click.Group) -> None:
         "lock clean",
         "lock reset",
         "profile",
+        "status",
     ):
         target = get_command(cli, command)
         target.params.extend([_IGNORE_OPTION, _EDITOR_URL_SCHEME_OPTION])
@@ -9,6 +9,8 @@ import importlib.util
 import itertools
 import os
 import sys
+from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING
@@ -19,11 +21,13 @@ from _pytask._hashlib import file_digest
 from _pytask.cache import Cache
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from collections.abc import Sequence
 
     from _pytask.typing import NodePath
 
 __all__ = [
+    "DirectoryListingCache",
     "find_case_sensitive_path",
     "find_closest_ancestor",
     "find_common_ancestor",
@@ -168,6 +172,119 @@ def find_case_sensitive_path(path: Path, platform: str) -> Path:
     return path.resolve() if platform == "win32" else path
 
 
+_DirectoryListing = dict[str, tuple[str, bool]]
+
+
+@dataclass
+class DirectoryListingCache:
+    """Cache listings of directories to resolve checks of many paths at once.
+
+    Checking whether paths are directories or have the correct casing requires at least
+    one system call per path. While the cache is active, every directory is scanned once
+    with [os.scandir](https://docs.python.org/3/library/os.html#os.scandir) and all
+    checks of paths inside the directory are answered from the listing.
+
+    The normalized and resolved paths of parent directories are memoized as well, so
+    paths in the same directory are normalized and resolved with one call per
+    directory.
+
+    Outside of ``activate()``, all checks query the file system directly since tasks
+    might create or remove files.
+
+    Attributes
+    ----------
+    case_sensitive
+        Whether the file system is case-sensitive. On case-insensitive file systems,
+        entries are looked up regardless of their casing.
+
+    """
+
+    case_sensitive: bool = True
+    _listings: dict[Path, _DirectoryListing | None] = field(default_factory=dict)
+    _normalized_parents: dict[Path, Path] = field(default_factory=dict)
+    _resolved_parents: dict[Path, Path] = field(default_factory=dict)
+    _is_active: bool = False
+
+    @contextlib.contextmanager
+    def activate(self) -> Generator[None, None, None]:
+        """Activate the cache and clear all listings afterwards."""
+        self._is_active = True
+        try:
+            yield
+        finally:
+            self._is_active = False
+            self._listings.clear()
+            self._normalized_parents.clear()
+            self._resolved_parents.clear()
+
+    def is_dir(self, path: Path) -> bool:
+        """Check whether a path points to a directory."""
+        listing = self._get_listing(path)
+        if listing is None:
+            return path.is_dir()
+        entry = listing.get(self._to_key(path.name))
+        return entry is not None and entry[1]
+
+    def normpath(self, path: Path) -> Path:
+        """Normalize a path with ``os.path.normpath``.
+
+        The parent directory is normalized once per directory.
+
+        """
+        if not self._is_active or path.name in ("", ".", ".."):
+            return Path(os.path.normpath(path))
+        directory = path.parent
+        normalized = self._normalized_parents.get(directory)
+        if normalized is None:
+            normalized = Path(os.path.normpath(directory))
+            self._normalized_parents[directory] = normalized
+        return normalized / path.name
+
+    def find_case_sensitive_path(self, path: Path, platform: str) -> Path:
+        """Find the case-sensitive path.
+
+        The casing of the parent directory is resolved once per directory with
+        ``find_case_sensitive_path`` and the casing of the name is taken from the
+        listing of the directory.
+
+        """
+        listing = self._get_listing(path) if platform == "win32" else None
+        if listing is None:
+            return find_case_sensitive_path(path, platform)
+        entry = listing.get(self._to_key(path.name))
+        name = path.name if entry is None else entry[0]
+        directory = path.parent
+        resolved = self._resolved_parents.get(directory)
+        if resolved is None:
+            resolved = find_case_sensitive_path(directory, platform)
+            self._resolved_parents[directory] = resolved
+        return resolved / name
+
+    def _get_listing(self, path: Path) -> _DirectoryListing | None:
+        """Get the listing of the parent directory if the cache is active."""
+        if not self._is_active or path.parent == path:
+            return None
+        directory = path.parent
+        if directory not in self._listings:
+            self._listings[directory] = self._scan(directory)
+        return self._listings[directory]
+
+    def _to_key(self, name: str) -> str:
+        return name if self.case_sensitive else name.casefold()
+
+    def _scan(self, directory: Path) -> _DirectoryListing | None:
+        try:
+            with os.scandir(directory) as entries:
+                return {
+                    self._to_key(entry.name): (entry.name, entry.is_dir())
+                    for entry in entries
+                }
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        except OSError:
+            return None
+
+
 def import_path(path: Path, root: Path) -> ModuleType:
     """Import and return a module from the given path.
 
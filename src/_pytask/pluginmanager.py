@@ -39,6 +39,7 @@ def register_hook_impls_from_modules(
 def pytask_add_hooks(pm: PluginManager) -> None:
     """Add hooks."""
     builtin_hook_impl_modules = (
+        "_pytask.artifact_cache",
         "_pytask.build",
         "_pytask.capture",
         "_pytask.clean",
@@ -52,17 +53,23 @@ def pytask_add_hooks(pm: PluginManager) -> None:
         "_pytask.explain",
         "_pytask.provisional",
         "_pytask.execute",
+        "_pytask.generator_cache",
         "_pytask.live",
         "_pytask.lock",
         "_pytask.lockfile",
         "_pytask.logging",
         "_pytask.mark",
+        "_pytask.memoize",
+        "_pytask.memory",
         "_pytask.nodes",
         "_pytask.parameters",
         "_pytask.persist",
         "_pytask.profile",
+        "_pytask.remote_cache",
         "_pytask.skipping",
+        "_pytask.status",
         "_pytask.task",
+        "_pytask.value_cache",
         "_pytask.warnings",
     )
     register_hook_impls_from_modules(pm, builtin_hook_impl_modules)
@@ -29,6 +29,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Mapping
 
+    from _pytask.generator_cache import GeneratorCache
     from _pytask.session import Session
 
 
@@ -55,20 +56,40 @@ def _safe_load(node: PNode | PProvisionalNode, task: PTask, is_product: bool) ->
         raise NodeLoadError(msg) from e
 
 
+def _execute_generator(task: PTask) -> None:
+    kwargs = {}
+    for name, value in task.depends_on.items():
+        kwargs[name] = tree_map(lambda x: _safe_load(x, task, False), value)
+
+    parameters = inspect.signature(task.function).parameters
+    for name, value in task.produces.items():
+        if name in parameters:
+            kwargs[name] = tree_map(lambda x: _safe_load(x, task, True), value)
+
+    task.execute(**kwargs)
+
+
 @hookimpl
-def pytask_execute_task(session: Session, task: PTask) -> None:
-    """Execute task generators and collect the tasks."""
-    if is_task_generator(task):
-        kwargs = {}
-        for name, value in task.depends_on.items():
-            kwargs[name] = tree_map(lambda x: _safe_load(x, task, False), value)
+def pytask_execute_task(session: Session, task: PTask) -> bool | None:
+    """Execute task generators and collect the tasks.
 
-        parameters = inspect.signature(task.function).parameters
-        for name, value in task.produces.items():
-            if name in parameters:
-                kwargs[name] = tree_map(lambda x: _safe_load(x, task, True), value)
+    Returns ``True`` to prevent the generator from being executed a second time by the
+    default implementation. During a dry-run, the default implementation reports the
+    generator as would be executed.
 
-        task.execute(**kwargs)
+    """
+    if is_task_generator(task):
+        cache: GeneratorCache | None = session.config.get("generator_cache")
+        key = cache.compute_key(session, task) if cache is not None else None
+        path = task.path if isinstance(task, PTaskWithPath) else None
+
+        functions = cache.load(task, key) if cache and key else None
+        if functions is None:
+            _execute_generator(task)
+            if cache and key and path in COLLECTED_TASKS:
+                cache.store(task, key, COLLECTED_TASKS[path])
+        else:
+            COLLECTED_TASKS[path].extend(functions)
 
         # Parse tasks created with @task.
         name_to_function: Mapping[str, Callable[..., Any] | PTask]
@@ -113,6 +134,9 @@ def pytask_execute_task(session: Session, task: PTask) -> None:
             session.execution_reports.append(exec_report)
 
         recreate_dag(session, task)
+        if not (session.config["dry_run"] or session.config["explain"]):
+            return True
+    return None
 
 
 @hookimpl
@@ -0,0 +1,442 @@
+"""Share the artifact cache between machines over HTTP.
+
+When ``cache_url`` is configured, the local artifact cache is backed by a remote cache
+which implements a simple content-addressed protocol.
+
+- ``GET /entries/<key>`` returns the entry of a key and ``PUT /entries/<key>`` stores
+  it.
+- ``GET /objects/<digest>`` returns the content of an object and
+  ``PUT /objects/<digest>`` stores it. The server rejects objects whose sha256 hash
+  does not match the digest.
+- ``POST /objects/missing`` receives a JSON list of digests and returns the digests
+  which are not stored on the server.
+
+Missing responses use the status code 404. When a task must be executed because the
+local cache does not contain its key, pytask downloads the entry and the missing objects
+from the remote cache. After a task is executed successfully, pytask checks which of
+its products are missing on the server with a single request, uploads them, and stores
+the entry last. Transfers run concurrently over a pool of persistent connections.
+Objects are streamed in chunks and hashed while they are written to a temporary file, so
+they are never held in memory as a whole.
+
+The ``pytask cache-server`` command starts a reference server based on the standard
+library which stores the cache in a directory.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import queue
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from urllib.parse import urlsplit
+
+import click
+
+from _pytask.click import ColoredCommand
+from _pytask.console import console
+from _pytask.pluginmanager import hookimpl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from typing import BinaryIO
+
+    from _pytask.artifact_cache import ArtifactCache
+
+
+__all__ = ["RemoteCache", "create_cache_server"]
+
+
+_PATH = re.compile(r"/(objects|entries)/([0-9a-f]{64})")
+_MISSING_PATH = "/objects/missing"
+_TRANSIENT_ERRORS = (OSError, http.client.HTTPException)
+_CHUNK_SIZE = 1024 * 1024
+
+
+class _ConnectionPool:
+    """A pool of persistent HTTP connections to one host."""
+
+    def __init__(self, url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            msg = f"The URL of the remote cache must use http or https, not {url!r}."
+            raise ValueError(msg)
+        self._connection_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._netloc = parts.netloc
+        self._timeout = timeout
+        self.prefix = parts.path.rstrip("/")
+        self._connections: queue.LifoQueue[http.client.HTTPConnection] = (
+            queue.LifoQueue(maxsize=size)
+        )
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | str | BinaryIO | None = None,
+        *,
+        headers: dict[str, str] | None = None,
+        read: Callable[[http.client.HTTPResponse], Any] = http.client.HTTPResponse.read,
+    ) -> tuple[int, Any]:
+        """Send a request and return the status code and the result of ``read``.
+
+        By default, the whole body of the response is read. A request on a connection
+        which was closed by the server is retried once on a new connection. A file
+        which is sent as the body must be accompanied by a ``Content-Length`` header.
+
+        """
+        for attempt in range(2):
+            connection = self._acquire()
+            try:
+                # A file is sent from the beginning again when the request is retried.
+                if hasattr(body, "seek"):
+                    body.seek(0)  # type: ignore[union-attr]
+                connection.request(
+                    method, self.prefix + path, body=body, headers=headers or {}
+                )
+                response = connection.getresponse()
+                data = read(response)
+            except _TRANSIENT_ERRORS:
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            return response.status, data
+        raise AssertionError  # pragma: no cover
+
+    def close(self) -> None:
+        while not self._connections.empty():
+            self._connections.get_nowait().close()
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._connections.get_nowait()
+        except queue.Empty:
+            return self._connection_cls(
+                self._netloc, timeout=self._timeout, blocksize=_CHUNK_SIZE
+            )
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._connections.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
+@dataclass
+class RemoteCache:
+    """A remote cache which is accessed over HTTP.
+
+    Attributes
+    ----------
+    url
+        The URL of the remote cache.
+    max_workers
+        The number of concurrent transfers and pooled connections.
+    timeout
+        The timeout of a request in seconds.
+
+    """
+
+    url: str
+    max_workers: int = 8
+    timeout: float = 30.0
+    _pool: _ConnectionPool = field(init=False, repr=False)
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+    _uploader: ThreadPoolExecutor = field(init=False, repr=False)
+    _uploads: list[Future[None]] = field(default_factory=list, init=False, repr=False)
+    _error: BaseException | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._pool = _ConnectionPool(self.url, self.max_workers, self.timeout)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pytask-remote-cache"
+        )
+        # Uploads of entries wait for the uploads of their objects and use a separate
+        # executor such that they cannot block the transfers.
+        self._uploader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pytask-remote-cache-upload"
+        )
+
+    def fetch(self, cache: ArtifactCache, key: str) -> bool:
+        """Download an entry and its missing objects into the local cache.
+
+        Returns ``False`` if the remote cache does not contain the entry or is not
+        available.
+
+        """
+        if self._error is not None:
+            return False
+        try:
+            status, data = self._pool.request("GET", f"/entries/{key}")
+            if status != HTTPStatus.OK:
+                return False
+            digests = set(json.loads(data)["products"].values())
+            missing = [d for d in digests if not cache.object_path(d).exists()]
+            futures = [
+                self._executor.submit(self._download_object, cache, digest)
+                for digest in missing
+            ]
+            if not all(future.result() for future in futures):
+                return False
+        except (*_TRANSIENT_ERRORS, ValueError, KeyError) as e:
+            self._disable(e)
+            return False
+        cache.add_entry(key, data)
+        return True
+
+    def push(self, cache: ArtifactCache, key: str) -> None:
+        """Upload an entry and its objects in the background."""
+        if self._error is None:
+            self._uploads.append(self._uploader.submit(self._upload, cache, key))
+
+    def close(self) -> None:
+        """Wait for pending uploads and close all connections."""
+        wait(self._uploads)
+        for future in self._uploads:
+            if future.exception() is not None:
+                self._disable(future.exception())  # type: ignore[arg-type]
+        self._uploads.clear()
+        self._uploader.shutdown()
+        self._executor.shutdown()
+        self._pool.close()
+        if self._error is not None:
+            msg = (
+                f"The remote cache at {self.url!r} was not available and was disabled "
+                f"during the build: {self._error}"
+            )
+            console.print(msg, style="warning")
+
+    def _download_object(self, cache: ArtifactCache, digest: str) -> bool:
+        tmp = cache.temporary_object_path(digest)
+        try:
+            status, received = self._pool.request(
+                "GET", f"/objects/{digest}", read=lambda r: _read_into(r, tmp)
+            )
+            if status != HTTPStatus.OK or received != digest:
+                return False
+            cache.add_object(digest, tmp)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return True
+
+    def _upload(self, cache: ArtifactCache, key: str) -> None:
+        data = cache.entry_path(key).read_bytes()
+        digests = sorted(set(json.loads(data)["products"].values()))
+
+        status, response = self._pool.request(
+            "POST", _MISSING_PATH, json.dumps(digests).encode()
+        )
+        _raise_for_status(status)
+        futures = [
+            self._executor.submit(
+                self._upload_file, f"/objects/{digest}", cache.object_path(digest)
+            )
+            for digest in json.loads(response)
+        ]
+        for future in futures:
+            future.result()
+
+        # The entry is uploaded last such that other clients never see an entry whose
+        # objects are missing.
+        status, _ = self._pool.request("PUT", f"/entries/{key}", data)
+        _raise_for_status(status)
+
+    def _upload_file(self, path: str, source: Path) -> None:
+        with source.open("rb") as f:
+            headers = {"Content-Length": str(os.fstat(f.fileno()).st_size)}
+            status, _ = self._pool.request("PUT", path, f, headers=headers)
+        _raise_for_status(status)
+
+    def _disable(self, error: BaseException) -> None:
+        if self._error is None:
+            self._error = error
+
+
+def _read_into(response: http.client.HTTPResponse, destination: Path) -> str | None:
+    """Write the body of a successful response to a file and return its hash."""
+    if response.status != HTTPStatus.OK:
+        response.read()
+        return None
+    return _receive(response, destination)
+
+
+def _receive(source: BinaryIO, destination: Path, length: int | None = None) -> str:
+    """Write a stream to a file in chunks and return the sha256 hash of the content.
+
+    Without a ``length``, the stream is read until it is exhausted.
+
+    """
+    hash_ = hashlib.sha256()
+    with destination.open("wb") as f:
+        while length is None or length > 0:
+            size = _CHUNK_SIZE if length is None else min(_CHUNK_SIZE, length)
+            chunk = source.read(size)
+            if not chunk:
+                break
+            hash_.update(chunk)
+            f.write(chunk)
+            if length is not None:
+                length -= len(chunk)
+    return hash_.hexdigest()
+
+
+def _raise_for_status(status: int) -> None:
+    if status >= HTTPStatus.BAD_REQUEST:
+        msg = f"The remote cache responded with status code {status}."
+        raise http.client.HTTPException(msg)
+
+
+class _CacheRequestHandler(BaseHTTPRequestHandler):
+    """Handle requests of the remote cache protocol."""
+
+    protocol_version = "HTTP/1.1"
+    cache: ArtifactCache
+
+    def do_GET(self) -> None:
+        path = self._resolve()
+        if path is None:
+            return
+        try:
+            f = path.open("rb")
+        except FileNotFoundError:
+            self._respond(HTTPStatus.NOT_FOUND)
+            return
+        with f:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile, _CHUNK_SIZE)
+
+    def do_PUT(self) -> None:
+        match = _PATH.fullmatch(self.path)
+        if match is None or match.group(1) == "entries":
+            data = self._read_body()
+            if match is None:
+                self._respond(HTTPStatus.NOT_FOUND)
+            else:
+                self.cache.add_entry(match.group(2), data)
+                self._respond(HTTPStatus.CREATED)
+            return
+
+        digest = match.group(2)
+        tmp = self.cache.temporary_object_path(digest)
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if _receive(self.rfile, tmp, length) != digest:
+                self._respond(HTTPStatus.BAD_REQUEST)
+            else:
+                self.cache.add_object(digest, tmp)
+                self._respond(HTTPStatus.CREATED)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def do_POST(self) -> None:
+        data = self._read_body()
+        if self.path != _MISSING_PATH:
+            self._respond(HTTPStatus.NOT_FOUND)
+            return
+        try:
+            digests = json.loads(data)
+        except ValueError:
+            self._respond(HTTPStatus.BAD_REQUEST)
+            return
+        missing = [
+            digest
+            for digest in digests
+            if not _PATH.fullmatch(f"/objects/{digest}")
+            or not self.cache.object_path(digest).exists()
+        ]
+        self._respond(HTTPStatus.OK, json.dumps(missing).encode())
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Do not log requests."""
+
+    def _resolve(self) -> Path | None:
+        match = _PATH.fullmatch(self.path)
+        if match is None:
+            self._respond(HTTPStatus.NOT_FOUND)
+            return None
+        kind, name = match.groups()
+        if kind == "entries":
+            return self.cache.entry_path(name)
+        return self.cache.object_path(name)
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _respond(self, status: HTTPStatus, data: bytes = b"") -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def create_cache_server(
+    path: Path, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """Create a reference server of the remote cache which stores files in a directory.
+
+    Call ``serve_forever()`` on the returned server to handle requests.
+
+    """
+    from _pytask.artifact_cache import ArtifactCache  # noqa: PLC0415
+
+    handler = type(
+        "CacheRequestHandler",
+        (_CacheRequestHandler,),
+        {"cache": ArtifactCache(path=path, root=path)},
+    )
+    return ThreadingHTTPServer((host, port), handler)
+
+
+@hookimpl
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Extend the command line interface."""
+    cli.add_command(cache_server)
+
+
+@click.command(cls=ColoredCommand, name="cache-server")
+@click.argument(
+    "directory",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path(".pytask", "remote-cache"),
+)
+@click.option("--host", default="127.0.0.1", help="The host to listen on.")
+@click.option("--port", type=int, default=8765, help="The port to listen on.")
+def cache_server(directory: Path, host: str, port: int) -> None:
+    """Serve a remote cache for local testing."""
+    server = create_cache_server(directory.resolve(), host, port)
+    console.print(
+        f"Serving the remote cache in {directory} at "
+        f"http://{server.server_address[0]}:{server.server_address[1]}."
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -7,8 +7,7 @@ from dataclasses import field
 from typing import Protocol
 
 from _pytask.dag_graph import DAG
-from _pytask.dag_graph import NoCycleError
-from _pytask.dag_graph import find_cycle
+from _pytask.dag_graph import find_cycles
 from _pytask.mark_utils import has_mark
 from _pytask.node_protocols import PTask
 
@@ -47,7 +46,7 @@ class SimpleScheduler:
         priorities = _extract_priorities_from_tasks(tasks)
 
         task_signatures = {task.signature for task in tasks}
-        task_dag = DAG()
+        task_dag = type(dag)()
         for signature in task_signatures:
             task_dag.add_node(signature, dag.nodes[signature])
         for signature in task_signatures:
@@ -61,11 +60,7 @@ class SimpleScheduler:
 
     @staticmethod
     def check_dag(dag: DAG) -> None:
-        try:
-            find_cycle(dag)
-        except NoCycleError:
-            pass
-        else:
+        if find_cycles(dag):
             msg = "The DAG contains cycles."
             raise ValueError(msg)
 
@@ -5,11 +5,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-from _pytask.dag_utils import descending_tasks
+from _pytask.dag_utils import mark_descending_tasks
 from _pytask.mark import Mark
 from _pytask.mark_utils import get_marks
 from _pytask.mark_utils import has_mark
-from _pytask.node_protocols import PTask
 from _pytask.outcomes import Skipped
 from _pytask.outcomes import SkippedAncestorFailed
 from _pytask.outcomes import SkippedUnchanged
@@ -18,6 +17,7 @@ from _pytask.pluginmanager import hookimpl
 from _pytask.provisional_utils import collect_provisional_products
 
 if TYPE_CHECKING:
+    from _pytask.node_protocols import PTask
     from _pytask.reports import ExecutionReport
     from _pytask.session import Session
 
@@ -96,21 +96,13 @@ def pytask_execute_task_process_report(
         if isinstance(report.exc_info[1], Skipped):
             report.outcome = TaskOutcome.SKIP
 
-            for descending_task_name in descending_tasks(task.signature, session.dag):
-                descending_task = session.dag.nodes[descending_task_name]
-                if not isinstance(descending_task, PTask):
-                    msg = (
-                        f"Expected descending task for signature "
-                        f"{descending_task_name!r}."
-                    )
-                    raise TypeError(msg)
-                descending_task.markers.append(
-                    Mark(
-                        "skip",
-                        (),
-                        {"reason": f"Previous task {task.name!r} was skipped."},
-                    )
-                )
+            mark_descending_tasks(
+                task.signature,
+                session.dag,
+                Mark(
+                    "skip", (), {"reason": f"Previous task {task.name!r} was skipped."}
+                ),
+            )
             return True
 
         if isinstance(report.exc_info[1], SkippedAncestorFailed):
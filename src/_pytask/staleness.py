@@ -0,0 +1,223 @@
+"""Find unchanged tasks for the whole DAG before the execution.
+
+Checking whether a task is up to date inside
+[`pytask_execute_task_setup`][_pytask.hookspecs.pytask_execute_task_setup] requires
+running the full protocol of hooks for every task, including capturing, logging, and
+warnings, even if the task is skipped because it is unchanged. Instead, the states of
+all nodes are computed once and in parallel and compared with the lockfile in bulk.
+Tasks which are unchanged and do not depend on a changed task are resolved without
+entering the protocol.
+
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from _pytask.explain import create_change_reason
+from _pytask.lockfile import build_portable_node_id
+from _pytask.lockfile import build_portable_task_id
+from _pytask.mark_utils import has_mark
+from _pytask.node_protocols import PNode
+from _pytask.node_protocols import PProvisionalNode
+from _pytask.node_protocols import PTask
+from _pytask.typing import is_task_generator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from _pytask.dag_graph import DAG
+    from _pytask.explain import ChangeReason
+    from _pytask.lockfile import LockfileState
+    from _pytask.session import Session
+
+
+__all__ = [
+    "Staleness",
+    "compute_states",
+    "find_unchanged_tasks",
+    "is_handled_in_setup",
+]
+
+
+_MARKERS_HANDLED_IN_SETUP = (
+    "persist",
+    "skip",
+    "skip_ancestor_failed",
+    "skip_unchanged",
+    "skipif",
+    "would_be_executed",
+)
+"""Tasks with these markers are always handled by the protocol."""
+
+
+_MIN_NODES_FOR_THREADS = 256
+"""The minimum number of nodes for which states are computed in parallel."""
+
+
+def find_unchanged_tasks(session: Session) -> set[str]:
+    """Find the signatures of tasks which can be skipped as unchanged.
+
+    A task is unchanged if the states of the task, its dependencies, and its products
+    match the lockfile entry exactly and none of its ancestors has changed. Tasks with
+    markers which are handled during the setup, task generators, tasks with provisional
+    nodes, and tasks with missing dependencies or products are left to the protocol.
+
+    The pass is only used when the lockfile decides whether tasks are skipped and
+    neither ``--force`` nor ``--explain`` are used.
+
+    """
+    lockfile_state: LockfileState | None = session.config.get("lockfile_state")
+    if (
+        lockfile_state is None
+        or not lockfile_state.use_lockfile_for_skip
+        or session.config.get("force")
+        or session.config.get("explain")
+    ):
+        return set()
+
+    dag = session.dag
+    tasks = [
+        signature for signature, entry in dag.nodes.items() if isinstance(entry, PTask)
+    ]
+    staleness = Staleness(
+        dag=dag, lockfile_state=lockfile_state, states=compute_states(dag)
+    )
+    changed = {
+        signature
+        for signature in tasks
+        if is_handled_in_setup(dag.nodes[signature])  # type: ignore[arg-type]
+        or not staleness.is_task_unchanged(signature)
+    }
+    stale = changed | dag.descendants_of_nodes(changed)
+    return {signature for signature in tasks if signature not in stale}
+
+
+def is_handled_in_setup(task: PTask) -> bool:
+    """Check whether skipping the task is decided while setting it up."""
+    return is_task_generator(task) or any(
+        has_mark(task, name) for name in _MARKERS_HANDLED_IN_SETUP
+    )
+
+
+def compute_states(dag: DAG) -> dict[str, str | None]:
+    """Compute the states of all tasks and nodes.
+
+    States of provisional nodes and nodes whose state cannot be computed are ``None``.
+
+    """
+    signatures = list(dag.nodes)
+    entries = [dag.nodes[signature] for signature in signatures]
+    if len(entries) < _MIN_NODES_FOR_THREADS:
+        states = list(map(_safe_state, entries))
+    else:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            states = list(executor.map(_safe_state, entries, chunksize=64))
+    return dict(zip(signatures, states, strict=True))
+
+
+def _safe_state(entry: PTask | PNode | PProvisionalNode) -> str | None:
+    if isinstance(entry, PProvisionalNode):
+        return None
+    try:
+        return entry.state()
+    except Exception:  # noqa: BLE001
+        return None
+
+
+@dataclass
+class Staleness:
+    """Compare the precomputed states of tasks and nodes with the lockfile."""
+
+    dag: DAG
+    lockfile_state: LockfileState
+    states: dict[str, str | None]
+    node_ids: dict[str, str] = field(default_factory=dict)
+
+    def is_task_unchanged(self, signature: str) -> bool:
+        """Check whether the task and all of its nodes match the lockfile entry."""
+        entry = self.lockfile_state.get_task_entry(self._get_node_id(signature))
+        if entry is None or self.states[signature] != entry.state:
+            return False
+
+        depends_on = self._collect_states(self.dag.predecessors(signature))
+        produces = self._collect_states(self.dag.successors(signature))
+        return depends_on == entry.depends_on and produces == entry.produces
+
+    def find_reasons(self, signature: str) -> list[ChangeReason]:
+        """Find the reasons why a task would be executed.
+
+        Like during the execution, only the current nodes of the task are compared with
+        the lockfile entry. Provisional nodes are ignored since their states are only
+        known after the preceding tasks were executed.
+
+        """
+        task = self.dag.nodes[signature]
+        assert isinstance(task, PTask)
+        task_id = self._get_node_id(signature)
+        entry = self.lockfile_state.get_task_entry(task_id)
+        if entry is None:
+            return [create_change_reason(task, "task", "first_run")]
+
+        reasons = []
+        if self.states[signature] != entry.state:
+            reasons.append(
+                create_change_reason(
+                    task, "task", "changed", entry.state, self.states[signature]
+                )
+            )
+        for node_type, signatures in (
+            ("dependency", self.dag.predecessors(signature)),
+            ("product", self.dag.successors(signature)),
+        ):
+            for node_signature in signatures:
+                node = self.dag.nodes[node_signature]
+                if isinstance(node, PProvisionalNode):
+                    continue
+                state = self.states[node_signature]
+                stored_state = self.lockfile_state.get_node_state(
+                    task_id, self._get_node_id(node_signature)
+                )
+                if state is None:
+                    reason = create_change_reason(node, node_type, "missing")
+                elif stored_state is None:
+                    reason = create_change_reason(node, node_type, "not_in_db")
+                elif state != stored_state:
+                    reason = create_change_reason(
+                        node, node_type, "changed", stored_state, state
+                    )
+                else:
+                    continue
+                reasons.append(reason)
+        return reasons
+
+    def _collect_states(self, signatures: Iterable[str]) -> dict[str, str] | None:
+        """Collect the states of nodes by their lockfile ids.
+
+        Returns ``None`` if any state is missing.
+
+        """
+        collected = {}
+        for signature in signatures:
+            state = self.states[signature]
+            if state is None:
+                return None
+            collected[self._get_node_id(signature)] = state
+        return collected
+
+    def _get_node_id(self, signature: str) -> str:
+        node_id = self.node_ids.get(signature)
+        if node_id is None:
+            node = self.dag.nodes[signature]
+            if isinstance(node, PTask):
+                node_id = build_portable_task_id(node, self.lockfile_state.root)
+            else:
+                assert isinstance(node, PNode)
+                node_id = build_portable_node_id(node, self.lockfile_state.root)
+            self.node_ids[signature] = node_id
+        return node_id
@@ -0,0 +1,332 @@
+"""Implement ``pytask status`` which reports which tasks would be executed and why.
+
+Unlike ``pytask build --dry-run --explain``, the command does not run the execution
+protocol for every task. The states of all nodes are computed once, compared with the
+lockfile, and changes are propagated through the DAG in topological order. The command
+never writes states and is meant to be used by editor integrations and pre-commit hooks.
+
+Files are only hashed again if their modification times changed. Otherwise, their hashes
+are taken from the cache of file hashes in ``.pytask`` and computing their states
+requires one ``stat`` per file.
+
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from contextlib import contextmanager
+from contextlib import nullcontext
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+import click
+from rich.text import Text
+
+from _pytask.click import ColoredCommand
+from _pytask.console import console
+from _pytask.dag import create_dag
+from _pytask.exceptions import CollectionError
+from _pytask.exceptions import ConfigurationError
+from _pytask.exceptions import ResolvingDependenciesError
+from _pytask.explain import ChangeReason
+from _pytask.explain import TaskExplanation
+from _pytask.lock import select_tasks_exact
+from _pytask.lockfile import build_portable_task_id
+from _pytask.mark_utils import get_marks
+from _pytask.mark_utils import has_mark
+from _pytask.node_protocols import PTask
+from _pytask.outcomes import ExitCode
+from _pytask.outcomes import TaskOutcome
+from _pytask.pluginmanager import hookimpl
+from _pytask.pluginmanager import storage
+from _pytask.session import Session
+from _pytask.skipping import skipif
+from _pytask.staleness import Staleness
+from _pytask.staleness import compute_states
+from _pytask.traceback import Traceback
+from _pytask.typing import is_task_generator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import NoReturn
+
+    from _pytask.dag_graph import DAG
+
+
+__all__ = ["TaskStatus", "collect_task_statuses"]
+
+
+@dataclass
+class TaskStatus:
+    """The status of a task.
+
+    Attributes
+    ----------
+    task
+        The task.
+    outcome
+        The outcome the task would have when pytask is executed. It is one of
+        ``WOULD_BE_EXECUTED``, ``SKIP_UNCHANGED``, ``SKIP``, and ``PERSISTENCE``.
+    reasons
+        The reasons why the task would be executed or persisted.
+
+    """
+
+    task: PTask
+    outcome: TaskOutcome
+    reasons: list[ChangeReason] = field(default_factory=list)
+
+    def to_dict(self, root: Any) -> dict[str, Any]:
+        """Convert the status to a JSON-serializable dictionary."""
+        return {
+            "id": build_portable_task_id(self.task, root),
+            "name": self.task.name,
+            "outcome": self.outcome.name.lower(),
+            "reasons": [
+                {
+                    "node": reason.node_name,
+                    "node_type": reason.node_type,
+                    "reason": reason.reason,
+                }
+                for reason in self.reasons
+            ],
+        }
+
+
+def collect_task_statuses(session: Session) -> list[TaskStatus]:
+    """Determine for all tasks in the DAG whether they would be executed.
+
+    Tasks without a lockfile entry would be executed for the first time. Otherwise, the
+    precomputed states of the task and its nodes are compared with the entry. Tasks
+    whose preceding tasks would be executed would be executed as well, except for
+    persisted tasks. Tasks with a ``skip`` or a true ``skipif`` marker and their
+    descendants would be skipped.
+
+    """
+    dag = session.dag
+    staleness = Staleness(
+        dag=dag,
+        lockfile_state=session.config["lockfile_state"],
+        states=compute_states(dag),
+    )
+
+    statuses: dict[str, TaskStatus] = {}
+    for signature in _topological_sort(dag):
+        task = dag.nodes[signature]
+        if not isinstance(task, PTask):
+            continue
+        preceding = [statuses[s] for s in _find_preceding_tasks(dag, signature)]
+
+        if _is_skipped(task) or any(s.outcome == TaskOutcome.SKIP for s in preceding):
+            statuses[signature] = TaskStatus(task=task, outcome=TaskOutcome.SKIP)
+            continue
+
+        reasons = [] if is_task_generator(task) else staleness.find_reasons(signature)
+        reasons.extend(
+            ChangeReason(node_name=s.task.name, node_type="task", reason="cascade")
+            for s in preceding
+            if s.outcome == TaskOutcome.WOULD_BE_EXECUTED
+        )
+
+        if not reasons and not is_task_generator(task):
+            outcome = TaskOutcome.SKIP_UNCHANGED
+        elif has_mark(task, "persist") and all(
+            staleness.states[node_signature] is not None
+            for node_signature in (
+                signature,
+                *dag.predecessors(signature),
+                *dag.successors(signature),
+            )
+        ):
+            outcome = TaskOutcome.PERSISTENCE
+        else:
+            outcome = TaskOutcome.WOULD_BE_EXECUTED
+        statuses[signature] = TaskStatus(task=task, outcome=outcome, reasons=reasons)
+
+    return list(statuses.values())
+
+
+def _find_preceding_tasks(dag: DAG, signature: str) -> list[str]:
+    """Find the tasks producing the dependencies of a task.
+
+    Products which are [`PythonNode`][pytask.PythonNode]s are wrapped in other nodes
+    when they are dependencies, so the search walks through all nodes until it reaches
+    tasks.
+
+    """
+    tasks = []
+    seen = set()
+    stack = list(dag.predecessors(signature))
+    while stack:
+        node_signature = stack.pop()
+        if node_signature in seen:
+            continue
+        seen.add(node_signature)
+        for predecessor in dag.predecessors(node_signature):
+            if isinstance(dag.nodes[predecessor], PTask):
+                tasks.append(predecessor)
+            else:
+                stack.append(predecessor)
+    return tasks
+
+
+def _topological_sort(dag: DAG) -> Iterator[str]:
+    """Iterate over the nodes of the DAG in topological order."""
+    in_degree = dict(dag.in_degree())
+    ready = [node for node, degree in in_degree.items() if degree == 0]
+    while ready:
+        node = ready.pop()
+        yield node
+        for successor in dag.successors(node):
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                ready.append(successor)
+
+
+def _is_skipped(task: PTask) -> bool:
+    return has_mark(task, "skip") or any(
+        skipif(*mark.args, **mark.kwargs)[0] for mark in get_marks(task, "skipif")
+    )
+
+
+@contextmanager
+def _redirect_console_to_stderr() -> Iterator[None]:
+    """Keep stdout free for the JSON report."""
+    stderr = console.stderr
+    console.stderr = True
+    try:
+        yield
+    finally:
+        console.stderr = stderr
+
+
+def _print_statuses(session: Session, statuses: list[TaskStatus]) -> None:
+    editor_url_scheme = session.config.get("editor_url_scheme", "no_link")
+    outdated = [s for s in statuses if s.outcome != TaskOutcome.SKIP_UNCHANGED]
+
+    console.print()
+    if not any(s.outcome == TaskOutcome.WOULD_BE_EXECUTED for s in statuses):
+        console.print("No tasks require execution - everything is up to date.")
+    for outcome in (
+        TaskOutcome.WOULD_BE_EXECUTED,
+        TaskOutcome.PERSISTENCE,
+        TaskOutcome.SKIP,
+    ):
+        selected = [s for s in outdated if s.outcome == outcome]
+        if not selected:
+            continue
+        console.print()
+        console.rule(
+            Text(f"─── {outcome.description}", style=outcome.style),
+            align="left",
+            style=outcome.style,
+        )
+        console.print()
+        for task_status in selected:
+            console.print(
+                TaskExplanation(
+                    reasons=task_status.reasons,
+                    task=task_status.task,
+                    outcome=outcome,
+                    editor_url_scheme=editor_url_scheme,
+                )
+            )
+            console.print()
+
+    counts = dict.fromkeys(TaskOutcome, 0)
+    for task_status in statuses:
+        counts[task_status.outcome] += 1
+    summary = ", ".join(
+        f"{count} {outcome.description.lower()}"
+        for outcome, count in counts.items()
+        if count
+    )
+    console.print()
+    n_tasks = len(statuses)
+    console.print(
+        f"{n_tasks} task{'' if n_tasks == 1 else 's'}: {summary or 'none'}.",
+        highlight=False,
+    )
+
+
+@hookimpl(tryfirst=True)
+def pytask_extend_command_line_interface(cli: click.Group) -> None:
+    """Extend the command line interface."""
+    cli.add_command(status)
+
+
+@click.command(cls=ColoredCommand)
+@click.option(
+    "--json",
+    "json_",
+    is_flag=True,
+    default=False,
+    help="Print the status of all tasks as JSON.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Exit with a non-zero code if any task would be executed.",
+)
+def status(**raw_config: Any) -> NoReturn:
+    """Show which tasks would be executed and why without executing them."""
+    pm = storage.get()
+    from _pytask.cli import DEFAULTS_FROM_CLI  # noqa: PLC0415
+
+    raw_config = cast("dict[str, Any]", DEFAULTS_FROM_CLI) | raw_config
+    raw_config["command"] = "status"
+
+    with _redirect_console_to_stderr() if raw_config["json_"] else nullcontext():
+        try:
+            config = pm.hook.pytask_configure(pm=pm, raw_config=raw_config)
+            session = Session.from_config(config)
+        except (ConfigurationError, Exception):  # noqa: BLE001
+            console.print(Traceback(sys.exc_info()))
+            session = Session(exit_code=ExitCode.CONFIGURATION_FAILED)
+        else:
+            try:
+                if not session.config["json_"]:
+                    session.hook.pytask_log_session_header(session=session)
+                session.hook.pytask_collect(session=session)
+                session.dag = create_dag(session=session)
+
+                selected = {task.signature for task in select_tasks_exact(session)}
+                statuses = [
+                    s
+                    for s in collect_task_statuses(session)
+                    if s.task.signature in selected
+                ]
+
+                if session.config["json_"]:
+                    root = session.config["root"]
+                    sys.stdout.write(
+                        json.dumps({"tasks": [s.to_dict(root) for s in statuses]})
+                        + "\n"
+                    )
+                else:
+                    _print_statuses(session, statuses)
+                    console.print()
+                    console.rule(style="default")
+
+                if session.config["check"] and any(
+                    s.outcome == TaskOutcome.WOULD_BE_EXECUTED for s in statuses
+                ):
+                    session.exit_code = ExitCode.FAILED
+
+            except CollectionError:
+                session.exit_code = ExitCode.COLLECTION_FAILED
+            except ResolvingDependenciesError:
+                session.exit_code = ExitCode.DAG_FAILED
+            except Exception:  # noqa: BLE001
+                console.print(Traceback(sys.exc_info()))
+                console.rule(style="failed")
+                session.exit_code = ExitCode.FAILED
+
+        if hasattr(session.hook, "pytask_unconfigure"):
+            session.hook.pytask_unconfigure(session=session)
+    sys.exit(session.exit_code)
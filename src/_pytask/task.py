@@ -9,6 +9,7 @@ from _pytask.console import format_strings_as_flat_tree
 from _pytask.pluginmanager import hookimpl
 from _pytask.shared import find_duplicates
 from _pytask.task_utils import COLLECTED_TASKS
+from _pytask.task_utils import EXPANDED_FUNCTIONS
 from _pytask.task_utils import parse_collected_tasks_with_task_marker
 
 if TYPE_CHECKING:
@@ -87,3 +88,4 @@ def _raise_error_when_task_functions_are_duplicated(
 @hookimpl
 def pytask_unconfigure() -> None:
     COLLECTED_TASKS.clear()
+    EXPANDED_FUNCTIONS.clear()
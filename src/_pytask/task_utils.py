@@ -8,9 +8,12 @@ import inspect
 import sys
 from collections import defaultdict
 from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
 from dataclasses import asdict
 from dataclasses import is_dataclass
 from types import BuiltinFunctionType
+from types import FunctionType
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ParamSpec
@@ -25,9 +28,9 @@ from _pytask.coiled_utils import Function
 from _pytask.coiled_utils import extract_coiled_function_kwargs
 from _pytask.console import get_file
 from _pytask.mark import Mark
+from _pytask.mark_utils import get_all_marks
 from _pytask.models import CollectionMetadata
 from _pytask.models import ParsedAfter
-from _pytask.shared import find_duplicates
 from _pytask.shared import unwrap_task_function
 from _pytask.typing import TaskFunction
 from _pytask.typing import attach_task_metadata
@@ -58,6 +61,8 @@ def _is_task_decorator_target(obj: object) -> TypeGuard[Callable[..., Any]]:
 
 __all__ = [
     "COLLECTED_TASKS",
+    "EXPANDED_FUNCTIONS",
+    "expand",
     "parse_collected_tasks_with_task_marker",
     "parse_keyword_arguments_from_signature_defaults",
     "task",
@@ -74,6 +79,15 @@ dictionary mapping from paths of modules to a list of tasks per module.
 """
 
 
+EXPANDED_FUNCTIONS: dict[Path | None, list[Callable[..., Any]]] = defaultdict(list)
+"""A container for functions repeated with [`expand`][pytask.expand].
+
+The functions themselves are not collected as tasks from their modules, only their
+copies for every row of the table.
+
+"""
+
+
 @overload
 def task(
     name: Callable[P, R_co],
@@ -86,6 +100,7 @@ def task(
     name: str | None = None,
     *,
     after: AfterInput = None,
+    cache: bool = False,
     is_generator: bool = False,
     id: str | None = None,
     kwargs: dict[Any, Any] | None = None,
@@ -93,10 +108,11 @@ def task(
 ) -> Callable[[Callable[P, R_co]], TaskDecorated[P, R_co]]: ...
 
 
-def task(  # noqa: PLR0913
+def task(  # noqa: C901, PLR0913
     name: str | Callable[P, R_co] | None = None,
     *,
     after: AfterInput = None,
+    cache: bool = False,
     is_generator: bool = False,
     id: str | None = None,  # noqa: A002
     kwargs: dict[Any, Any] | None = None,
@@ -121,6 +137,16 @@ def task(  # noqa: PLR0913
         executed before this task can be executed. See
         [after](../tutorials/defining_dependencies_products.md#after) for more
         information.
+    cache
+        Whether to memoize the return values of the task across builds. If all
+        products of the task are [`PythonNode`][pytask.PythonNode]s, their values are
+        stored on disk and the task is not executed again while the task and its
+        dependencies are unchanged. See
+        [this how-to guide](../how_to_guides/using_task_returns.md#memoizing-returns)
+        for more information. For task generators, the created tasks are cached
+        instead. See [this guide](
+        ../how_to_guides/provisional_nodes_and_task_generators.md#caching-task-generators
+        ).
     is_generator
         An indicator whether this task is a task generator.
     id
@@ -235,6 +261,8 @@ def task(  # noqa: PLR0913
 
         if coiled_kwargs:
             unwrapped.pytask_meta.attributes["coiled_kwargs"] = coiled_kwargs
+        if cache:
+            unwrapped.pytask_meta.attributes["cache"] = True
 
         # Store it in the global variable ``COLLECTED_TASKS`` to avoid garbage
         # collection when the function definition is overwritten in a loop.
@@ -251,6 +279,211 @@ def task(  # noqa: PLR0913
     return wrapper
 
 
+def expand(  # noqa: PLR0913
+    func: Callable[..., Any],
+    table: Sequence[Mapping[str, Any]] | Mapping[str, Sequence[Any]],
+    *,
+    name: str | None = None,
+    ids: Sequence[str] | Callable[[dict[str, Any]], str] | None = None,
+    after: AfterInput = None,
+    is_generator: bool = False,
+    produces: Any | None = None,
+) -> list[TaskFunction]:
+    """Repeat a task function over the rows of a table.
+
+    It is a bulk version of applying [`@task`][pytask.task] in a loop. Every row of the
+    table becomes the ``kwargs`` of one task. All tasks share the signature, the
+    markers, and the parsed ``after`` of ``func`` and are registered at once.
+
+    Parameters
+    ----------
+    func
+        The task function which is repeated. It must be a user-defined function or a
+        [`functools.partial`][functools.partial].
+    table
+        Either a sequence of dictionaries, one per task, or a mapping from argument
+        names to sequences of equal length, one entry per task.
+    name
+        Use it to override the name of the tasks that is, by default, the name passed
+        to [`@task`][pytask.task] or the name of the task function.
+    ids
+        A sequence with one id per row or a callable which receives the keyword
+        arguments of a row and returns its id. By default, ids are generated like for
+        tasks repeated in a loop.
+    after
+        An expression or a task function or a list of task functions that need to be
+        executed before the tasks can be executed.
+    is_generator
+        An indicator whether the tasks are task generators.
+    produces
+        Use this argument to parse the return of the task functions as a product.
+
+    Returns
+    -------
+    list[TaskFunction]
+        The repeated task functions.
+
+    Examples
+    --------
+    ```python
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import Product
+    from pytask import expand
+
+
+    def create_file(content: str, path: Annotated[Path, Product]) -> None:
+        path.write_text(content)
+
+
+    expand(
+        create_file,
+        {"content": ["a", "b"], "path": [Path("a.txt"), Path("b.txt")]},
+        ids=["a", "b"],
+    )
+    ```
+
+    """
+    caller_frame = sys._getframe(1)
+    has_future_annotations = bool(
+        caller_frame.f_code.co_flags & __future__.annotations.compiler_flag
+    )
+    caller_locals = None if has_future_annotations else caller_frame.f_locals.copy()
+
+    if not (isinstance(name, str) or name is None):
+        msg = f"Argument 'name' of 'expand' must be a str, but it is {name!r}."
+        raise ValueError(msg)
+
+    unwrapped = unwrap_task_function(func)
+    if not isinstance(unwrapped, (FunctionType, functools.partial)):
+        msg = "'expand' only accepts user-defined functions or functools.partial."
+        raise TypeError(msg)
+
+    rows = _parse_table(table)
+    parsed_ids = _parse_expand_ids(ids, rows)
+    if name is None and isinstance(unwrapped, TaskFunction):
+        name = unwrapped.pytask_meta.name
+
+    # Everything that is identical for all tasks is computed once and shared.
+    path = get_file(unwrapped)
+    signature = inspect.signature(unwrapped)
+    parsed_name = _parse_name(unwrapped, name)
+    parsed_after = _parse_after(after)
+    markers = [mark for mark in get_all_marks(unwrapped) if mark.name != "task"]
+    markers.append(Mark("task", (), {}))
+
+    tasks = []
+    for row, id_ in zip(rows, parsed_ids, strict=True):
+        copied = _copy_task_function(unwrapped, signature)
+        attach_task_metadata(
+            copied,
+            CollectionMetadata(
+                after=parsed_after,
+                annotation_locals=caller_locals,
+                is_generator=is_generator,
+                id_=id_,
+                kwargs=row,
+                markers=markers.copy(),
+                name=parsed_name,
+                produces=produces,
+            ),
+        )
+        tasks.append(cast("TaskFunction", copied))
+
+    # The original function is left untouched and is neither collected from its module
+    # nor as a function decorated with @task.
+    EXPANDED_FUNCTIONS[path].append(unwrapped)
+    if isinstance(unwrapped, TaskFunction):
+        COLLECTED_TASKS[path] = [t for t in COLLECTED_TASKS[path] if t is not unwrapped]
+
+    COLLECTED_TASKS[path].extend(tasks)
+    return tasks
+
+
+def _parse_table(
+    table: Sequence[Mapping[str, Any]] | Mapping[str, Sequence[Any]],
+) -> list[dict[str, Any]]:
+    """Parse a table into one dictionary of keyword arguments per row."""
+    if isinstance(table, Mapping):
+        lengths = {len(column) for column in table.values()}
+        if len(lengths) > 1:
+            msg = "All columns of the table passed to 'expand' must have equal length."
+            raise ValueError(msg)
+        names = list(table)
+        columns = zip(*table.values(), strict=True)
+        return [dict(zip(names, values, strict=True)) for values in columns]
+
+    rows = []
+    for row in table:
+        if not isinstance(row, Mapping):
+            msg = (
+                "The table passed to 'expand' must be a sequence of dictionaries or a "
+                f"dictionary of columns. Got a row {row!r}, instead."
+            )
+            raise TypeError(msg)
+        rows.append(dict(row))
+    return rows
+
+
+def _parse_expand_ids(
+    ids: Sequence[str] | Callable[[dict[str, Any]], str] | None,
+    rows: list[dict[str, Any]],
+) -> list[str | None]:
+    """Parse the ids of tasks created with ``expand``."""
+    if ids is None:
+        return [None] * len(rows)
+    parsed_ids = [ids(row) for row in rows] if callable(ids) else list(ids)
+    if len(parsed_ids) != len(rows):
+        msg = (
+            f"'ids' has {len(parsed_ids)} entries, but the table passed to 'expand' "
+            f"has {len(rows)} rows."
+        )
+        raise ValueError(msg)
+    for id_ in parsed_ids:
+        if not isinstance(id_, str):
+            msg = f"All ids passed to 'expand' must be strings, but got {id_!r}."
+            raise TypeError(msg)
+    return parsed_ids
+
+
+def _copy_task_function(
+    func: FunctionType | functools.partial[Any], signature: inspect.Signature
+) -> Callable[..., Any]:
+    """Copy a task function so that every copy can carry its own metadata.
+
+    The code, globals, and closure are shared with the original and the signature is
+    attached to avoid recomputing it for every copy.
+
+    """
+    if isinstance(func, functools.partial):
+        copied_partial = functools.partial(func.func, *func.args, **func.keywords)
+        copied_partial.__signature__ = signature  # type: ignore[attr-defined]
+        return copied_partial
+
+    copied = FunctionType(
+        func.__code__,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    copied.__dict__.update(
+        {key: value for key, value in func.__dict__.items() if key != "pytask_meta"}
+    )
+    copied.__kwdefaults__ = func.__kwdefaults__
+    copied.__module__ = func.__module__
+    copied.__qualname__ = func.__qualname__
+    copied.__doc__ = func.__doc__
+    annotate = getattr(func, "__annotate__", None)
+    if annotate is None:
+        copied.__annotations__ = func.__annotations__
+    else:
+        copied.__annotate__ = annotate  # type: ignore[attr-defined]
+    copied.__signature__ = signature  # type: ignore[attr-defined]
+    return copied
+
+
 def _parse_name(func: Callable[..., Any], name: str | None) -> str:
     """Parse name from task function."""
     if name:
@@ -294,17 +527,19 @@ def parse_collected_tasks_with_task_marker(
 ) -> dict[str, TaskFunction]:
     """Parse collected tasks with a task marker."""
     parsed_tasks = _parse_tasks_with_preliminary_names(tasks)
-    all_names = {i[0] for i in parsed_tasks}
-    duplicated_names = find_duplicates([i[0] for i in parsed_tasks])
+
+    # Group tasks by name in one pass to handle large parametrizations efficiently.
+    tasks_by_name: dict[str, list[tuple[str, TaskFunction]]] = defaultdict(list)
+    for name, function in parsed_tasks:
+        tasks_by_name[name].append((name, function))
 
     collected_tasks = {}
-    for name in all_names:
-        if name in duplicated_names:
-            selected_tasks = [i for i in parsed_tasks if i[0] == name]
+    for name, selected_tasks in tasks_by_name.items():
+        if len(selected_tasks) > 1:
             names_to_functions = _generate_ids_for_tasks(selected_tasks)
             collected_tasks.update(names_to_functions)
         else:
-            collected_tasks[name] = next(i[1] for i in parsed_tasks if i[0] == name)
+            collected_tasks[name] = selected_tasks[0][1]
 
     return collected_tasks
 
@@ -0,0 +1,133 @@
+"""Cache loaded values of dependencies in memory.
+
+When many tasks depend on the same node, its value is loaded once for every task. With
+``value_cache_size``, the loaded values of nodes which declare that their values can be
+shared are kept in memory and passed to all tasks which depend on them. The cache is
+keyed by the signature and the state of the node, so a value is loaded again when the
+node changes. The least recently used values are removed when the estimated size of the
+cached values exceeds the limit.
+
+A node shares its values if its ``share_value`` attribute is true, for example,
+``PickleNode(path=..., share_value=True)``. Tasks receive the same object, so tasks must
+not modify shared values.
+
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+from _pytask.artifact_cache import parse_size
+from _pytask.node_protocols import PPathNode
+from _pytask.path import is_non_local_path
+from _pytask.pluginmanager import hookimpl
+
+if TYPE_CHECKING:
+    from _pytask.node_protocols import PNode
+    from _pytask.session import Session
+
+
+__all__ = ["ValueCache"]
+
+
+@dataclass
+class ValueCache:
+    """An in-memory cache of loaded values of nodes.
+
+    Attributes
+    ----------
+    max_size
+        The maximum estimated size of the cached values in bytes.
+    size
+        The estimated size of the cached values in bytes.
+
+    """
+
+    max_size: int
+    size: int = 0
+    _entries: OrderedDict[str, tuple[str, Any, int]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+
+    def load(self, node: PNode) -> Any:
+        """Load the value of a node or return the cached value."""
+        if not getattr(node, "share_value", False):
+            return node.load()
+
+        state = node.state()
+        entry = self._entries.get(node.signature)
+        if entry is not None and state is not None and entry[0] == state:
+            self._entries.move_to_end(node.signature)
+            return entry[1]
+
+        value = node.load()
+        self.discard(node.signature)
+        if state is not None:
+            size = _estimate_size(node, value)
+            if size <= self.max_size:
+                self._entries[node.signature] = (state, value, size)
+                self.size += size
+                self._evict()
+        return value
+
+    def discard(self, signature: str) -> None:
+        """Remove the value of a node from the cache."""
+        entry = self._entries.pop(signature, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        self._entries.clear()
+        self.size = 0
+
+    def _evict(self) -> None:
+        while self.size > self.max_size:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.size -= size
+
+
+def _estimate_size(node: PNode, value: Any) -> int:
+    """Estimate the size of a value in memory.
+
+    Arrays report their size. For other values, the size of the file of the node is a
+    better estimate than the shallow size of the object.
+
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(node, PPathNode) and not is_non_local_path(node.path):
+        with suppress(OSError):
+            return node.path.stat().st_size
+    return sys.getsizeof(value)
+
+
+@hookimpl
+def pytask_parse_config(config: dict[str, Any]) -> None:
+    """Parse the size of the cache of loaded values."""
+    config["value_cache_size"] = parse_size(config.get("value_cache_size"))
+
+
+@hookimpl
+def pytask_post_parse(config: dict[str, Any]) -> None:
+    """Initialize the cache of loaded values."""
+    if (
+        config.get("command") in (None, "build")
+        and config["value_cache_size"] is not None
+    ):
+        config["value_cache"] = ValueCache(max_size=config["value_cache_size"])
+
+
+@hookimpl
+def pytask_unconfigure(session: Session) -> None:
+    """Release the cached values."""
+    cache: ValueCache | None = session.config.get("value_cache")
+    if cache is not None:
+        cache.clear()
@@ -49,11 +49,12 @@ from _pytask.node_protocols import PProvisionalNode
 from _pytask.node_protocols import PTask
 from _pytask.node_protocols import PTaskWithPath
 from _pytask.nodes import DirectoryNode
+from _pytask.nodes import NumpyNode
 from _pytask.nodes import PathNode
 from _pytask.nodes import PickleNode
 from _pytask.nodes import PythonNode
 from _pytask.nodes import Task
-from _pytask.nodes import TaskWithoutPath, get_state_of_path
+from _pytask.nodes import TaskWithoutPath, get_state_of_function, get_state_of_path
 from _pytask.outcomes import CollectionOutcome
 from _pytask.outcomes import Exit
 from _pytask.outcomes import ExitCode
@@ -70,6 +71,7 @@ from _pytask.reports import CollectionReport
 from _pytask.reports import DagReport
 from _pytask.reports import ExecutionReport
 from _pytask.session import Session
+from _pytask.task_utils import expand
 from _pytask.task_utils import task
 from _pytask.traceback import Traceback
 from _pytask.typing import Product
@@ -110,6 +112,7 @@ __all__ = [
     "NodeLoadError",
     "NodeNotCollectedError",
     "NodeNotFoundError",
+    "NumpyNode",
     "PNode",
     "PPathNode",
     "PProvisionalNode",
@@ -143,9 +146,11 @@ __all__ = [
     "console",
     "count_outcomes",
     "create_database",
+    "expand",
     "get_all_marks",
     "get_marks",
     "get_plugin_manager",
+    "get_state_of_function",
     "get_state_of_path",
     "has_mark",
     "hash_value",
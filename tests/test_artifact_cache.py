@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import textwrap
+
+import pytest
+
+import _pytask.artifact_cache
+import _pytask.path
+from _pytask.artifact_cache import ArtifactCache
+from _pytask.artifact_cache import _is_cacheable
+from _pytask.artifact_cache import parse_size
+from pytask import ExitCode
+from pytask import PathNode
+from pytask import PickleNode
+from pytask import Task
+from pytask import cli
+from pytask import get_state_of_path
+
+
+def _write_project(path, cache_dir, restore="auto"):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import PickleNode
+    from pytask import Product
+
+
+    def task_example(
+        depends_on: Path = Path("in.txt"),
+        path: Annotated[Path, Product] = Path("out.txt"),
+        pickle: Annotated[PickleNode, Product] = PickleNode(path=Path("out.pkl")),
+    ) -> None:
+        calls = Path(__file__).parent / "calls.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+        path.write_text(depends_on.read_text())
+        pickle.save({"content": depends_on.read_text()})
+    """
+    path.mkdir()
+    path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    path.joinpath("in.txt").write_text("Hello")
+    path.joinpath("pyproject.toml").write_text(
+        f"[tool.pytask.ini_options]\ncache_dir = {cache_dir.as_posix()!r}\n"
+        f"cache_restore = {restore!r}"
+    )
+
+
+def test_restore_products_from_shared_cache(runner, tmp_path):
+    cache_dir = tmp_path / "cache"
+    _write_project(tmp_path / "first", cache_dir)
+    _write_project(tmp_path / "second", cache_dir)
+
+    result = runner.invoke(cli, [tmp_path.joinpath("first").as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("first", "calls.txt").read_text() == "."
+    assert len(list(cache_dir.joinpath("entries").iterdir())) == 1
+
+    result = runner.invoke(cli, [tmp_path.joinpath("second").as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert not tmp_path.joinpath("second", "calls.txt").exists()
+    assert tmp_path.joinpath("second", "out.txt").read_text() == "Hello"
+    assert (
+        tmp_path.joinpath("second", "out.pkl").read_bytes()
+        == tmp_path.joinpath("first", "out.pkl").read_bytes()
+    )
+
+    result = runner.invoke(cli, [tmp_path.joinpath("second").as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "1  Skipped because unchanged" in result.output
+
+
+def test_execute_task_if_inputs_differ_or_objects_are_missing(runner, tmp_path):
+    cache_dir = tmp_path / "cache"
+    _write_project(tmp_path / "first", cache_dir)
+    _write_project(tmp_path / "second", cache_dir)
+    _write_project(tmp_path / "third", cache_dir)
+    tmp_path.joinpath("second", "in.txt").write_text("Changed")
+
+    runner.invoke(cli, [tmp_path.joinpath("first").as_posix()])
+    result = runner.invoke(cli, [tmp_path.joinpath("second").as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("second", "calls.txt").read_text() == "."
+    assert tmp_path.joinpath("second", "out.txt").read_text() == "Changed"
+
+    shutil.rmtree(cache_dir / "objects")
+    result = runner.invoke(cli, [tmp_path.joinpath("third").as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("third", "calls.txt").read_text() == "."
+
+
+@pytest.mark.parametrize(
+    ("restore", "expected_links"), [("auto", 3), ("reflink", 1), ("copy", 1)]
+)
+def test_restore_products_with_strategy(
+    runner, tmp_path, monkeypatch, restore, expected_links
+):
+    monkeypatch.setattr(_pytask.artifact_cache, "_reflink", lambda *_: False)
+    cache_dir = tmp_path / "cache"
+    _write_project(tmp_path / "first", cache_dir, restore)
+    _write_project(tmp_path / "second", cache_dir, restore)
+    _write_project(tmp_path / "third", cache_dir, restore)
+
+    for name in ("first", "second", "third"):
+        result = runner.invoke(cli, [tmp_path.joinpath(name).as_posix()])
+        assert result.exit_code == ExitCode.OK
+
+    assert not tmp_path.joinpath("third", "calls.txt").exists()
+    assert tmp_path.joinpath("third", "out.txt").stat().st_nlink == expected_links
+
+
+def test_execute_task_again_without_modifying_hardlinked_object(
+    runner, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(_pytask.artifact_cache, "_reflink", lambda *_: False)
+    cache_dir = tmp_path / "cache"
+    _write_project(tmp_path / "first", cache_dir)
+    _write_project(tmp_path / "second", cache_dir)
+    runner.invoke(cli, [tmp_path.joinpath("first").as_posix()])
+    runner.invoke(cli, [tmp_path.joinpath("second").as_posix()])
+    product = tmp_path.joinpath("second", "out.txt")
+    assert product.stat().st_nlink == 2
+    assert not product.stat().st_mode & stat.S_IWUSR
+
+    tmp_path.joinpath("second", "in.txt").write_text("Changed")
+    result = runner.invoke(cli, [tmp_path.joinpath("second").as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert product.read_text() == "Changed"
+    assert product.stat().st_nlink == 1
+    assert tmp_path.joinpath("first", "out.txt").read_text() == "Hello"
+    objects = [p for p in cache_dir.joinpath("objects").rglob("*") if p.is_file()]
+    assert {p.read_bytes() for p in objects} >= {b"Hello", b"Changed"}
+
+
+@pytest.mark.parametrize("restore", ["auto", "copy"])
+def test_restore_does_not_hash_products(tmp_path, monkeypatch, restore):
+    cache = ArtifactCache(
+        path=tmp_path / "cache", root=tmp_path, restore_strategy=restore
+    )
+    tmp_path.joinpath("out.txt").write_text("Hello")
+    task = Task(
+        base_name="task_example",
+        path=tmp_path / "task_example.py",
+        function=lambda: None,
+        produces={"path": PathNode(path=tmp_path / "out.txt")},
+    )
+    cache.store(task, "key")
+    tmp_path.joinpath("out.txt").unlink()
+
+    monkeypatch.setattr(
+        _pytask.path, "file_digest", lambda *_: pytest.fail("The product was hashed.")
+    )
+
+    assert cache.restore(task, "key")
+    assert tmp_path.joinpath("out.txt").read_text() == "Hello"
+    assert get_state_of_path(tmp_path / "out.txt") is not None
+
+
+@pytest.mark.parametrize(("out_of_band", "expected"), [(False, True), (True, False)])
+def test_pickle_nodes_with_out_of_band_buffers_are_not_cached(
+    tmp_path, out_of_band, expected
+):
+    node = PickleNode(path=tmp_path / "out.pkl", out_of_band=out_of_band)
+    task = Task(
+        base_name="task_example",
+        path=tmp_path / "task_example.py",
+        function=lambda: None,
+        produces={"node": node},
+    )
+    assert _is_cacheable(task) is expected
+
+
+@pytest.mark.parametrize(
+    ("restore", "reflink", "expected_links"),
+    [("auto", False, 2), ("auto", True, 1), ("copy", False, 1)],
+)
+def test_restore_marks_objects_as_recently_used(
+    tmp_path, monkeypatch, restore, reflink, expected_links
+):
+    def _reflink(source, destination):
+        if reflink:
+            shutil.copyfile(source, destination)
+        return reflink
+
+    monkeypatch.setattr(_pytask.artifact_cache, "_reflink", _reflink)
+    cache = ArtifactCache(
+        path=tmp_path / "cache", root=tmp_path, restore_strategy=restore
+    )
+    tmp_path.joinpath("out.txt").write_text("Hello")
+    task = Task(
+        base_name="task_example",
+        path=tmp_path / "task_example.py",
+        function=lambda: None,
+        produces={"path": PathNode(path=tmp_path / "out.txt")},
+    )
+    cache.store(task, "key")
+    tmp_path.joinpath("out.txt").unlink()
+    (object_path,) = (
+        p for p in cache.path.joinpath("objects").rglob("*") if p.is_file()
+    )
+    os.utime(object_path, (0, 0))
+
+    assert cache.restore(task, "key")
+
+    assert object_path.stat().st_mtime > 0
+    assert tmp_path.joinpath("out.txt").stat().st_nlink == expected_links
+    assert get_state_of_path(tmp_path / "out.txt") == object_path.name
+
+
+def test_evict_least_recently_used_files(tmp_path):
+    cache = ArtifactCache(path=tmp_path / "cache", root=tmp_path, max_size=10)
+    for i, name in enumerate(("old", "new")):
+        path = cache.path.joinpath("objects", name[:2], name)
+        path.parent.mkdir()
+        path.write_text("x" * 6)
+        os.utime(path, (i, i))
+
+    cache.evict()
+
+    assert not cache.path.joinpath("objects", "ol", "old").exists()
+    assert cache.path.joinpath("objects", "ne", "new").exists()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), (1024, 1024), ("100", 100), ("10 kb", 10_000), ("1.5GB", 1.5e9)],
+)
+def test_parse_size(value, expected):
+    assert parse_size(value) == expected
+
+
+def test_parse_invalid_size():
+    with pytest.raises(ValueError, match="Invalid size"):
+        parse_size("a lot")
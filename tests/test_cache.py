@@ -54,6 +54,20 @@ def test_cache_add():
     assert cache.cache_info.misses == 1
 
 
+def test_cache_prime():
+    cache = Cache()
+
+    @cache.memoize
+    def func(a, b):
+        return a + b
+
+    func.prime(10, 1, b=2)
+
+    assert func(1, 2) == 10
+    assert cache.cache_info.hits == 1
+    assert cache.cache_info.misses == 0
+
+
 def test_make_memoize_key():
     def func(a, b):  # pragma: no cover
         return a + b
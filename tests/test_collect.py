@@ -10,6 +10,7 @@ import pytest
 import upath
 
 from _pytask.collect import _find_shortest_uniquely_identifiable_name_for_tasks
+from _pytask.collect import _ShortTaskNameTrie
 from _pytask.collect import pytask_collect_node
 from _pytask.node_protocols import PPathNode
 from pytask import CollectionOutcome
@@ -336,6 +337,32 @@ def test_find_shortest_uniquely_identifiable_names_for_tasks(tmp_path):
     assert result == expected
 
 
+def test_short_task_names_are_updated_when_tasks_are_added(tmp_path):
+    trie = _ShortTaskNameTrie()
+    task_a = Task(base_name="task_t", path=tmp_path / "a" / "t.py", function=noop)
+    assert trie.add(task_a) == [task_a]
+    assert trie.get_short_name(task_a) == "t.py::task_t"
+
+    task_b = Task(base_name="task_t", path=tmp_path / "b" / "t.py", function=noop)
+    assert trie.add(task_b) == [task_b, task_a]
+    assert trie.get_short_name(task_a) == "a/t.py::task_t"
+    assert trie.get_short_name(task_b) == "b/t.py::task_t"
+
+    # Unrelated tasks do not affect existing names and adding a task twice is a no-op.
+    task_c = Task(base_name="task_c", path=tmp_path / "a" / "t.py", function=noop)
+    assert trie.add(task_c) == [task_c]
+    assert trie.add(task_c) == []
+
+
+def test_short_task_name_falls_back_to_full_name_for_duplicates(tmp_path):
+    tasks = [
+        Task(base_name="task_t", path=tmp_path / "t.py", function=noop)
+        for _ in range(2)
+    ]
+    result = _find_shortest_uniquely_identifiable_name_for_tasks(tasks)
+    assert result == {tasks[0].name: tasks[0].name}
+
+
 def test_collect_dependencies_from_args_if_depends_on_is_missing(tmp_path):
     source = """
     from pathlib import Path
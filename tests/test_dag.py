@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 import textwrap
 from pathlib import Path
@@ -56,6 +57,27 @@ def test_cycle_in_dag(tmp_path, runner, snapshot_cli):
         assert result.output == snapshot_cli()
 
 
+def test_report_all_cycles_in_dag(tmp_path, runner):
+    source = """
+    from pathlib import Path
+
+    def task_1(path = Path("out_2.txt"), produces = Path("out_1.txt")): ...
+
+    def task_2(path = Path("out_1.txt"), produces = Path("out_2.txt")): ...
+
+    def task_3(path = Path("out_4.txt"), produces = Path("out_3.txt")): ...
+
+    def task_4(path = Path("out_3.txt"), produces = Path("out_4.txt")): ...
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.DAG_FAILED
+    for i in range(1, 5):
+        assert f"task_module.py::task_{i}" in result.output
+
+
 def test_two_tasks_have_the_same_product(tmp_path, runner, snapshot_cli):
     source = """
     from pathlib import Path
@@ -105,3 +127,86 @@ def test_python_nodes_are_unique(tmp_path):
 
     assert session.exit_code == ExitCode.OK
     assert len(session.dag.nodes) == 4
+
+
+def test_build_with_array_dag(tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    def task_first() -> Annotated[str, Path("out.txt")]:
+        return "Hello"
+
+    def task_second(path: Path = Path("out.txt")) -> Annotated[str, Path("copy.txt")]:
+        return path.read_text()
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, dag_implementation="array")
+
+    assert session.exit_code == ExitCode.OK
+    assert type(session.dag).__name__ == "ArrayDAG"
+    assert tmp_path.joinpath("copy.txt").read_text() == "Hello"
+
+
+def test_raise_error_for_unknown_dag_implementation(tmp_path):
+    session = build(paths=tmp_path, dag_implementation="unknown")
+    assert session.exit_code == ExitCode.CONFIGURATION_FAILED
+
+
+def test_dag_is_restored_from_snapshot(tmp_path, monkeypatch):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    def task_first() -> Annotated[str, Path("out.txt")]:
+        return "Hello"
+
+    def task_second(path: Path = Path("out.txt")) -> Annotated[str, Path("copy.txt")]:
+        return path.read_text()
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path)
+    assert session.exit_code == ExitCode.OK
+    assert tmp_path.joinpath(".pytask", "dag.json").exists()
+    dag = session.dag
+
+    def _fail(**_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr("_pytask.dag._create_dag_from_tasks", _fail)
+    session = build(paths=tmp_path, force=True)
+    assert session.exit_code == ExitCode.OK
+    assert session.dag._successors == dag._successors
+    assert tmp_path.joinpath("copy.txt").read_text() == "Hello"
+
+    # The DAG is built again if the fingerprint of the tasks differs.
+    path = tmp_path.joinpath(".pytask", "dag.json")
+    snapshot = json.loads(path.read_text())
+    path.write_text(json.dumps({**snapshot, "fingerprint": "outdated"}))
+    session = build(paths=tmp_path)
+    assert session.exit_code == ExitCode.DAG_FAILED
+
+
+def test_corrupt_dag_snapshot_is_discarded(tmp_path):
+    tmp_path.joinpath("task_example.py").write_text("def task_example(): pass")
+    tmp_path.joinpath(".pytask").mkdir()
+    tmp_path.joinpath(".pytask", "dag.json").write_text("{")
+
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert len(session.dag.nodes) == 1
+
+
+def test_dag_snapshot_is_only_written_by_build(runner, tmp_path):
+    tmp_path.joinpath("task_example.py").write_text("def task_example(): pass")
+
+    result = runner.invoke(cli, ["collect", tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert not tmp_path.joinpath(".pytask", "dag.json").exists()
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath(".pytask", "dag.json").exists()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import importlib
+import json
 import os
 import subprocess
 import sys
 import textwrap
+from xml.etree import ElementTree as ET
 
 import pytest
 
@@ -293,3 +295,105 @@ def test_raise_error_with_graph_via_task_missing_optional_program(
     assert "conda" in result.output
     assert "Traceback" in result.output
     assert not tmp_path.joinpath("dag.png").exists()
+
+
+@pytest.mark.parametrize("format_", ["dot", "gv", "graphml", "jsonl"])
+def test_export_graph_without_optional_dependencies(
+    monkeypatch, tmp_path, runner, format_
+):
+    monkeypatch.setattr(
+        "_pytask.compat.import_module",
+        lambda x: _raise_exc(ImportError(f"{x} not found")),
+    )
+    source = """
+    from pathlib import Path
+
+    def task_example(path=Path("in.txt"), produces=Path("out.txt")): ...
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").touch()
+    path = tmp_path.joinpath(f"dag.{format_}")
+
+    result = runner.invoke(cli, ["dag", tmp_path.as_posix(), "-o", path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    content = path.read_text()
+    if format_ == "graphml":
+        root = ET.fromstring(content)  # noqa: S314
+        namespace = "{http://graphml.graphdrawing.org/xmlns}"
+        assert len(root.findall(f".//{namespace}node")) == 3
+        assert len(root.findall(f".//{namespace}edge")) == 2
+    elif format_ == "jsonl":
+        records = [json.loads(line) for line in content.splitlines()]
+        prefix = f"{tmp_path.name}/"
+        labels = {
+            r["id"]: r["label"].removeprefix(prefix) for r in records if "id" in r
+        }
+        edges = {
+            (labels[r["source"]], labels[r["target"]]) for r in records if "source" in r
+        }
+        assert edges == {
+            ("in.txt", "task_example.py::task_example"),
+            ("task_example.py::task_example", "out.txt"),
+        }
+    else:
+        assert content.startswith("digraph {")
+        assert content.count("->") == 2
+        assert "shape=hexagon" in content
+
+
+def test_export_graph_aggregated_by_module(tmp_path, runner):
+    source_a = """
+    from pathlib import Path
+
+    def task_first(produces=Path("first.txt")): ...
+
+    def task_second(produces=Path("second.txt")): ...
+    """
+    source_b = """
+    from pathlib import Path
+
+    def task_merge(
+        first=Path("first.txt"), second=Path("second.txt"), produces=Path("out.txt")
+    ): ...
+    """
+    tmp_path.joinpath("task_a.py").write_text(textwrap.dedent(source_a))
+    tmp_path.joinpath("task_b.py").write_text(textwrap.dedent(source_b))
+    path = tmp_path.joinpath("dag.jsonl")
+
+    result = runner.invoke(
+        cli,
+        ["dag", tmp_path.as_posix(), "-o", path.as_posix(), "--aggregate", "module"],
+    )
+
+    assert result.exit_code == ExitCode.OK
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records == [
+        {"id": 0, "label": f"{tmp_path.name}/task_a.py", "kind": "module"},
+        {"id": 1, "label": f"{tmp_path.name}/task_b.py", "kind": "module"},
+        {"source": 0, "target": 1},
+    ]
+
+
+@pytest.mark.parametrize("format_", ["dot", "gv"])
+def test_export_dot_with_layout_uses_graphviz(monkeypatch, tmp_path, runner, format_):
+    monkeypatch.setattr(
+        "_pytask.compat.import_module",
+        lambda x: _raise_exc(ImportError(f"{x} not found")),
+    )
+    source = """
+    from pathlib import Path
+
+    def task_example(path=Path("in.txt")): ...
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").touch()
+    path = tmp_path.joinpath(f"dag.{format_}")
+
+    result = runner.invoke(
+        cli, ["dag", tmp_path.as_posix(), "-o", path.as_posix(), "-l", "neato"]
+    )
+
+    assert result.exit_code == ExitCode.FAILED
+    assert "pytask requires the optional dependency 'networkx'." in result.output
+    assert not path.exists()
@@ -5,19 +5,25 @@ from pathlib import Path
 import pytest
 
 from _pytask.dag_graph import DAG
+from _pytask.dag_graph import ArrayDAG
+from _pytask.dag_graph import find_cycles
 from _pytask.dag_utils import descending_tasks
+from _pytask.dag_utils import mark_descending_tasks
 from _pytask.dag_utils import node_and_neighbors
 from _pytask.dag_utils import task_and_descending_tasks
+from _pytask.dag_utils import task_and_preceding_tasks
+from _pytask.dag_utils import tasks_and_preceding_tasks
 from _pytask.scheduler import SimpleScheduler
 from pytask import Mark
+from pytask import PathNode
 from pytask import Task
 from tests.conftest import noop
 
 
-@pytest.fixture
-def dag():
+@pytest.fixture(params=[DAG, ArrayDAG])
+def dag(request):
     """Create a dag with five nodes in a line."""
-    dag = DAG()
+    dag = request.param()
     for i in range(4):
         task = Task(base_name=str(i), path=Path(), function=noop)
         next_task = Task(base_name=str(i + 1), path=Path(), function=noop)
@@ -49,6 +55,23 @@ def test_descending_tasks(dag):
         assert descendant_names == [f".::{i}" for i in range(i + 1, 5)]
 
 
+def test_mark_descending_tasks(dag):
+    signatures = {dag.nodes[sig].name: sig for sig in dag.nodes}
+    mark = Mark("skip_ancestor_failed", (), {"reason": "Previous task failed."})
+
+    assert mark_descending_tasks(signatures[".::1"], dag, mark) == 3
+    for i in range(2, 5):
+        (result,) = dag.nodes[signatures[f".::{i}"]].markers
+        assert result is mark
+    assert not dag.nodes[signatures[".::1"]].markers
+
+    # Already marked subtrees are not visited again.
+    other_mark = Mark("skip_ancestor_failed", (), {"reason": "Other task failed."})
+    assert mark_descending_tasks(signatures[".::0"], dag, other_mark) == 1
+    assert dag.nodes[signatures[".::1"]].markers == [other_mark]
+    assert dag.nodes[signatures[".::4"]].markers == [mark]
+
+
 def test_task_and_descending_tasks(dag):
     for i in range(5):
         task = next(
@@ -59,6 +82,29 @@ def test_task_and_descending_tasks(dag):
         assert descendant_names == [f".::{i}" for i in range(i, 5)]
 
 
+def test_tasks_and_preceding_tasks(dag):
+    name_to_signature = {dag.nodes[sig].name: sig for sig in dag.nodes}
+    seeds = [name_to_signature[".::1"], name_to_signature[".::3"]]
+
+    result = tasks_and_preceding_tasks(seeds, dag)
+
+    assert sorted(dag.nodes[sig].name for sig in result) == [
+        f".::{i}" for i in range(4)
+    ]
+    assert result == set().union(
+        *(task_and_preceding_tasks(seed, dag) for seed in seeds)
+    )
+
+
+def test_descendants_of_nodes(dag):
+    name_to_signature = {dag.nodes[sig].name: sig for sig in dag.nodes}
+    seeds = [name_to_signature[".::1"], name_to_signature[".::3"]]
+
+    result = dag.descendants_of_nodes(seeds)
+
+    assert result == dag.descendants(seeds[0]) | dag.descendants(seeds[1])
+
+
 def test_node_and_neighbors(dag):
     for i in range(1, 4):
         task = next(
@@ -130,3 +176,57 @@ def test_instantiate_sorter_from_other_sorter(dag):
         task_name = new_scheduler.get_ready()[0]
         new_scheduler.done(task_name)
     assert new_scheduler._nodes_done == set(name_to_sig.values()) | {task.signature}
+
+
+def test_array_dag_behaves_like_dag():
+    dags = (DAG(), ArrayDAG())
+    tasks = [Task(base_name=str(i), path=Path(), function=noop) for i in range(4)]
+    a, b, c, d = (task.signature for task in tasks)
+
+    for dag in dags:
+        for task in tasks:
+            dag.add_node(task.signature, task)
+        dag.add_edge(a, b)
+        dag.add_edge(b, c)
+        assert dag.descendants(a) == {b, c}
+
+        # Edges added after a traversal, duplicates, and removed nodes.
+        dag.add_edge(c, d)
+        dag.add_edge(a, b)
+        assert list(dag.successors(a)) == [b]
+        assert dag.descendants(a) == {b, c, d}
+        dag.remove_nodes_from([b])
+        assert dag.descendants(a) == set()
+        assert dag.ancestors(d) == {c}
+        assert dict(dag.in_degree()) == {a: 0, c: 0, d: 1}
+        assert list(dag.nodes) == [a, c, d]
+
+    assert dags[1] == dags[0]
+    assert dags[1].relabel_nodes({a: "a"}).nodes["a"] is tasks[0]
+
+
+@pytest.mark.parametrize("dag_class", [DAG, ArrayDAG])
+def test_find_cycles_in_long_chain_reports_every_cycle(dag_class):
+    dag = dag_class()
+    n_nodes = 10_000
+    for i in range(n_nodes):
+        dag.add_node(str(i), PathNode(name=str(i), path=Path(str(i))))
+    for i in range(n_nodes - 1):
+        dag.add_edge(str(i), str(i + 1))
+    assert find_cycles(dag) == []
+
+    dag.add_edge("20", "10")
+    dag.add_edge(str(n_nodes - 1), str(n_nodes - 3))
+    dag.add_edge("5", "5")
+
+    cycles = find_cycles(dag)
+
+    assert cycles == [
+        [("5", "5")],
+        [(str(i), str(i + 1)) for i in range(10, 20)] + [("20", "10")],
+        [
+            (str(n_nodes - 3), str(n_nodes - 2)),
+            (str(n_nodes - 2), str(n_nodes - 1)),
+            (str(n_nodes - 1), str(n_nodes - 3)),
+        ],
+    ]
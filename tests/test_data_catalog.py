@@ -4,6 +4,7 @@ import hashlib
 import pickle
 import sys
 import textwrap
+from functools import partial
 from pathlib import Path
 
 import pytest
@@ -45,6 +46,16 @@ def test_change_default_node():
     assert isinstance(default_node, PythonNode)
 
 
+def test_change_options_of_default_node():
+    data_catalog = DataCatalog(default_node=partial(PickleNode, compression="lzma"))
+    default_node = data_catalog["compressed_node"]
+    assert isinstance(default_node, PickleNode)
+    assert default_node.compression == "lzma"
+
+    default_node.save(1)
+    assert default_node.load() == 1
+
+
 def test_default_node_factory_must_return_node():
     class InvalidNode:
         def __init__(self, *, name):
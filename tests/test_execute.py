@@ -14,6 +14,7 @@ import pytest
 import pytask
 from _pytask.mark import MARK_GEN
 from _pytask.path import HashPathCache
+from _pytask.staleness import find_unchanged_tasks
 from pytask import CaptureMethod
 from pytask import ExitCode
 from pytask import NodeNotFoundError
@@ -1026,3 +1027,140 @@ def test_download_file(runner, tmp_path):
     assert result.exit_code == ExitCode.OK
     assert "1  Succeeded" in result.output
     assert "Hello, World!" in tmp_path.joinpath("data.csv").read_text()
+
+
+def test_skip_unchanged_tasks_before_execution(tmp_path, monkeypatch):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    def task_first(path: Path = Path("in.txt")) -> Annotated[str, Path("first.txt")]:
+        return path.read_text()
+
+    def task_second(path: Path = Path("first.txt")) -> Annotated[str, Path("out.txt")]:
+        return path.read_text()
+
+    def task_other() -> Annotated[str, Path("other.txt")]:
+        return "Other"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("Hello")
+    session = build(paths=tmp_path)
+    assert session.exit_code == ExitCode.OK
+
+    results = []
+
+    def _find_unchanged_tasks(session):
+        unchanged = find_unchanged_tasks(session)
+        results.append({session.dag.nodes[s].base_name for s in unchanged})
+        return unchanged
+
+    monkeypatch.setattr("_pytask.execute.find_unchanged_tasks", _find_unchanged_tasks)
+    tmp_path.joinpath("in.txt").write_text("Changed")
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert results == [{"task_other"}]
+    outcomes = {r.task.base_name: r.outcome for r in session.execution_reports}
+    assert outcomes == {
+        "task_other": TaskOutcome.SKIP_UNCHANGED,
+        "task_first": TaskOutcome.SUCCESS,
+        "task_second": TaskOutcome.SUCCESS,
+    }
+    assert tmp_path.joinpath("out.txt").read_text() == "Changed"
+
+
+def test_skip_unchanged_tasks_before_execution_are_processed(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    def task_example() -> Annotated[str, Path("out.txt")]:
+        return "Hello"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    hooks = """
+    from pathlib import Path
+    from pytask import hookimpl
+
+    @hookimpl
+    def pytask_execute_task_process_report(report):
+        path = Path(__file__).parent.joinpath("outcomes.txt")
+        with path.open("a") as f:
+            f.write(f"{report.task.base_name} {report.outcome.name}\\n")
+    """
+    tmp_path.joinpath("hooks.py").write_text(textwrap.dedent(hooks))
+    hooks_path = tmp_path.joinpath("hooks.py").as_posix()
+    args = [tmp_path.as_posix(), "--hook-module", hooks_path]
+
+    result = runner.invoke(cli, args)
+    assert result.exit_code == ExitCode.OK
+    result = runner.invoke(cli, args)
+    assert result.exit_code == ExitCode.OK
+
+    outcomes = tmp_path.joinpath("outcomes.txt").read_text().splitlines()
+    assert outcomes == ["task_example SUCCESS", "task_example SKIP_UNCHANGED"]
+
+
+def test_task_state_of_function_ignores_other_functions_in_module(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    def task_first() -> Annotated[str, Path("first.txt")]:
+        return "first"
+
+    def task_second() -> Annotated[str, Path("second.txt")]:
+        return "second"
+    """
+    tmp_path.joinpath("pyproject.toml").write_text(
+        '[tool.pytask.ini_options]\ntask_state = "function"'
+    )
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert 'state = "function:' in tmp_path.joinpath("pytask.lock").read_text()
+    modified = tmp_path.joinpath("first.txt").stat().st_mtime_ns
+
+    source = source.replace('return "second"', 'return "changed"').replace(
+        "def task_first()", "# A comment.\n    def task_first()"
+    )
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("first.txt").stat().st_mtime_ns == modified
+    assert tmp_path.joinpath("second.txt").read_text() == "changed"
+
+
+def test_task_state_of_function_includes_decorator_arguments(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import task
+
+    DATA = {"a": 1, "b": 2}
+
+    for k in DATA:
+
+        @task(id=k, kwargs={"value": DATA[k]})
+        def task_example(value: int) -> Annotated[str, Path(f"out_{k}.txt")]:
+            return str(value)
+    """
+    tmp_path.joinpath("pyproject.toml").write_text(
+        '[tool.pytask.ini_options]\ntask_state = "function"'
+    )
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("out_a.txt").read_text() == "1"
+
+    source = source.replace('"a": 1', '"a": 100')
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert "1  Succeeded" in result.output
+    assert "1  Skipped because unchanged" in result.output
+    assert tmp_path.joinpath("out_a.txt").read_text() == "100"
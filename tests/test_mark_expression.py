@@ -201,3 +201,8 @@ def test_backslash_not_treated_specially() -> None:
     assert not evaluate(r"foo", matcher)
     with pytest.raises(ParseError):
         evaluate("\nfoo\n", matcher)
+
+
+def test_compiled_expressions_are_cached() -> None:
+    assert Expression.compile_("a and b").code is Expression.compile_("a and b").code
+    assert Expression.compile_("a and b").code is not Expression.compile_("a or b").code
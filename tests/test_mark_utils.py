@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
 import pytest
 
 import pytask
+from _pytask.mark_utils import MarkerList
 from pytask import CollectionMetadata
 from pytask import Task
 from pytask import get_all_marks
@@ -241,3 +243,36 @@ def test_set_marks_to_obj(markers):
 
     result = set_marks(func, markers)
     assert result.pytask_meta.markers == markers  # type: ignore[union-attr]
+
+
+def test_marker_index_is_kept_in_sync():
+    task = Task(base_name="name", path=Path(), function=noop)
+    assert isinstance(task.markers, MarkerList)
+    assert not has_mark(task, "skip")
+
+    task.markers.append(pytask.mark.skip())
+    task.markers.extend([pytask.mark.mark1(), pytask.mark.skip(reason="a")])
+    assert has_mark(task, "skip")
+    assert get_marks(task, "skip") == [pytask.mark.skip(), pytask.mark.skip(reason="a")]
+
+    task.markers.insert(0, pytask.mark.mark2())
+    task.markers.remove(pytask.mark.skip())
+    del task.markers[-1]
+    assert get_marks(task, "skip") == []
+    assert not has_mark(task, "skip")
+    assert get_marks(task, "mark2") == [pytask.mark.mark2()]
+
+    task.markers.clear()
+    assert not has_mark(task, "mark1")
+
+
+def test_markers_passed_to_task_are_indexed_and_picklable():
+    markers = [pytask.mark.mark1()]
+    task = Task(base_name="name", path=Path(), function=noop, markers=markers)
+    task.markers.append(pytask.mark.mark2())
+    assert markers == [pytask.mark.mark1()]
+
+    result = pickle.loads(pickle.dumps(task.markers))  # noqa: S301
+    assert isinstance(result, MarkerList)
+    assert result == task.markers
+    assert result.has_mark("mark2")
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import textwrap
+
+from pytask import ExitCode
+from pytask import cli
+
+
+def test_memoize_python_node_returns(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import PythonNode
+    from pytask import Product
+    from pytask import task
+
+    node = PythonNode(name="node", hash=True)
+
+
+    @task(cache=True)
+    def task_first(depends_on: Path = Path("in.txt")) -> Annotated[str, node]:
+        calls = Path(__file__).parent / "calls.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+        return depends_on.read_text()
+
+
+    def task_second(
+        value: Annotated[str, node], path: Annotated[Path, Product] = Path("out.txt")
+    ) -> None:
+        path.write_text(value)
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("Hello")
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == "."
+    assert len(list(tmp_path.joinpath(".pytask", "memoize", "entries").iterdir())) == 1
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == "."
+
+    tmp_path.joinpath("out.txt").unlink()
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == "."
+    assert tmp_path.joinpath("out.txt").read_text() == "Hello"
+
+    tmp_path.joinpath("in.txt").write_text("World")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == ".."
+    assert tmp_path.joinpath("out.txt").read_text() == "World"
+    objects = [
+        p
+        for p in tmp_path.joinpath(".pytask", "memoize", "objects").rglob("*")
+        if p.is_file()
+    ]
+    assert len(objects) == 1
+
+
+def test_unpicklable_returns_are_not_memoized(runner, tmp_path):
+    source = """
+    import threading
+    from typing import Annotated
+
+    from pytask import PythonNode
+    from pytask import task
+
+
+    @task(cache=True)
+    def task_example() -> Annotated[object, PythonNode(name="lock")]:
+        return threading.Lock()
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert "cannot be pickled" in result.output
+    assert not tmp_path.joinpath(".pytask", "memoize", "entries").exists()
+
+
+def test_memoized_task_depends_on_value_of_unhashed_python_node(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import PythonNode
+    from pytask import Product
+    from pytask import task
+
+    node = PythonNode(name="node")
+    result = PythonNode(name="result", hash=True)
+
+
+    def task_first(path: Path = Path("in.txt")) -> Annotated[str, node]:
+        return path.read_text()
+
+
+    @task(cache=True)
+    def task_second(value: Annotated[str, node]) -> Annotated[str, result]:
+        calls = Path(__file__).parent / "calls.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+        return value
+
+
+    def task_third(
+        value: Annotated[str, result], path: Annotated[Path, Product] = Path("out.txt")
+    ) -> None:
+        path.write_text(value)
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("Hello")
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == "."
+
+    tmp_path.joinpath("in.txt").write_text("World")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == ".."
+    assert tmp_path.joinpath("out.txt").read_text() == "World"
+
+
+def test_chained_memoized_tasks_are_not_executed_again(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import PythonNode
+    from pytask import Product
+    from pytask import task
+
+    first = PythonNode(name="first")
+    second = PythonNode(name="second", hash=True)
+
+
+    def _count(name):
+        calls = Path(__file__).parent / f"calls_{name}.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+
+
+    @task(cache=True)
+    def task_first(path: Path = Path("in.txt")) -> Annotated[str, first]:
+        _count("first")
+        return path.read_text()
+
+
+    @task(cache=True)
+    def task_second(value: Annotated[str, first]) -> Annotated[str, second]:
+        _count("second")
+        return value + "!"
+
+
+    def task_third(
+        value: Annotated[str, second], path: Annotated[Path, Product] = Path("out.txt")
+    ) -> None:
+        path.write_text(value)
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("Hello")
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+
+    tmp_path.joinpath("out.txt").unlink()
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls_first.txt").read_text() == "."
+    assert tmp_path.joinpath("calls_second.txt").read_text() == "."
+    assert tmp_path.joinpath("out.txt").read_text() == "Hello!"
+
+    tmp_path.joinpath("in.txt").write_text("World")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls_first.txt").read_text() == ".."
+    assert tmp_path.joinpath("calls_second.txt").read_text() == ".."
+    assert tmp_path.joinpath("out.txt").read_text() == "World!"
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from _pytask.dag import _create_dag_from_tasks
+from _pytask.memory import ValueSpiller
+from _pytask.memory import estimate_size
+from _pytask.memory import format_size
+from _pytask.nodes import LazyValue
+from _pytask.typing import no_default
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+from pytask import ExitCode
+from pytask import NodeInfo
+from pytask import PythonNode
+from pytask import Task
+from pytask import build
+from pytask import cli
+
+_SOURCE = """
+from pytask import PythonNode
+from typing import Annotated
+
+node_input = PythonNode(name="input", value=1)
+node_first = PythonNode(name="first")
+node_second = PythonNode(name="second")
+
+def task_first(value: Annotated[int, node_input]) -> Annotated[int, node_first]:
+    return value + 1
+
+def task_second(value: Annotated[int, node_first]) -> Annotated[int, node_second]:
+    return value + 1
+"""
+
+
+def _get_values(session):
+    values = {}
+    for node in session.dag.nodes.values():
+        if isinstance(node, PythonNode):
+            values.setdefault(node.name, []).append(node.load())
+    return values
+
+
+@pytest.mark.parametrize(
+    ("keep_values", "expected"),
+    [
+        (False, {"input": [1], "first": [no_default, no_default], "second": [3]}),
+        (True, {"input": [1], "first": [2, 2], "second": [3]}),
+    ],
+)
+def test_release_values_after_last_dependent_task(tmp_path, keep_values, expected):
+    tmp_path.joinpath("task_module.py").write_text(_SOURCE)
+
+    session = build(paths=tmp_path, keep_values=keep_values)
+
+    assert session.exit_code == ExitCode.OK
+    assert _get_values(session) == expected
+
+
+def test_keep_values_until_all_dependent_tasks_are_processed(tmp_path):
+    source = """
+    from pytask import PythonNode
+    from typing import Annotated
+
+    node = PythonNode(name="first")
+
+    def task_first() -> Annotated[int, node]:
+        return 1
+
+    def task_second(value: Annotated[int, node]) -> None:
+        assert value == 1
+
+    def task_third(value: Annotated[int, node]) -> None:
+        assert value == 1
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert _get_values(session)["first"] == [no_default] * 3
+
+
+def _create_nodes(values):
+    return [
+        PythonNode(
+            name=str(i),
+            value=value,
+            node_info=NodeInfo(
+                arg_name=str(i), path=(), value=None, task_path=None, task_name=""
+            ),
+        )
+        for i, value in enumerate(values)
+    ]
+
+
+def _create_task(tmp_path, depends_on, produces):
+    return Task(
+        base_name="task_example",
+        path=tmp_path / "task_example.py",
+        function=lambda: None,
+        depends_on=depends_on,
+        produces=produces,
+    )
+
+
+def test_spill_least_recently_used_values(tmp_path):
+    nodes = _create_nodes([b"x" * 1_000] * 4)
+    task = _create_task(
+        tmp_path, {"input": nodes[0]}, {"1": nodes[1], "2": nodes[2], "3": nodes[3]}
+    )
+    dag = _create_dag_from_tasks([task])
+    spiller = ValueSpiller(path=tmp_path, max_size=2_500)
+
+    spiller.task_done(dag, task)
+
+    # Values of nodes which are not products are not spilled.
+    assert nodes[0].value == b"x" * 1_000
+    assert isinstance(nodes[1].value, LazyValue)
+    assert not isinstance(nodes[2].value, LazyValue)
+    assert spiller.size == estimate_size(b"x" * 1_000) * 2
+    assert nodes[1].state() == "0"
+    assert nodes[1].load() == b"x" * 1_000
+
+    spiller.discard(nodes[1].signature)
+    assert not list(tmp_path.glob("*.pickle"))
+
+
+def test_unpicklable_values_are_not_spilled_but_counted(tmp_path):
+    unpicklable = threading.Lock()
+    nodes = _create_nodes([unpicklable, b"x" * 1_000, b"x" * 1_000])
+    task = _create_task(tmp_path, {}, {str(i): node for i, node in enumerate(nodes)})
+    dag = _create_dag_from_tasks([task])
+    max_size = estimate_size(unpicklable) + estimate_size(b"x" * 1_000)
+    spiller = ValueSpiller(path=tmp_path, max_size=max_size)
+
+    spiller.task_done(dag, task)
+
+    assert nodes[0].value is unpicklable
+    assert isinstance(nodes[1].value, LazyValue)
+    assert not isinstance(nodes[2].value, LazyValue)
+    assert spiller.size == max_size
+
+
+def test_spill_values_in_build(tmp_path):
+    source = """
+    from pytask import PythonNode
+    from pytask import task
+    from typing import Annotated
+
+    nodes = [PythonNode(name=f"node_{i}") for i in range(4)]
+
+    def task_0() -> Annotated[list[int], nodes[0]]:
+        return list(range(1_000))
+
+    for i in range(1, 4):
+
+        @task
+        def task_next(
+            value: Annotated[list[int], nodes[i - 1]]
+        ) -> Annotated[list[int], nodes[i]]:
+            return [x + 1 for x in value]
+
+    def task_sum(
+        first: Annotated[list[int], nodes[0]], last: Annotated[list[int], nodes[3]]
+    ) -> Annotated[int, PythonNode(name="result")]:
+        return sum(last) - sum(first)
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path, max_in_memory_bytes="10KB")
+
+    assert session.exit_code == ExitCode.OK
+    assert _get_values(session)["result"] == [3_000]
+    assert not any(tmp_path.joinpath(".pytask", "spill").iterdir())
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (b"x" * 1_000, sys.getsizeof(b"x" * 1_000)),
+        ([b"x" * 1_000], sys.getsizeof([b""]) + sys.getsizeof(b"x" * 1_000)),
+        (
+            {"a": b"x" * 1_000},
+            sys.getsizeof({"a": b""})
+            + sys.getsizeof("a")
+            + sys.getsizeof(b"x" * 1_000),
+        ),
+    ],
+)
+def test_estimate_size(value, expected):
+    assert estimate_size(value) == expected
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed.")
+def test_estimate_size_of_array():
+    assert estimate_size(np.zeros(1_000)) == 8_000
+
+
+def test_report_peak_memory(runner, tmp_path):
+    tmp_path.joinpath("task_module.py").write_text("def task_example(): ...")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "Peak memory:" in result.output
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [(0, "0 B"), (999, "999 B"), (1_000, "1.0 KB"), (2_500_000_000, "2.5 GB")],
+)
+def test_format_size(size, expected):
+    assert format_size(size) == expected
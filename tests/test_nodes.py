@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import pickle
+import subprocess
 import sys
+import threading
 from pathlib import Path
 from typing import cast
 
@@ -10,7 +13,10 @@ import cloudpickle
 import pytest
 import upath
 
+from _pytask.nodes import LazyValue
+from _pytask.nodes import get_state_of_arguments
 from pytask import NodeInfo
+from pytask import NumpyNode
 from pytask import PathNode
 from pytask import PickleNode
 from pytask import PNode
@@ -18,6 +24,12 @@ from pytask import PPathNode
 from pytask import PythonNode
 from pytask import Task
 from pytask import TaskWithoutPath
+from pytask import get_state_of_function
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 
 @pytest.mark.parametrize(
@@ -36,6 +48,19 @@ def test_hash_of_python_node(value, hash_, expected):
     assert state == expected
 
 
+def test_python_node_with_lazy_value():
+    calls = []
+    lazy_value = LazyValue(loader=lambda: calls.append(1) or "value", state="state")
+    node = PythonNode(name="test", value=lazy_value, hash=True)
+    wrapper = PythonNode(name="test", value=node, hash=True)
+
+    assert node.state() == wrapper.state() == "state"
+    assert not calls
+    assert wrapper.load() == "value"
+    assert node.load() == "value"
+    assert calls == [1]
+
+
 @pytest.mark.parametrize(
     ("node", "expected"),
     [
@@ -121,6 +146,131 @@ def test_hash_of_pickle_node(tmp_path, value, exists, expected):
         assert state is expected
 
 
+def test_state_of_numpy_node_is_stat_fingerprint(tmp_path):
+    path = tmp_path.joinpath("array.npy")
+    node = NumpyNode(name="test", path=path)
+    assert node.state() is None
+
+    path.write_bytes(b"data")
+    stat = path.stat()
+
+    assert node.state() == f"4-{stat.st_mtime_ns}"
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed.")
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_save_and_load_numpy_node(tmp_path, mmap_mode):
+    node = NumpyNode(name="test", path=tmp_path / "array.npy", mmap_mode=mmap_mode)
+    array = np.arange(10.0)
+
+    node.save(array)
+    loaded = node.load()
+
+    np.testing.assert_array_equal(loaded, array)
+    assert isinstance(loaded, np.memmap) is (mmap_mode is not None)
+    if mmap_mode == "r":
+        with pytest.raises(ValueError, match="read-only"):
+            loaded[0] = 1.0
+    assert node.load(is_product=True) is node
+
+
+@pytest.mark.parametrize(
+    ("path", "mmap_mode", "expected"),
+    [
+        (Path("array.npy"), "r", True),
+        (Path("array.npy"), "r+", False),
+        (Path("array.npy"), None, False),
+        (upath.UPath("s3://bucket/array.npy"), "r", False),
+    ],
+)
+def test_numpy_node_shares_only_read_only_local_arrays(path, mmap_mode, expected):
+    node = NumpyNode(name="test", path=path, mmap_mode=mmap_mode)
+    assert node.share_value is expected
+
+
+@pytest.mark.parametrize(
+    ("compression", "magic"),
+    [(None, b"\x80"), ("gzip", b"\x1f\x8b"), ("bz2", b"BZh"), ("lzma", b"\xfd7zXZ")],
+)
+@pytest.mark.parametrize("compression_level", [None, 1])
+def test_save_and_load_compressed_pickle_node(
+    tmp_path, compression, magic, compression_level
+):
+    node = PickleNode(
+        name="test",
+        path=tmp_path / "data.pkl",
+        compression=compression,
+        compression_level=compression_level,
+    )
+    node.save({"a": list(range(100))})
+
+    assert node.path.read_bytes().startswith(magic)
+    assert node.load() == {"a": list(range(100))}
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_save_and_load_pickle_node_with_out_of_band_buffers(tmp_path, compression):
+    node = PickleNode(
+        name="test",
+        path=tmp_path / "data.pkl",
+        compression=compression,
+        out_of_band=True,
+    )
+    node.save([pickle.PickleBuffer(b"x" * 10), pickle.PickleBuffer(b"y" * 100)])
+
+    assert tmp_path.joinpath("data.pkl.buffers").exists()
+    first, second = node.load()
+    assert bytes(first) == b"x" * 10
+    assert bytes(second) == b"y" * 100
+    assert first.readonly
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed.")
+def test_out_of_band_arrays_of_pickle_node_are_memory_mapped(tmp_path):
+    node = PickleNode(name="test", path=tmp_path / "data.pkl", out_of_band=True)
+    arrays = {"a": np.arange(3.0), "b": np.arange(100)}
+    node.save(arrays)
+
+    assert node.path.stat().st_size < 1_000
+    loaded = node.load()
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded[name], array)
+        assert not loaded[name].flags.writeable
+        assert loaded[name].ctypes.data % 64 == 0
+
+
+def test_state_of_pickle_node_with_out_of_band_buffers(tmp_path):
+    node = PickleNode(name="test", path=tmp_path / "data.pkl", out_of_band=True)
+    assert node.state() is None
+
+    node.save(pickle.PickleBuffer(b"data"))
+    state = node.state()
+    assert state is not None
+
+    tmp_path.joinpath("data.pkl.buffers").unlink()
+    assert node.state() is None
+
+
+def test_invalid_options_of_pickle_node():
+    with pytest.raises(ValueError, match="'compression' must be one of"):
+        PickleNode(path=Path("data.pkl"), compression="zstd")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="requires the default serializer"):
+        PickleNode(path=Path("data.pkl"), serializer=cloudpickle.dump, out_of_band=True)
+
+
+def test_unpickle_pickle_node_from_state_without_options():
+    node = PickleNode.__new__(PickleNode)
+    state = {
+        "path": Path("file.pkl"),
+        "name": "name",
+        "attributes": {},
+        "serializer": pickle.dump,
+        "deserializer": pickle.load,
+    }
+    node.__setstate__((None, state))
+    assert node == PickleNode(name="name", path=Path("file.pkl"))
+
+
 @pytest.mark.parametrize("node_cls", [PathNode, PickleNode])
 def test_signature_of_remote_upath_node(node_cls):
     node = node_cls(name="test", path=cast("Path", upath.UPath("s3://bucket/file.pkl")))
@@ -196,3 +346,90 @@ def test_custom_serializer_deserializer_pickle_node(tmp_path):
     # Test loading with custom deserializer
     loaded_data = node.load(is_product=False)
     assert loaded_data == test_data
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        pytest.param(PathNode(name="name", path=Path("file.txt")), id="PathNode"),
+        pytest.param(PickleNode(name="name", path=Path("file.pkl")), id="PickleNode"),
+        pytest.param(PythonNode(name="name", value=1), id="PythonNode"),
+        pytest.param(
+            Task(base_name="name", path=Path("task_example.py"), function=print),
+            id="Task",
+        ),
+    ],
+)
+def test_nodes_and_tasks_are_compact(node):
+    assert not hasattr(node, "__dict__")
+    assert node.name is sys.intern(node.name)
+
+    with pytest.raises(AttributeError):
+        object.__getattribute__(node, "attributes")
+    assert node.attributes == {}
+    node.attributes["key"] = "value"
+    assert node.attributes == {"key": "value"}
+
+    unpickled = pickle.loads(pickle.dumps(node))  # noqa: S301
+    assert unpickled.attributes == {"key": "value"}
+
+
+def test_unpickle_node_from_state_without_slots():
+    node = PathNode.__new__(PathNode)
+    node.__setstate__({"name": "name", "path": Path("file.txt"), "attributes": {}})
+    assert node == PathNode(name="name", path=Path("file.txt"))
+
+
+def test_state_of_task_from_function():
+    def task_example():
+        pass
+
+    task = Task(base_name="task_example", path=Path(__file__), function=task_example)
+    assert task.state() != get_state_of_function(task_example)
+
+    task.attributes["task_state"] = "function"
+    assert task.state() == get_state_of_function(task_example)
+    assert task.state().startswith("function:")
+    assert get_state_of_function(print) is None
+
+
+def test_state_of_arguments_is_independent_of_hash_seed():
+    code = (
+        "from pathlib import Path; "
+        "from _pytask.nodes import get_state_of_arguments; "
+        "print(get_state_of_arguments("
+        "{'cols': {'a', 'b', 'c'}, 'path': Path('a.txt'), 'items': frozenset('xyz')}"
+        "))"
+    )
+    states = {
+        subprocess.run(
+            (sys.executable, "-c", code),
+            capture_output=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            text=True,
+        ).stdout.strip()
+        for seed in ("1", "2", "3")
+    }
+    assert len(states) == 1
+    assert states.pop() != "None"
+
+
+@pytest.mark.parametrize(
+    ("arguments", "expected"),
+    [
+        pytest.param({"a": {1, 2}}, {"a": {2, 1}}, id="sets"),
+        pytest.param({"a": 1, "b": 2}, {"b": 2, "a": 1}, id="dicts"),
+        pytest.param(PathNode(path=Path("a")), PathNode(path=Path("a")), id="nodes"),
+    ],
+)
+def test_state_of_equal_arguments_is_equal(arguments, expected):
+    assert get_state_of_arguments(arguments) == get_state_of_arguments(expected)
+    assert get_state_of_arguments(arguments) != get_state_of_arguments([arguments])
+
+
+def test_state_of_arguments_which_cannot_be_encoded():
+    recursive: list[object] = []
+    recursive.append(recursive)
+    assert get_state_of_arguments(threading.Lock()) is None
+    assert get_state_of_arguments(recursive) is None
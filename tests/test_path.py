@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
+import os
 import sys
 import textwrap
 from contextlib import ExitStack as does_not_raise  # noqa: N813
@@ -15,6 +16,7 @@ from typing import Any
 import pytest
 import upath
 
+from _pytask.path import DirectoryListingCache
 from _pytask.path import _insert_missing_modules
 from _pytask.path import _module_name_from_path
 from _pytask.path import find_case_sensitive_path
@@ -164,6 +166,96 @@ def test_find_case_sensitive_path(tmp_path, path, existing_paths, expected):
     assert result == tmp_path / expected
 
 
+def test_directory_listing_cache_scans_each_directory_once(tmp_path, monkeypatch):
+    tmp_path.joinpath("file.txt").touch()
+    tmp_path.joinpath("folder").mkdir()
+
+    cache = DirectoryListingCache()
+    scanned = []
+    original_scan = cache._scan
+    monkeypatch.setattr(cache, "_scan", lambda d: scanned.append(d) or original_scan(d))
+
+    with cache.activate():
+        assert not cache.is_dir(tmp_path / "file.txt")
+        assert cache.is_dir(tmp_path / "folder")
+        assert not cache.is_dir(tmp_path / "missing.txt")
+        assert not cache.is_dir(tmp_path / "missing" / "file.txt")
+        assert not cache.is_dir(tmp_path / "missing" / "other.txt")
+
+    assert scanned == [tmp_path, tmp_path / "missing"]
+    assert not cache._listings
+
+    # Without an active cache, the file system is queried directly.
+    tmp_path.joinpath("new_folder").mkdir()
+    assert cache.is_dir(tmp_path / "new_folder")
+    assert not cache._listings
+
+
+@pytest.mark.parametrize(
+    ("path", "existing_paths", "expected"),
+    [
+        pytest.param("text.txt", [], "text.txt", id="non-existing path stays the same"),
+        pytest.param("text.txt", ["text.txt"], "text.txt", id="existing path is same"),
+        pytest.param("Text.txt", ["text.txt"], "text.txt", id="correct path"),
+        pytest.param("d/Text.txt", ["d/text.txt"], "d/text.txt", id="in folder"),
+    ],
+)
+def test_directory_listing_cache_finds_case_sensitive_path(
+    tmp_path, path, existing_paths, expected
+):
+    for p in existing_paths:
+        p = tmp_path / p  # noqa: PLW2901
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.touch()
+
+    cache = DirectoryListingCache(case_sensitive=False)
+    with cache.activate():
+        result = cache.find_case_sensitive_path(tmp_path / path, "win32")
+    assert result == tmp_path.resolve() / expected
+
+
+def test_directory_listing_cache_resolves_each_directory_once(tmp_path, monkeypatch):
+    tmp_path.joinpath("a.txt").touch()
+    tmp_path.joinpath("b.txt").touch()
+    resolved = []
+    monkeypatch.setattr(
+        "_pytask.path.find_case_sensitive_path",
+        lambda path, platform: resolved.append(path) or path.resolve(),  # noqa: ARG005
+    )
+
+    cache = DirectoryListingCache(case_sensitive=False)
+    with cache.activate():
+        assert cache.find_case_sensitive_path(tmp_path / "A.txt", "win32") == (
+            tmp_path.resolve() / "a.txt"
+        )
+        assert cache.find_case_sensitive_path(tmp_path / "b.txt", "win32") == (
+            tmp_path.resolve() / "b.txt"
+        )
+
+    assert resolved == [tmp_path]
+    assert not cache._resolved_parents
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        Path("a/b/../c.txt"),
+        Path("a/./b/c.txt"),
+        Path("a/b/.."),
+        Path("/a/b/c.txt"),
+        Path("/"),
+        Path("c.txt"),
+    ],
+)
+def test_directory_listing_cache_normpath(path):
+    cache = DirectoryListingCache()
+    with cache.activate():
+        assert cache.normpath(path) == Path(os.path.normpath(path))
+        assert cache.normpath(path) == Path(os.path.normpath(path))
+    assert cache.normpath(path) == Path(os.path.normpath(path))
+    assert not cache._normalized_parents
+
+
 @pytest.fixture
 def simple_module(request, tmp_path: Path) -> Generator[Path, None, None]:
     name = f"mymod_{request.node.name}"
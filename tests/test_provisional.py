@@ -280,3 +280,50 @@ def test_root_dir_is_created(runner, tmp_path):
     assert result.exit_code == ExitCode.OK
     assert tmp_path.joinpath("subfolder", "a.txt").exists()
     assert tmp_path.joinpath("subfolder", "b.txt").exists()
+
+
+def test_replay_cached_task_generator(runner, tmp_path):
+    source = """
+    from typing import Annotated
+    from pytask import DirectoryNode, task
+    from pathlib import Path
+
+    @task(is_generator=True, cache=True)
+    def task_generator(paths = DirectoryNode(pattern="*.in")):
+        calls = Path(__file__).parent / "calls.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+        for path in paths:
+            suffix = "-copy.txt"
+
+            @task
+            def task_copy(
+                path: Path = path
+            ) -> Annotated[str, path.with_name(path.stem + suffix)]:
+                return path.read_text()
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("a.in").write_text("a")
+    tmp_path.joinpath("b.in").write_text("b")
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Succeeded" in result.output
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "3  Collected tasks" in result.output
+    assert "2  Skipped because unchanged" in result.output
+    assert tmp_path.joinpath("calls.txt").read_text() == "."
+
+    tmp_path.joinpath("b.in").write_text("B")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == ".."
+    assert tmp_path.joinpath("b-copy.txt").read_text() == "B"
+
+    tmp_path.joinpath("c.in").write_text("c")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert "4  Collected tasks" in result.output
+    assert tmp_path.joinpath("calls.txt").read_text() == "..."
+    assert tmp_path.joinpath("c-copy.txt").read_text() == "c"
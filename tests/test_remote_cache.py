@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import textwrap
+import threading
+
+import pytest
+
+from _pytask.artifact_cache import ArtifactCache
+from _pytask.remote_cache import RemoteCache
+from _pytask.remote_cache import _ConnectionPool
+from _pytask.remote_cache import create_cache_server
+from pytask import ExitCode
+from pytask import cli
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = create_cache_server(tmp_path / "remote")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def _write_project(path, url):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import Product
+
+
+    def task_example(
+        depends_on: Path = Path("in.txt"),
+        path: Annotated[Path, Product] = Path("out.txt"),
+    ) -> None:
+        calls = Path(__file__).parent / "calls.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+        path.write_text(depends_on.read_text())
+    """
+    path.mkdir()
+    path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    path.joinpath("in.txt").write_text("Hello")
+    path.joinpath("pyproject.toml").write_text(
+        f"[tool.pytask.ini_options]\ncache_url = {url!r}"
+    )
+
+
+def test_share_products_through_remote_cache(runner, tmp_path, server):
+    _write_project(tmp_path / "first", _url(server))
+    _write_project(tmp_path / "second", _url(server))
+
+    result = runner.invoke(cli, [tmp_path.joinpath("first").as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert len(list(tmp_path.joinpath("remote", "entries").iterdir())) == 1
+
+    result = runner.invoke(cli, [tmp_path.joinpath("second").as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert not tmp_path.joinpath("second", "calls.txt").exists()
+    assert tmp_path.joinpath("second", "out.txt").read_text() == "Hello"
+    assert tmp_path.joinpath("second", ".pytask", "artifacts", "entries").exists()
+
+
+def test_execute_tasks_if_remote_cache_is_unavailable(runner, tmp_path, server):
+    url = _url(server)
+    server.shutdown()
+    server.server_close()
+    _write_project(tmp_path / "project", url)
+
+    result = runner.invoke(cli, [tmp_path.joinpath("project").as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert "The remote cache" in result.output
+    assert tmp_path.joinpath("project", "calls.txt").read_text() == "."
+
+
+def test_server_protocol(server):
+    pool = _ConnectionPool(_url(server), size=1, timeout=5)
+    data = b"content"
+    digest = hashlib.sha256(data).hexdigest()
+
+    assert pool.request("GET", f"/objects/{digest}")[0] == http.client.NOT_FOUND
+    status, missing = pool.request("POST", "/objects/missing", json.dumps([digest]))
+    assert (status, json.loads(missing)) == (http.client.OK, [digest])
+    assert pool.request("PUT", f"/objects/{'0' * 64}", data)[0] == 400
+    assert pool.request("PUT", f"/objects/{digest}", data)[0] == http.client.CREATED
+    assert pool.request("GET", f"/objects/{digest}") == (http.client.OK, data)
+    status, missing = pool.request("POST", "/objects/missing", json.dumps([digest]))
+    assert json.loads(missing) == []
+    assert pool.request("GET", "/../secret")[0] == http.client.NOT_FOUND
+
+
+def test_remote_cache_rejects_unknown_schemes():
+    with pytest.raises(ValueError, match="http or https"):
+        RemoteCache("ftp://example.com")
+
+
+def test_objects_are_streamed_in_chunks(monkeypatch, tmp_path, server):
+    monkeypatch.setattr("_pytask.remote_cache._CHUNK_SIZE", 16)
+    cache = ArtifactCache(path=tmp_path / "local", root=tmp_path)
+    remote = RemoteCache(_url(server))
+    data = bytes(range(256)) * 3
+    digest = hashlib.sha256(data).hexdigest()
+    source = tmp_path / "source"
+    source.write_bytes(data)
+
+    remote._upload_file(f"/objects/{digest}", source)
+    assert remote._download_object(cache, digest)
+    remote.close()
+
+    assert (
+        tmp_path.joinpath("remote").joinpath("objects", digest[:2], digest).read_bytes()
+        == data
+    )
+    assert cache.object_path(digest).read_bytes() == data
+    assert list(cache.object_path(digest).parent.iterdir()) == [
+        cache.object_path(digest)
+    ]
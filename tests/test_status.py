@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import os
+import textwrap
+
+from _pytask.path import HashPathCache
+from pytask import ExitCode
+from pytask import cli
+
+
+def _write_chain_project(tmp_path):
+    source = """
+    from pathlib import Path
+
+    import pytask
+
+
+    def task_upstream(depends_on=Path("in.txt"), produces=Path("up.txt")):
+        produces.write_text(depends_on.read_text())
+
+
+    def task_downstream(depends_on=Path("up.txt"), produces=Path("down.txt")):
+        produces.write_text(depends_on.read_text())
+
+
+    def task_other(produces=Path("other.txt")):
+        produces.write_text("other")
+
+
+    @pytask.mark.skip
+    def task_skipped(produces=Path("skipped.txt")):
+        produces.write_text("skipped")
+
+
+    def task_after_skipped(
+        depends_on=Path("skipped.txt"), produces=Path("after_skipped.txt")
+    ):
+        produces.write_text(depends_on.read_text())
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("in")
+
+
+def _outcomes(result):
+    tasks = json.loads(result.stdout)["tasks"]
+    return {task["id"].rsplit("::", 1)[1]: task for task in tasks}
+
+
+def test_status_reports_first_run_without_lockfile(runner, tmp_path):
+    _write_chain_project(tmp_path)
+
+    result = runner.invoke(cli, ["status", "--json", tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    outcomes = _outcomes(result)
+    assert outcomes["task_upstream"]["outcome"] == "would_be_executed"
+    assert outcomes["task_upstream"]["reasons"] == [
+        {
+            "node": "task_module.py::task_upstream",
+            "node_type": "task",
+            "reason": "first_run",
+        }
+    ]
+    assert outcomes["task_skipped"]["outcome"] == "skip"
+    assert outcomes["task_after_skipped"]["outcome"] == "skip"
+    assert not tmp_path.joinpath("pytask.lock").exists()
+    assert not tmp_path.joinpath("up.txt").exists()
+
+
+def test_status_reports_changes_and_cascades(runner, tmp_path):
+    _write_chain_project(tmp_path)
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+
+    result = runner.invoke(cli, ["status", "--json", "--check", tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+    assert {task["outcome"] for task in _outcomes(result).values()} == {
+        "skip",
+        "skip_unchanged",
+    }
+
+    path = tmp_path.joinpath("in.txt")
+    path.write_text("changed")
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 1))
+
+    result = runner.invoke(cli, ["status", "--json", "--check", tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.FAILED
+    outcomes = _outcomes(result)
+    (reason,) = outcomes["task_upstream"]["reasons"]
+    assert reason["node"].endswith("in.txt")
+    assert (reason["node_type"], reason["reason"]) == ("dependency", "changed")
+    assert outcomes["task_downstream"]["outcome"] == "would_be_executed"
+    assert outcomes["task_downstream"]["reasons"] == [
+        {
+            "node": "task_module.py::task_upstream",
+            "node_type": "task",
+            "reason": "cascade",
+        }
+    ]
+    assert outcomes["task_other"]["outcome"] == "skip_unchanged"
+
+
+def test_status_prints_human_readable_summary(runner, tmp_path):
+    _write_chain_project(tmp_path)
+    runner.invoke(cli, [tmp_path.as_posix()])
+    tmp_path.joinpath("task_module.py").write_text(
+        tmp_path.joinpath("task_module.py").read_text() + "\n# Change the module.\n"
+    )
+
+    result = runner.invoke(cli, ["status", "-k", "other", tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert "Would be executed" in result.output
+    assert "task_module.py::task_other: Changed" in result.output
+    assert "task_downstream" not in result.output
+    assert "1 task: 1 would be executed." in result.output
+
+
+def test_status_does_not_hash_files_with_unchanged_modification_time(
+    runner, tmp_path, monkeypatch
+):
+    _write_chain_project(tmp_path)
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+
+    # Hashes are only taken from the cache of file hashes in ``.pytask``.
+    monkeypatch.setattr(HashPathCache, "_cache", {})
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr("_pytask.path.file_digest", _fail)
+
+    result = runner.invoke(cli, ["status", "--json", "--check", tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+
+
+def test_status_with_python_node_passed_between_tasks(runner, tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import PythonNode
+    from pytask import Product
+
+    node = PythonNode(name="node", hash=True)
+
+
+    def task_first(path: Path = Path("in.txt")) -> Annotated[str, node]:
+        return path.read_text()
+
+
+    def task_second(
+        value: Annotated[str, node], path: Annotated[Path, Product] = Path("out.txt")
+    ) -> None:
+        path.write_text(value)
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("in.txt").write_text("in")
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+    assert result.exit_code == ExitCode.OK
+
+    path = tmp_path.joinpath("in.txt")
+    path.write_text("changed")
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 1))
+
+    result = runner.invoke(cli, ["status", "--json", tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    outcomes = _outcomes(result)
+    assert outcomes["task_first"]["outcome"] == "would_be_executed"
+    assert outcomes["task_second"]["outcome"] == "would_be_executed"
+    assert {
+        "node": "task_module.py::task_first",
+        "node_type": "task",
+        "reason": "cascade",
+    } in outcomes["task_second"]["reasons"]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import textwrap
+from pathlib import Path  # noqa: TC003
 from typing import Annotated
 
 import pytest
 
 from pytask import ExitCode
+from pytask import Product
 from pytask import build
 from pytask import cli
+from pytask import expand
 from pytask import task
 
 
@@ -726,3 +729,130 @@ def test_task_function_in_another_module(runner, tmp_path):
     result = runner.invoke(cli, [tmp_path.as_posix()])
     assert result.exit_code == ExitCode.COLLECTION_FAILED
     assert "1  Failed" in result.output
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        '[{"i": 0, "path": Path("out_0.txt")}, {"i": 1, "path": Path("out_1.txt")}]',
+        '{"i": [0, 1], "path": [Path("out_0.txt"), Path("out_1.txt")]}',
+    ],
+)
+def test_expand_task_over_table(tmp_path, table):
+    source = f"""
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import Product
+    from pytask import expand
+
+    def task_example(i: int, path: Annotated[Path, Product]) -> None:
+        path.write_text(str(i))
+
+    expand(task_example, {table})
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert len(session.tasks) == 2
+    assert session.tasks[0].name.endswith("task_module.py::task_example[0-path0]")
+    assert session.tasks[1].name.endswith("task_module.py::task_example[1-path1]")
+    assert tmp_path.joinpath("out_1.txt").read_text() == "1"
+
+
+def test_expand_task_with_ids_and_marks(tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    import pytask
+    from pytask import Product
+    from pytask import expand
+
+    @pytask.mark.skip
+    def func(path: Annotated[Path, Product]) -> None:
+        path.touch()
+
+    expand(
+        func,
+        [{"path": Path("a.txt")}, {"path": Path("b.txt")}],
+        name="create",
+        ids=lambda row: row["path"].stem,
+    )
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert [task.name.rsplit("::")[-1] for task in session.tasks] == [
+        "create[a]",
+        "create[b]",
+    ]
+    assert all(task.markers[0].name == "skip" for task in session.tasks)
+    assert not tmp_path.joinpath("a.txt").exists()
+
+
+def test_expand_task_decorated_function(tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import Product
+    from pytask import expand
+    from pytask import task
+
+    @task
+    def task_example(i: int = 0, path: Annotated[Path, Product] = Path("out.txt")):
+        path.write_text(str(i))
+
+    expand(task_example, {"i": [1, 2], "path": [Path("a.txt"), Path("b.txt")]})
+    """
+    tmp_path.joinpath("task_module.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert len(session.tasks) == 2
+    assert tmp_path.joinpath("b.txt").read_text() == "2"
+    assert not tmp_path.joinpath("out.txt").exists()
+
+
+def test_expand_task_with_programmatic_interface(tmp_path):
+    def func(path: Annotated[Path, Product]) -> None:
+        path.touch()
+
+    tasks = expand(func, {"path": [tmp_path / "a.txt", tmp_path / "b.txt"]})
+
+    session = build(tasks=tasks, paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert len(session.tasks) == 2
+    assert tmp_path.joinpath("b.txt").exists()
+
+
+def test_many_tasks_share_the_same_after_expression(tmp_path):
+    source = """
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import task
+
+    for i in range(3):
+
+        @task(after="task_first", id=str(i))
+        def task_second():
+            assert Path(__file__).parent.joinpath("out.txt").exists()
+
+    def task_first() -> Annotated[str, Path("out.txt")]:
+        return "Hello, World!"
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+
+    session = build(paths=tmp_path)
+
+    assert session.exit_code == ExitCode.OK
+    assert len(session.execution_reports) == 4
+    assert session.execution_reports[0].task.name.endswith("task_first")
@@ -10,10 +10,13 @@ from uuid import UUID
 import pytest
 
 from _pytask.task_utils import COLLECTED_TASKS
+from _pytask.task_utils import EXPANDED_FUNCTIONS
 from _pytask.task_utils import _arg_value_to_id_component
 from _pytask.task_utils import _parse_name
 from _pytask.task_utils import _parse_task_kwargs
+from _pytask.task_utils import expand
 from pytask import Mark
+from pytask import has_mark
 from pytask import task
 
 
@@ -114,3 +117,73 @@ def test_parse_name(func, name, expectation, expected):
     with expectation:
         result = _parse_name(func, name)
         assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("table", "ids", "expectation", "expected"),
+    [
+        ([{"a": 1}, {"a": 2}], None, does_not_raise(), [None, None]),
+        ({"a": [1, 2]}, ["x", "y"], does_not_raise(), ["x", "y"]),
+        ({"a": [1, 2]}, lambda row: str(row["a"]), does_not_raise(), ["1", "2"]),
+        ({"a": [1, 2], "b": [1]}, None, pytest.raises(ValueError, match="equal"), None),
+        ([1, 2], None, pytest.raises(TypeError, match="sequence of"), None),
+        ({"a": [1, 2]}, ["x"], pytest.raises(ValueError, match="'ids' has 1"), None),
+        ({"a": [1]}, [1], pytest.raises(TypeError, match="must be strings"), None),
+    ],
+)
+def test_expand(table, ids, expectation, expected):
+    def func(a):
+        return a
+
+    with expectation:
+        tasks = expand(func, table, ids=ids)
+        assert [task.pytask_meta.id_ for task in tasks] == expected
+        assert [task.pytask_meta.kwargs["a"] for task in tasks] == [1, 2]
+        assert not has_mark(func, "task")
+        assert func in EXPANDED_FUNCTIONS[Path(__file__)]
+        assert all(task.__signature__ is tasks[0].__signature__ for task in tasks)
+        assert all(task in COLLECTED_TASKS[Path(__file__)] for task in tasks)
+
+    COLLECTED_TASKS.clear()
+    EXPANDED_FUNCTIONS.clear()
+
+
+def test_expand_partial():
+    def func(a, b):
+        return a + b
+
+    tasks = expand(partial(func, b=1), [{"a": 1}, {"a": 2}])
+
+    assert [task(**task.pytask_meta.kwargs) for task in tasks] == [2, 3]
+    COLLECTED_TASKS.clear()
+    EXPANDED_FUNCTIONS.clear()
+
+
+def test_expand_task_decorated_function():
+    @task(name="original")
+    def func(a):
+        return a
+
+    meta = func.pytask_meta
+    markers = list(meta.markers)
+
+    tasks = expand(func, [{"a": 1}, {"a": 2}])
+
+    assert func.pytask_meta is meta
+    assert func.pytask_meta.markers == markers
+    assert COLLECTED_TASKS[Path(__file__)] == tasks
+    assert all(task.pytask_meta.name == "original" for task in tasks)
+    COLLECTED_TASKS.clear()
+    EXPANDED_FUNCTIONS.clear()
+
+
+def test_expand_overrides_name_of_task_decorated_function():
+    @task(name="original")
+    def func(a):
+        return a
+
+    tasks = expand(func, [{"a": 1}, {"a": 2}], name="new")
+
+    assert all(task.pytask_meta.name == "new" for task in tasks)
+    COLLECTED_TASKS.clear()
+    EXPANDED_FUNCTIONS.clear()
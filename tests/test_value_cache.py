@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pickle
+import textwrap
+
+import pytest
+
+from _pytask.value_cache import ValueCache
+from pytask import ExitCode
+from pytask import PickleNode
+from pytask import cli
+
+
+@pytest.fixture
+def counting_node(tmp_path):
+    calls = []
+
+    def deserializer(f):
+        calls.append(None)
+        return pickle.load(f)  # noqa: S301
+
+    node = PickleNode(
+        name="node",
+        path=tmp_path / "data.pkl",
+        deserializer=deserializer,
+        share_value=True,
+    )
+    node.save([1, 2, 3])
+    return node, calls
+
+
+def test_load_shared_value_once(counting_node):
+    node, calls = counting_node
+    cache = ValueCache(max_size=1_000)
+
+    first = cache.load(node)
+    second = cache.load(node)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_load_value_again_if_state_changes(counting_node):
+    node, calls = counting_node
+    cache = ValueCache(max_size=1_000)
+    cache.load(node)
+
+    node.save([4, 5, 6])
+
+    assert cache.load(node) == [4, 5, 6]
+    assert len(calls) == 2
+    assert len(cache._entries) == 1
+
+
+def test_do_not_cache_values_which_are_not_shared(tmp_path):
+    node = PickleNode(name="node", path=tmp_path / "data.pkl")
+    node.save([1, 2, 3])
+    cache = ValueCache(max_size=1_000)
+
+    assert cache.load(node) is not cache.load(node)
+    assert cache.size == 0
+
+
+def test_evict_least_recently_used_values(tmp_path):
+    nodes = [
+        PickleNode(name=str(i), path=tmp_path / f"{i}.pkl", share_value=True)
+        for i in range(3)
+    ]
+    for node in nodes:
+        node.save(b"x" * 100)
+    size = nodes[0].path.stat().st_size
+    cache = ValueCache(max_size=2 * size)
+
+    cache.load(nodes[0])
+    cache.load(nodes[1])
+    cache.load(nodes[0])
+    cache.load(nodes[2])
+
+    assert list(cache._entries) == [nodes[0].signature, nodes[2].signature]
+    assert cache.size == 2 * size
+
+
+def test_share_loaded_values_between_tasks(runner, tmp_path):
+    source = """
+    import pickle
+    from pathlib import Path
+    from typing import Annotated
+
+    from pytask import PickleNode
+    from pytask import Product
+
+    def deserializer(f):
+        calls = Path(__file__).parent / "calls.txt"
+        calls.write_text(calls.read_text() + "." if calls.exists() else ".")
+        return pickle.load(f)
+
+    node = PickleNode(
+        path=Path("data.pkl"), deserializer=deserializer, share_value=True
+    )
+
+    def task_create(node: Annotated[PickleNode, Product] = node) -> None:
+        node.save([1, 2, 3])
+
+    for i in range(3):
+
+        def task_use(
+            value: Annotated[list[int], node],
+            path: Annotated[Path, Product] = Path(f"out_{i}.txt"),
+        ) -> None:
+            path.write_text(str(sum(value)))
+    """
+    tmp_path.joinpath("task_example.py").write_text(textwrap.dedent(source))
+    tmp_path.joinpath("pyproject.toml").write_text(
+        "[tool.pytask.ini_options]\nvalue_cache_size = '1MB'"
+    )
+
+    result = runner.invoke(cli, [tmp_path.as_posix()])
+
+    assert result.exit_code == ExitCode.OK
+    assert tmp_path.joinpath("calls.txt").read_text() == "."
+    assert tmp_path.joinpath("out_2.txt").read_text() == "6"